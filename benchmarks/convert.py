@@ -0,0 +1,75 @@
+"""
+Throughput of :func:`convertFromQt` and :func:`convertToQt` on nested dataclasses.
+
+The benchmarked dataclass has *fields* integer fields with default values, one
+field with converter metadata, and nests the same structure *depth* times.
+
+.. code-block:: bash
+
+    python benchmarks/convert.py --fields 20 --depth 3
+
+"""
+
+import argparse
+import dataclasses
+import timeit
+
+from dawiq.delegate import convertFromQt, convertToQt
+
+
+def nestedDataclass(fields: int, depth: int):
+    dcls = None
+    for level in range(depth):
+        spec = [(f"f{i}", int, dataclasses.field(default=i)) for i in range(fields)]
+        spec.append(
+            (
+                "conv",
+                tuple,
+                dataclasses.field(
+                    default=(0,),
+                    metadata=dict(
+                        fromQt_converter=lambda x: (x,),
+                        toQt_converter=lambda x: x[0],
+                    ),
+                ),
+            )
+        )
+        if dcls is not None:
+            spec.append(("sub", dcls, dataclasses.field(default_factory=dcls)))
+        dcls = dataclasses.make_dataclass(f"Level{level}", spec)
+    return dcls
+
+
+def widgetData(fields: int, depth: int):
+    data = {f"f{i}": i for i in range(fields)}
+    data["conv"] = 1
+    if depth > 1:
+        data["sub"] = widgetData(fields, depth - 1)
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    dcls = nestedDataclass(args.fields, args.depth)
+    qtData = widgetData(args.fields, args.depth)
+    fieldData = convertFromQt(dcls, qtData)
+
+    cases = [
+        ("convertFromQt", lambda: convertFromQt(dcls, qtData)),
+        ("convertFromQt(ignoreMissing=False)", lambda: convertFromQt(dcls, {}, False)),
+        ("convertToQt", lambda: convertToQt(dcls, fieldData)),
+        ("convertToQt(ignoreMissing=False)", lambda: convertToQt(dcls, {}, False)),
+    ]
+    print(f"fields: {args.fields}, depth: {args.depth}")
+    for name, func in cases:
+        best = min(timeit.repeat(func, number=args.number, repeat=5))
+        print(f"{name:36} {best / args.number * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Import time of :mod:`dawiq` modules, measured in fresh interpreters.
+
+Each statement is run in a new Python process *repeat* times, and the median of
+wall time is reported. Interpreter startup time (``pass``) is reported as well
+for reference.
+
+.. code-block:: bash
+
+    python benchmarks/import_time.py --repeat 20
+
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = [
+    ("python", "pass"),
+    ("import dawiq.qt_compat", "import dawiq.qt_compat"),
+    ("qt_compat.QtCore", "from dawiq.qt_compat import QtCore"),
+    ("import dawiq", "import dawiq"),
+    ("dawiq.convertFromQt", "from dawiq import convertFromQt"),
+    ("dawiq.DataWidget", "from dawiq import DataWidget"),
+]
+
+
+def measure(statement: str, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--output", help="path to write the JSON result")
+    args = parser.parse_args()
+
+    results = []
+    for name, statement in STATEMENTS:
+        timings = measure(statement, args.repeat)
+        result = dict(case=name, min=min(timings), median=statistics.median(timings))
+        results.append(result)
+        print(f"{name:28} {result['median'] * 1e3:8.1f} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(dict(results=results), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
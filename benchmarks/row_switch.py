@@ -0,0 +1,72 @@
+"""
+Row-switch latency of :class:`DataclassMapper` on a large flat dataclass.
+
+Two model rows with different data are mapped to one data widget, and the
+current row is switched back and forth. Each switch runs
+``DataclassDelegate.setEditorData``, i.e. ``convertToQt``,
+``DataWidget.setDataValue`` and ``highlightEmptyField``.
+
+.. code-block:: bash
+
+    python benchmarks/row_switch.py --fields 500
+
+"""
+
+import argparse
+import dataclasses
+import os
+import statistics
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from dawiq.qt_compat import qt_api, QtGui, QtWidgets  # noqa: E402
+from dawiq import dataclass2Widget, DataclassDelegate, DataclassMapper  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--fields", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    fields = [(f"f{i}", int) for i in range(args.fields)]
+    dcls = dataclasses.make_dataclass("Bench", fields)
+
+    model = QtGui.QStandardItemModel()
+    for row in range(2):
+        item = QtGui.QStandardItem()
+        item.setData(dcls, role=DataclassDelegate.TypeRole)
+        data = {name: i + row for i, (name, _) in enumerate(fields)}
+        item.setData(data, role=DataclassDelegate.DataRole)
+        model.appendRow(item)
+
+    widget = dataclass2Widget(dcls)
+    delegate = DataclassDelegate()
+    mapper = DataclassMapper()
+    mapper.setItemDelegate(delegate)
+    mapper.setModel(model)
+    mapper.addMapping(widget, 0)
+    mapper.setCurrentIndex(0)
+
+    timings = []
+    for i in range(args.repeat):
+        start = time.perf_counter()
+        mapper.setCurrentIndex((i + 1) % 2)
+        timings.append(time.perf_counter() - start)
+    app.processEvents()
+
+    print(f"Qt binding: {qt_api.qt_binding}")
+    print(f"fields: {args.fields}, switches: {args.repeat}")
+    print(f"median: {statistics.median(timings) * 1e3:.2f} ms")
+    print(f"mean:   {statistics.mean(timings) * 1e3:.2f} ms")
+
+    mapper.clearMapping()
+    widget.deleteLater()
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
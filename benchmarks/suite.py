@@ -0,0 +1,239 @@
+"""
+Benchmark suite for widget construction, editing and delegate round-trips.
+
+Each case is run for every combination of *fields* (number of scalar fields per
+dataclass), *depth* (nesting level of dataclasses) and *tuple width* (number of
+items in the tuple field). Results are printed, and optionally written as JSON
+which can be compared with the result of other commit.
+
+.. code-block:: bash
+
+    python benchmarks/suite.py --fields 10 100 --depth 1 3 --output new.json
+    python benchmarks/suite.py --compare old.json new.json
+
+Qt binding is selected by :mod:`dawiq.qt_compat`, e.g. by ``DAWIQ_QT_API``
+environment variable. ``QT_QPA_PLATFORM`` defaults to ``offscreen``.
+
+"""
+
+import argparse
+import dataclasses
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Tuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from dawiq.qt_compat import qt_api, QtCore, QtGui, QtWidgets  # noqa: E402
+from dawiq import (  # noqa: E402
+    dataclass2Widget,
+    clearWidgetPlanCache,
+    convertFromQt,
+    convertToQt,
+    DataclassDelegate,
+)
+
+
+def benchDataclass(fields: int, depth: int, tupleWidth: int):
+    """Dataclass with int/float/str fields, a tuple field and nested dataclass."""
+    types = [int, float, str]
+    dcls = None
+    for level in range(depth):
+        spec = [(f"f{i}", types[i % 3]) for i in range(fields)]
+        if tupleWidth > 0:
+            spec.append(("tup", Tuple[(int,) * tupleWidth]))  # type: ignore
+        if dcls is not None:
+            spec.append(("sub", dcls))
+        dcls = dataclasses.make_dataclass(f"Level{level}", spec)
+    return dcls
+
+
+def benchData(fields: int, depth: int, tupleWidth: int, offset: int = 0):
+    """Data value of :func:`benchDataclass` widget."""
+    values = [offset, offset + 0.5, str(offset)]
+    data = {f"f{i}": values[i % 3] for i in range(fields)}
+    if tupleWidth > 0:
+        data["tup"] = tuple(range(offset, offset + tupleWidth))
+    if depth > 1:
+        data["sub"] = benchData(fields, depth - 1, tupleWidth, offset)
+    return data
+
+
+def deletePending():
+    """Delete the widgets scheduled by ``deleteLater()``."""
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete)
+
+
+def timeCase(func, number: int, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+        deletePending()
+    return timings
+
+
+def cases(fields: int, depth: int, tupleWidth: int):
+    """Yield the name and the function of each benchmark case."""
+    dcls = benchDataclass(fields, depth, tupleWidth)
+    data = [benchData(fields, depth, tupleWidth, i) for i in range(2)]
+    fieldData = convertFromQt(dcls, data[0])
+
+    def build():
+        clearWidgetPlanCache()
+        dataclass2Widget(dcls).deleteLater()
+
+    def buildCached():
+        dataclass2Widget(dcls).deleteLater()
+
+    yield "dataclass2Widget", build
+    yield "dataclass2Widget(cached)", buildCached
+
+    widget = dataclass2Widget(dcls)
+    toggle = itertools.cycle(data)
+    yield "DataWidget.setDataValue", lambda: widget.setDataValue(next(toggle))
+    yield "DataWidget.dataValue", widget.dataValue
+
+    yield "convertFromQt", lambda: convertFromQt(dcls, data[0])
+    yield "convertToQt", lambda: convertToQt(dcls, fieldData)
+
+    model = QtGui.QStandardItemModel()
+    for value in data:
+        item = QtGui.QStandardItem()
+        item.setData(dcls, role=DataclassDelegate.TypeRole)
+        item.setData(convertFromQt(dcls, value), role=DataclassDelegate.DataRole)
+        model.appendRow(item)
+    delegate = DataclassDelegate()
+    indices = itertools.cycle([model.index(0, 0), model.index(1, 0)])
+    yield "setEditorData", lambda: delegate.setEditorData(widget, next(indices))
+    yield "setModelData", lambda: delegate.setModelData(widget, model, next(indices))
+
+    widget.deleteLater()
+
+
+def gitRevision():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def run(args):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    results = []
+    for fields, depth, width in itertools.product(
+        args.fields, args.depth, args.tuple_width
+    ):
+        for name, func in cases(fields, depth, width):
+            func()  # warm up
+            timings = timeCase(func, args.number, args.repeat)
+            app.processEvents()
+            result = dict(
+                case=name,
+                fields=fields,
+                depth=depth,
+                tuple_width=width,
+                min=min(timings),
+                median=statistics.median(timings),
+            )
+            results.append(result)
+            print(
+                f"{name:28} fields={fields:<5} depth={depth:<2} tuple={width:<3}"
+                f" {result['median'] * 1e6:12.1f} us"
+            )
+        deletePending()
+
+    return dict(
+        meta=dict(
+            qt_binding=qt_api.qt_binding,
+            qt_version=QtCore.qVersion(),
+            python=sys.version.split()[0],
+            platform=platform.platform(),
+            revision=gitRevision(),
+            number=args.number,
+            repeat=args.repeat,
+        ),
+        results=results,
+    )
+
+
+def resultKey(result):
+    return (result["case"], result["fields"], result["depth"], result["tuple_width"])
+
+
+def compare(oldPath: str, newPath: str, threshold: float) -> int:
+    """Print the ratio of median times. Return the number of regressions."""
+    with open(oldPath) as f:
+        old = json.load(f)
+    with open(newPath) as f:
+        new = json.load(f)
+    oldResults = {resultKey(r): r for r in old["results"]}
+
+    print(f"old: {old['meta'].get('revision')} ({old['meta']['qt_binding']})")
+    print(f"new: {new['meta'].get('revision')} ({new['meta']['qt_binding']})")
+    regressions = 0
+    for result in new["results"]:
+        key = resultKey(result)
+        if key not in oldResults:
+            continue
+        ratio = result["median"] / oldResults[key]["median"]
+        mark = ""
+        if ratio > 1 + threshold:
+            mark = "  <-- slower"
+            regressions += 1
+        name, fields, depth, width = key
+        print(
+            f"{name:28} fields={fields:<5} depth={depth:<2} tuple={width:<3}"
+            f" {ratio:7.2f}x{mark}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--fields", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--depth", type=int, nargs="+", default=[1, 3])
+    parser.add_argument("--tuple-width", type=int, nargs="+", default=[2])
+    parser.add_argument("--number", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="path to write the JSON result")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("OLD", "NEW"),
+        help="compare two JSON results instead of running the benchmarks",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as regression in comparison",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        regressions = compare(*args.compare, args.threshold)
+        sys.exit(1 if regressions else 0)
+
+    result = run(args)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,54 +6,155 @@ DaWiQ is a package to build Qt widgets from dataclasses.
 
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .version import __version__  # noqa
 
+if TYPE_CHECKING:
+    from .fieldwidgets import (
+        RepolishScheduler,
+        BoolCheckBox,
+        EmptyIntValidator,
+        IntLineEdit,
+        EmptyFloatValidator,
+        FloatLineEdit,
+        StrLineEdit,
+        EnumItemModel,
+        EnumComboBox,
+        FieldWriteInfo,
+        TupleGroupBox,
+        SequenceItemModel,
+        SequenceItemDelegate,
+        SequenceGroupBox,
+        ArrayTableModel,
+        ArrayGroupBox,
+        MappingItemModel,
+        MappingGroupBox,
+    )
+    from .datawidget import (
+        DataWidget,
+        type2Widget,
+        dataclass2Widget,
+        WidgetPlanCacheInfo,
+        widgetPlanCacheInfo,
+        clearWidgetPlanCache,
+        setWidgetPlanCacheSize,
+        DataWidgetPoolInfo,
+        DataWidgetPool,
+    )
+    from .multitype import (
+        DataclassStackedWidget,
+        DataclassTabWidget,
+    )
+    from .model import (
+        DataclassTableModel,
+    )
+    from .converter import (
+        convertFromQt,
+        convertToQt,
+        convertManyFromQt,
+        convertManyToQt,
+    )
+    from .delegate import (
+        highlightEmptyField,
+        DataclassDelegate,
+        DataclassMapper,
+    )
 
-from .fieldwidgets import (
-    BoolCheckBox,
-    EmptyIntValidator,
-    IntLineEdit,
-    EmptyFloatValidator,
-    FloatLineEdit,
-    StrLineEdit,
-    EnumComboBox,
-    TupleGroupBox,
-)
-from .datawidget import (
-    DataWidget,
-    type2Widget,
-    dataclass2Widget,
-)
-from .multitype import (
-    DataclassStackedWidget,
-    DataclassTabWidget,
-)
-from .delegate import (
-    convertFromQt,
-    convertToQt,
-    highlightEmptyField,
-    DataclassDelegate,
-    DataclassMapper,
-)
+# Submodule of each public name. Modules are imported on first access so that
+# Qt-independent names such as convertFromQt() do not import Qt binding.
+_LAZY_IMPORTS = {
+    "RepolishScheduler": "fieldwidgets",
+    "BoolCheckBox": "fieldwidgets",
+    "EmptyIntValidator": "fieldwidgets",
+    "IntLineEdit": "fieldwidgets",
+    "EmptyFloatValidator": "fieldwidgets",
+    "FloatLineEdit": "fieldwidgets",
+    "StrLineEdit": "fieldwidgets",
+    "EnumItemModel": "fieldwidgets",
+    "EnumComboBox": "fieldwidgets",
+    "FieldWriteInfo": "fieldwidgets",
+    "TupleGroupBox": "fieldwidgets",
+    "SequenceItemModel": "fieldwidgets",
+    "SequenceItemDelegate": "fieldwidgets",
+    "SequenceGroupBox": "fieldwidgets",
+    "ArrayTableModel": "fieldwidgets",
+    "ArrayGroupBox": "fieldwidgets",
+    "MappingItemModel": "fieldwidgets",
+    "MappingGroupBox": "fieldwidgets",
+    "DataWidget": "datawidget",
+    "type2Widget": "datawidget",
+    "dataclass2Widget": "datawidget",
+    "WidgetPlanCacheInfo": "datawidget",
+    "widgetPlanCacheInfo": "datawidget",
+    "clearWidgetPlanCache": "datawidget",
+    "setWidgetPlanCacheSize": "datawidget",
+    "DataWidgetPoolInfo": "datawidget",
+    "DataWidgetPool": "datawidget",
+    "DataclassStackedWidget": "multitype",
+    "DataclassTabWidget": "multitype",
+    "DataclassTableModel": "model",
+    "convertFromQt": "converter",
+    "convertToQt": "converter",
+    "convertManyFromQt": "converter",
+    "convertManyToQt": "converter",
+    "highlightEmptyField": "delegate",
+    "DataclassDelegate": "delegate",
+    "DataclassMapper": "delegate",
+}
 
 
 __all__ = [
+    "RepolishScheduler",
     "BoolCheckBox",
     "EmptyIntValidator",
     "IntLineEdit",
     "EmptyFloatValidator",
     "FloatLineEdit",
     "StrLineEdit",
+    "EnumItemModel",
     "EnumComboBox",
+    "FieldWriteInfo",
     "TupleGroupBox",
+    "SequenceItemModel",
+    "SequenceItemDelegate",
+    "SequenceGroupBox",
+    "ArrayTableModel",
+    "ArrayGroupBox",
+    "MappingItemModel",
+    "MappingGroupBox",
     "DataWidget",
     "type2Widget",
     "dataclass2Widget",
+    "WidgetPlanCacheInfo",
+    "widgetPlanCacheInfo",
+    "clearWidgetPlanCache",
+    "setWidgetPlanCacheSize",
+    "DataWidgetPoolInfo",
+    "DataWidgetPool",
     "DataclassStackedWidget",
     "DataclassTabWidget",
+    "DataclassTableModel",
     "convertFromQt",
     "convertToQt",
+    "convertManyFromQt",
+    "convertManyToQt",
     "highlightEmptyField",
     "DataclassDelegate",
     "DataclassMapper",
 ]
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,402 @@
+"""
+Data conversion
+===============
+
+:mod:`dawiq.converter` converts the data between the widgets and the
+dataclasses. This module does not depend on Qt, so it can be imported by the
+process which processes the data without any Qt binding.
+
+"""
+
+import collections
+import concurrent.futures
+import dataclasses
+import functools
+import itertools
+from typing import Dict, Any, Type, Optional, Callable, Tuple, Iterable, Iterator
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from _typeshed import DataclassInstance
+
+
+__all__ = [
+    "convertFromQt",
+    "convertToQt",
+    "convertManyFromQt",
+    "convertManyToQt",
+]
+
+
+def convertFromQt(
+    dcls: Type["DataclassInstance"],
+    data: Dict[str, Any],
+    ignoreMissing=True,
+) -> Dict[str, Any]:
+    """
+    Convert the dict from :class:`DataWidget` to structured dict for dataclass.
+
+    If the field value does not exist in *data* or is :obj:`None`, it is
+    considered to be absent. If *ignoreMissing* is True, the absent value is not
+    included in the resulting dictionary. Else, the default value of the field is
+    used if there is any.
+
+    Field may define ``fromQt_converter`` metadata to convert the widget data to
+    field data. It is a unary callable which takes the widget data and returns
+    the field data.
+
+    Examples
+    ========
+
+    ``None`` is considered as missing value.
+
+    >>> from dataclasses import dataclass, field
+    >>> from dawiq.converter import convertFromQt
+    >>> from typing import Optional
+    >>> @dataclass
+    ... class Cls1:
+    ...     a: int
+    ...     b: int = 10
+    ...     c: Optional[int] = None
+    ...     d: list = field(default_factory=list)
+    >>> convertFromQt(Cls1, {})
+    {}
+    >>> convertFromQt(Cls1, dict(a=1, b=None, c=None))
+    {'a': 1}
+
+    *ignoreMissing* controls whether the default value should be used.
+
+    >>> convertFromQt(Cls1, {}, ignoreMissing=False)
+    {'b': 10, 'c': None, 'd': []}
+
+    Nested dataclasses are recusively converted.
+
+    >>> @dataclass
+    ... class Cls2:
+    ...     x: int = 20
+    ...     y: Cls1 = field(default_factory=lambda: Cls1(a=5))
+    >>> convertFromQt(Cls2, {}, ignoreMissing=False)
+    {'x': 20, 'y': {'a': 5, 'b': 10, 'c': None, 'd': []}}
+
+    ``fromQt_converter`` metadata converts the data from the widet.
+
+    >>> def conv(arg):
+    ...     return (arg,)
+    >>> @dataclass
+    ... class Cls3:
+    ...     x: tuple = field(default=(1,), metadata=dict(fromQt_converter=conv))
+    >>> convertFromQt(Cls3, dict(x=1))
+    {'x': (1,)}
+
+    """
+    # Return value is not dataclass but dictionary because necessary fields might
+    # be missing from the widget.
+    return _converter(dcls, False, bool(ignoreMissing))(data)
+
+
+def convertToQt(
+    dcls: Type["DataclassInstance"],
+    data: Dict[str, Any],
+    ignoreMissing=True,
+) -> Dict[str, Any]:
+    """
+    Convert structured dict from dataclass to dict for :class:`DataWidget`.
+
+    If the field value does not exist in *data* or is :obj:`None`, it is
+    considered to be absent. If *ignoreMissing* is True, ``None`` is used as the
+    placeholder in the resulting dictionary. Else, the default value of the field
+    is used if there is any.
+
+    Field may define ``toQt_converter`` metadata to convert the field data to
+    widget data. It is a unary callable which takes the field data and returns
+    the widget data.
+
+    Examples
+    ========
+
+    ``None`` is considered as missing value.
+
+    >>> from dataclasses import dataclass, field
+    >>> from dawiq.converter import convertToQt
+    >>> from typing import Optional
+    >>> @dataclass
+    ... class Cls1:
+    ...     a: int
+    ...     b: int = 10
+    ...     c: Optional[int] = None
+    ...     d: list = field(default_factory=list)
+    >>> convertToQt(Cls1, dict(a=1, b=2, c=3))
+    {'a': 1, 'b': 2, 'c': 3, 'd': None}
+    >>> convertToQt(Cls1, {})
+    {'a': None, 'b': None, 'c': None, 'd': None}
+
+    *ignoreMissing* controls whether the default value should be used.
+
+    >>> convertToQt(Cls1, {}, ignoreMissing=False)
+    {'a': None, 'b': 10, 'c': None, 'd': []}
+
+    Nested dataclasses are recusively converted.
+
+    >>> @dataclass
+    ... class Cls2:
+    ...     x: int = 20
+    ...     y: Cls1 = field(default_factory=lambda: Cls1(a=5))
+    >>> convertToQt(Cls2, {}, ignoreMissing=False)
+    {'x': 20, 'y': {'a': 5, 'b': 10, 'c': None, 'd': []}}
+
+    ``toQt_converter`` metadata converts the data to the widget.
+
+    >>> @dataclass
+    ... class Cls3:
+    ...     x: int = field(metadata=dict(toQt_converter=lambda tup: tup[0]))
+    >>> convertToQt(Cls3, dict(x=(1,)))
+    {'x': 1}
+
+    """
+    return _converter(dcls, True, bool(ignoreMissing))(data)
+
+
+def convertManyFromQt(
+    dcls: Type["DataclassInstance"],
+    data: Iterable[Dict[str, Any]],
+    ignoreMissing=True,
+    executor: Optional[concurrent.futures.Executor] = None,
+    chunksize: int = 1000,
+    maxPending: int = 8,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily apply :func:`convertFromQt` to each dict in *data*.
+
+    *data* can be any iterable including generator. The converter of *dcls* is
+    looked up once, and the results are yielded in the order of *data*.
+
+    If *executor* is passed, *data* is split into the chunks of *chunksize*
+    items which are converted by the executor. At most *maxPending* chunks are
+    submitted at once, so that the memory usage is bounded. When
+    :class:`concurrent.futures.ProcessPoolExecutor` is used, *dcls* and the
+    items must be picklable, e.g. dataclass must be defined in module level.
+
+    Examples
+    ========
+
+    >>> from dataclasses import dataclass
+    >>> from dawiq.converter import convertManyFromQt
+    >>> @dataclass
+    ... class Cls:
+    ...     a: int
+    ...     b: int = 10
+    >>> list(convertManyFromQt(Cls, [dict(a=1), dict(a=None, b=2)]))
+    [{'a': 1}, {'b': 2}]
+
+    """
+    return _convertMany(
+        dcls, False, data, bool(ignoreMissing), executor, chunksize, maxPending
+    )
+
+
+def convertManyToQt(
+    dcls: Type["DataclassInstance"],
+    data: Iterable[Dict[str, Any]],
+    ignoreMissing=True,
+    executor: Optional[concurrent.futures.Executor] = None,
+    chunksize: int = 1000,
+    maxPending: int = 8,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily apply :func:`convertToQt` to each dict in *data*.
+
+    See :func:`convertManyFromQt` for the arguments.
+    """
+    return _convertMany(
+        dcls, True, data, bool(ignoreMissing), executor, chunksize, maxPending
+    )
+
+
+def _convertMany(
+    dcls: Type["DataclassInstance"],
+    toQt: bool,
+    data: Iterable[Dict[str, Any]],
+    ignoreMissing: bool,
+    executor: Optional[concurrent.futures.Executor],
+    chunksize: int,
+    maxPending: int,
+) -> Iterator[Dict[str, Any]]:
+    if executor is None:
+        return map(_converter(dcls, toQt, ignoreMissing), data)
+    if chunksize < 1 or maxPending < 1:
+        raise ValueError("chunksize and maxPending must be positive.")
+    return _convertChunksConcurrently(
+        dcls, toQt, data, ignoreMissing, executor, chunksize, maxPending
+    )
+
+
+def _convertChunksConcurrently(
+    dcls, toQt, data, ignoreMissing, executor, chunksize, maxPending
+):
+    iterator = iter(data)
+    pending: collections.deque = collections.deque()
+    try:
+        while True:
+            while len(pending) < maxPending:
+                chunk = list(itertools.islice(iterator, chunksize))
+                if not chunk:
+                    break
+                pending.append(
+                    executor.submit(_convertChunk, dcls, toQt, ignoreMissing, chunk)
+                )
+            if not pending:
+                return
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _convertChunk(
+    dcls: Type["DataclassInstance"],
+    toQt: bool,
+    ignoreMissing: bool,
+    chunk: list,
+) -> list:
+    """Convert *chunk* in the worker of executor."""
+    convert = _converter(dcls, toQt, ignoreMissing)
+    return [convert(d) for d in chunk]
+
+
+@functools.lru_cache(maxsize=256)
+def _cachedConverter(
+    dcls: Type["DataclassInstance"], toQt: bool, ignoreMissing: bool
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    return _compileConverter(dcls, toQt, ignoreMissing)
+
+
+def _converter(
+    dcls: Type["DataclassInstance"], toQt: bool, ignoreMissing: bool
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Return the converter of *dcls* for :func:`convertToQt` if *toQt* is True, or
+    for :func:`convertFromQt` if False.
+
+    Converter is compiled once for each argument and cached.
+    """
+    if not isinstance(dcls, type):
+        dcls = type(dcls)
+    return _cachedConverter(dcls, toQt, ignoreMissing)
+
+
+def _lazyConverter(
+    namespace: Dict[str, Any],
+    key: str,
+    dcls: Type["DataclassInstance"],
+    toQt: bool,
+    ignoreMissing: bool,
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Stub which replaces itself in *namespace* with the converter of *dcls*."""
+
+    def convert(data):
+        namespace[key] = _converter(dcls, toQt, ignoreMissing)
+        return namespace[key](data)
+
+    return convert
+
+
+def _compileConverter(
+    dcls: Type["DataclassInstance"], toQt: bool, ignoreMissing: bool
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Generate the function which converts the data of *dcls*.
+
+    Field metadata, default values and nested dataclasses are inspected here, so
+    that the generated function consists of straight-line dictionary operations.
+    Nested dataclasses are converted by their own converters, which are bound on
+    first call to support recursive definitions.
+    """
+    metadataKey = "toQt_converter" if toQt else "fromQt_converter"
+    namespace: Dict[str, Any] = dict(
+        MISSING=dataclasses.MISSING,
+        is_dataclass=dataclasses.is_dataclass,
+        asdict=dataclasses.asdict,
+    )
+    lines = ["def convert(data):", "    ret = {}", "    get = data.get"]
+
+    for i, f in enumerate(dataclasses.fields(dcls)):
+        name = repr(f.name)
+        nested = dataclasses.is_dataclass(f.type)
+        if nested:
+            subconvert = f"s{i}"
+            namespace[subconvert] = _lazyConverter(
+                namespace, subconvert, f.type, toQt, ignoreMissing  # type: ignore
+            )
+
+        lines.append(f"    val = get({name})")
+        lines.append("    if val is not None:")
+        if nested:
+            lines.append(f"        val = {subconvert}(val)")
+        if f.metadata.get(metadataKey, None) is not None:
+            namespace[f"c{i}"] = f.metadata[metadataKey]
+            lines.append(f"        val = c{i}(val)")
+        lines.append(f"        ret[{name}] = val")
+
+        # code for absent value
+        if nested:
+            noDefault = [f"ret[{name}] = {subconvert}({{}})"]
+        elif toQt:
+            noDefault = [f"ret[{name}] = None"]
+        else:
+            noDefault = []
+        if ignoreMissing:
+            absent = [f"ret[{name}] = None"] if toQt else []
+        elif f.default_factory is not dataclasses.MISSING:
+            namespace[f"f{i}"] = f.default_factory
+            absent = [
+                f"val = f{i}()",
+                "if val is MISSING:",
+                *[f"    {line}" for line in noDefault or ["pass"]],
+                "else:",
+                "    if is_dataclass(val) and not isinstance(val, type):",
+                "        val = asdict(val)",
+                f"    ret[{name}] = val",
+            ]
+        elif f.default is not dataclasses.MISSING:
+            namespace[f"d{i}"] = f.default
+            if dataclasses.is_dataclass(f.default) and not isinstance(f.default, type):
+                absent = [f"ret[{name}] = asdict(d{i})"]
+            else:
+                absent = [f"ret[{name}] = d{i}"]
+        else:
+            absent = noDefault
+        if absent:
+            lines.append("    else:")
+            lines.extend(f"        {line}" for line in absent)
+
+    lines.append("    return ret")
+    exec("\n".join(lines), namespace)
+    convert = namespace["convert"]
+    convert.__qualname__ = f"{'convertToQt' if toQt else 'convertFromQt'}[{dcls}]"
+    return convert
+
+
+@functools.lru_cache(maxsize=256)
+def _requiredFields(
+    dcls: Type["DataclassInstance"],
+) -> Tuple[Tuple[str, bool, Optional[Type["DataclassInstance"]]], ...]:
+    """
+    Return the tuple of ``(name, required, nested)`` for each field of *dcls*.
+
+    The field is required if it has neither default value nor default factory.
+    *nested* is the dataclass type of the required nested dataclass field, or
+    None otherwise. Default factories are never called.
+    """
+    ret: list = []
+    for f in dataclasses.fields(dcls):
+        required = (
+            f.default is dataclasses.MISSING
+            and f.default_factory is dataclasses.MISSING
+        )
+        if required and dataclasses.is_dataclass(f.type):
+            nested = f.type
+        else:
+            nested = None
+        ret.append((f.name, required, nested))
+    return tuple(ret)
@@ -13,23 +13,57 @@ from .fieldwidgets import (
     FloatLineEdit,
     StrLineEdit,
     EnumComboBox,
+    SequenceGroupBox,
+    ArrayGroupBox,
+    MappingGroupBox,
     TupleGroupBox,
+    FieldWriteInfo,
+    _ndarrayType,
+    _sameValue,
+    _fieldWriteInfo,
+    _clearFieldWriteInfo,
 )
+import contextlib
 import dataclasses
+import functools
+import heapq
+import itertools
+import weakref
+from collections import OrderedDict
 from enum import Enum
-from typing import Optional, Any, Union, Callable, Dict, get_type_hints, Type
+from typing import (
+    Optional,
+    Any,
+    Union,
+    Callable,
+    Dict,
+    get_type_hints,
+    Type,
+    Tuple,
+    FrozenSet,
+    NamedTuple,
+    Set,
+    List,
+)
 from .typing import FieldWidgetProtocol
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from _typeshed import DataclassInstance
+    from typing import Iterator
 
 
 __all__ = [
     "DataWidget",
     "type2Widget",
     "dataclass2Widget",
+    "WidgetPlanCacheInfo",
+    "widgetPlanCacheInfo",
+    "clearWidgetPlanCache",
+    "setWidgetPlanCacheSize",
+    "DataWidgetPoolInfo",
+    "DataWidgetPool",
 ]
 
 
@@ -44,6 +78,46 @@ class DataWidget(QtWidgets.QGroupBox):
     Whenever the data value changes, :attr:`dataValueChanged` signal is emitted.
     When any field is edited by the user, :attr:`dataEdited` signal is emitted.
 
+    The data value is cached and updated incrementally by the field which is
+    changed, instead of being collected from every subwidget. Along with the
+    data value, :attr:`fieldPathChanged` signal emits the path to the changed
+    field and its new value. The path is the tuple of field names, where the
+    item index is used for :class:`.TupleGroupBox`. Empty path indicates that
+    the whole data is set by :meth:`setDataValue`.
+
+    .. code-block:: python
+
+        # field "x" of nested data "b" is changed to 1
+        dataWidget.fieldPathChanged.emit(("b", "x"), 1)
+
+    The dictionary emitted by :attr:`dataValueChanged` is shared with the cache
+    and must not be modified. :meth:`dataValue` returns its copy. The changes
+    deferred by the subwidgets, e.g. :class:`.SequenceGroupBox`, are emitted
+    before :meth:`dataValue` and :meth:`setDataValue` read the cache.
+
+    :meth:`setDataValue` compares the new data with the cached data value, and
+    does not set the field value which is equal to the current one. Only the
+    values of immutable scalar types, e.g. ``int`` and ``str``, are compared by
+    equality and the others by identity. ``None`` is always set because it is
+    also parsed from the partial text, e.g. ``"-"``, which must be cleared.
+    Nested data widgets and tuple widgets are always set, and they skip their
+    unchanged fields in turn. The numbers of written and skipped fields are
+    returned by :meth:`fieldWriteInfo`.
+
+    By default, the signals are emitted whenever any field changes. When
+    :meth:`setCoalesceChanges` is enabled, the data widget only marks its data
+    value and the values of its parents as dirty, and emits
+    :attr:`dataValueChanged` once at the end of the current event loop
+    iteration. Nested data widgets emit before their parents, so a burst of
+    changes in the nested fields costs one emission per data widget.
+    :attr:`fieldPathChanged` emits the path to the changed field if only one
+    field is changed, and empty path otherwise.
+
+    The paths to the fields whose values are changed since last
+    :meth:`setDataValue` are tracked, and can be retrieved by
+    :meth:`editedPaths`. Path to the field of nested data widget includes the
+    nested field names, but a tuple field is tracked as a whole.
+
     This widget is also used to represent the nested dataclass field, therefore
     it follows :class:`FieldWidgetProtocol`.
 
@@ -56,8 +130,9 @@ class DataWidget(QtWidgets.QGroupBox):
 
     """
 
-    dataValueChanged = QtCore.Signal(dict)
+    dataValueChanged = QtCore.Signal(object)
     dataEdited = QtCore.Signal()
+    fieldPathChanged = QtCore.Signal(tuple, object)
     fieldValueChanged = dataValueChanged
     fieldEdited = dataEdited
 
@@ -68,6 +143,22 @@ class DataWidget(QtWidgets.QGroupBox):
     ):
         super().__init__(parent)
         self._orientation = orientation
+        self._dataValue: Optional[Dict[str, Any]] = None
+        self._fieldWidgets: Dict[str, FieldWidgetProtocol] = {}
+        self._subfieldSlots: Dict[Any, Tuple[str, Callable, Callable]] = {}
+        # subwidgets which may defer their changes, including nested data widgets
+        self._deferringSubfields: List[Any] = []
+        self._editedNames: Set[str] = set()
+        self._appliedCount = 0
+        self._skippedCount = 0
+        self._coalesceChanges = False
+        self._changePending = False
+        self._pendingPath: Optional[Tuple[Any, ...]] = None
+        self._pendingValue: Any = None
+        self._parentDataWidget: Optional["weakref.ReferenceType[DataWidget]"] = None
+        self._updateDepth = 0
+        self._updatePending = False
+        self._updatesWereEnabled = True
 
         if orientation == QtCore.Qt.Orientation.Vertical:
             layout = QtWidgets.QVBoxLayout()
@@ -102,15 +193,9 @@ class DataWidget(QtWidgets.QGroupBox):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag(0),
     ):
         """Insert the widget to layout and connect the signals."""
-        for i in range(self.count()):
-            w = self.widget(i)
-            if w is None:
-                break
-            if widget.fieldName() == w.fieldName():
-                raise KeyError(f"Data name '{widget.fieldName()}' is duplicate")
-        widget.fieldValueChanged.connect(self._onSubfieldValueChange)
-        widget.fieldEdited.connect(self.dataEdited)
+        self._connectSubfield(widget)
         self.layout().insertWidget(index, widget, stretch, alignment)
+        self._dataValue = None
 
     def addWidget(
         self,
@@ -119,36 +204,124 @@ class DataWidget(QtWidgets.QGroupBox):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag(0),
     ):
         """Add the widget to layout and connect the signals."""
-        for i in range(self.count()):
-            w = self.widget(i)
-            if w is None:
-                break
-            if widget.fieldName() == w.fieldName():
-                raise KeyError(f"Data name '{widget.fieldName()}' is duplicate")
-        widget.fieldValueChanged.connect(self._onSubfieldValueChange)
-        widget.fieldEdited.connect(self.dataEdited)
+        self._connectSubfield(widget)
         self.layout().addWidget(widget, stretch, alignment)
+        self._dataValue = None
 
     def removeWidget(self, widget: FieldWidgetProtocol):
         """Remove the widget from layout and disconnect the signals."""
-        for i in range(self.count()):
-            w = self.widget(i)
-            if w is None:
-                break
-            if w == widget:
-                widget.fieldValueChanged.disconnect(self._onSubfieldValueChange)
-                widget.fieldEdited.disconnect(self.dataEdited)
-                break
+        if widget in self._subfieldSlots:
+            self._setSubfieldConnected(widget, False)
+            widget.fieldEdited.disconnect(self.dataEdited)
+            name, _, _ = self._subfieldSlots.pop(widget)
+            del self._fieldWidgets[name]
+            if widget in self._deferringSubfields:
+                self._deferringSubfields.remove(widget)
+            if isinstance(widget, DataWidget):
+                widget._parentDataWidget = None
+            self._editedNames.discard(name)
+            self._dataValue = None
         self.layout().removeWidget(widget)
 
+    def _connectSubfield(self, widget: FieldWidgetProtocol):
+        name = widget.fieldName()
+        if name in self._fieldWidgets:
+            raise KeyError(f"Data name '{name}' is duplicate")
+        # nested widget reports its own path, leaf widget reports only the value
+        emitPath = not hasattr(widget, "fieldPathChanged")
+        # nested data widget tracks its own edited fields
+        track = not isinstance(widget, DataWidget)
+        valueSlot = functools.partial(
+            self._onSubfieldValueChange, name, emitPath, track
+        )
+        pathSlot = functools.partial(self._onSubfieldPathChange, name)
+        self._fieldWidgets[name] = widget
+        self._subfieldSlots[widget] = (name, valueSlot, pathSlot)
+        if isinstance(widget, DataWidget):
+            widget._parentDataWidget = weakref.ref(self)
+        self._setSubfieldConnected(widget, True)
+        widget.fieldEdited.connect(self.dataEdited)
+        if isinstance(widget, DataWidget) or hasattr(widget, "flushPendingChange"):
+            self._deferringSubfields.append(widget)
+
+    def _setSubfieldConnected(self, widget: FieldWidgetProtocol, connected: bool):
+        _, valueSlot, pathSlot = self._subfieldSlots[widget]
+        pathSignal = getattr(widget, "fieldPathChanged", None)
+        if connected:
+            widget.fieldValueChanged.connect(valueSlot)
+            if pathSignal is not None:
+                pathSignal.connect(pathSlot)
+        else:
+            widget.fieldValueChanged.disconnect(valueSlot)
+            if pathSignal is not None:
+                pathSignal.disconnect(pathSlot)
+
+    def widgetByName(self, name: str) -> Optional[FieldWidgetProtocol]:
+        """
+        Returns the subwidget whose field name is *name*, or None if not found.
+
+        The subwidgets are indexed by the field name when they are added, so the
+        field name must be set before adding the subwidget.
+        """
+        return self._fieldWidgets.get(name)
+
+    def widgetByPath(self, path: Tuple[Any, ...]) -> Optional[FieldWidgetProtocol]:
+        """
+        Returns the nested subwidget at *path*, or None for invalid path.
+
+        *path* is the tuple of the field names, where the item index is used for
+        :class:`.TupleGroupBox`. It has the same structure as the path emitted by
+        :attr:`fieldPathChanged`. Empty path returns *self*.
+
+        .. code-block:: python
+
+            # item 0 of tuple field "b" in nested data "a"
+            dataWidget.widgetByPath(("a", "b", 0))
+
+        """
+        if not path:
+            return self
+        widget = self._fieldWidgets.get(path[0])
+        if widget is None or len(path) == 1:
+            return widget
+        widgetByPath = getattr(widget, "widgetByPath", None)
+        if widgetByPath is None:
+            return None
+        return widgetByPath(path[1:])
+
+    def _currentDataValue(self) -> Dict[str, Any]:
+        """
+        Cached data value, which is collected from the subwidgets if invalid.
+
+        The cached dictionary is never modified in-place. It is replaced by new
+        dictionary when the field value changes, so that the dictionaries shared
+        with the parent widget and the signal receivers remain intact.
+        """
+        if self._dataValue is None:
+            ret = {}
+            for i in range(self.count()):
+                w = self.widget(i)
+                if w is None:
+                    break
+                name, _, _ = self._subfieldSlots[w]
+                ret[name] = _subfieldValue(w)
+            self._dataValue = ret
+        return self._dataValue
+
+    def _flushSubfieldChanges(self):
+        """
+        Recursively emit the changes deferred by the subwidgets, e.g.
+        :class:`.SequenceGroupBox`, so that the cached data value is up to date.
+        """
+        for widget in self._deferringSubfields:
+            if isinstance(widget, DataWidget):
+                widget._flushSubfieldChanges()
+            else:
+                widget.flushPendingChange()
+
     def dataValue(self) -> Dict[str, Any]:
-        ret = {}
-        for i in range(self.count()):
-            w = self.widget(i)
-            if w is None:
-                break
-            ret[w.fieldName()] = w.fieldValue()
-        return ret
+        self._flushSubfieldChanges()
+        return _copyDataValue(self._currentDataValue())
 
     fieldValue = dataValue
 
@@ -156,23 +329,240 @@ class DataWidget(QtWidgets.QGroupBox):
         if data is None:
             data = {}
 
-        for i in range(self.count()):
-            w = self.widget(i)
-            if w is None:
-                break
-            val = data.get(w.fieldName(), None)  # type: ignore[union-attr]
-            w.fieldValueChanged.disconnect(self._onSubfieldValueChange)
-            try:
-                w.setFieldValue(val)
-            except TypeError:
-                w.setFieldValue(None)
-            w.fieldValueChanged.connect(self._onSubfieldValueChange)
-        self.dataValueChanged.emit(data)
+        # deferred changes must be in the cache to be compared
+        self._flushSubfieldChanges()
+        self.beginUpdate()
+        try:
+            current = self._currentDataValue()
+            for name, w in self._fieldWidgets.items():
+                val = data.get(name, None)  # type: ignore[union-attr]
+                nested = hasattr(w, "fieldPathChanged")
+                skip = val is not None and _sameValue(current.get(name), val)
+                if not nested and skip:
+                    self._skippedCount += 1
+                    continue
+                try:
+                    w.setFieldValue(val)
+                except TypeError:
+                    w.setFieldValue(None)
+                if not nested:
+                    self._appliedCount += 1
+        finally:
+            self._editedNames.clear()
+            self._updatePending = True
+            self.endUpdate()
 
     setFieldValue = setDataValue
 
-    def _onSubfieldValueChange(self, value: Any):
-        self.dataValueChanged.emit(self.dataValue())
+    def fieldWriteInfo(self) -> FieldWriteInfo:
+        """
+        Numbers of the fields written and skipped by :meth:`setDataValue`,
+        including the nested subwidgets.
+        """
+        return _fieldWriteInfo(
+            self._appliedCount, self._skippedCount, self._fieldWidgets.values()
+        )
+
+    def clearFieldWriteInfo(self):
+        """Recursively reset the numbers returned by :meth:`fieldWriteInfo`."""
+        self._appliedCount = self._skippedCount = 0
+        _clearFieldWriteInfo(self._fieldWidgets.values())
+
+    def editedPaths(self) -> Set[Tuple[str, ...]]:
+        """
+        Paths to the fields whose values are changed since last
+        :meth:`setDataValue`.
+
+        Each path is a tuple of field names, which can be passed to
+        :meth:`widgetByPath`.
+        """
+        paths: Set[Tuple[str, ...]] = {(name,) for name in self._editedNames}
+        for name, widget in self._fieldWidgets.items():
+            if isinstance(widget, DataWidget):
+                paths.update((name,) + path for path in widget.editedPaths())
+        return paths
+
+    def clearEditedPaths(self):
+        """Recursively clear the paths returned by :meth:`editedPaths`."""
+        self._editedNames.clear()
+        for widget in self._fieldWidgets.values():
+            if isinstance(widget, DataWidget):
+                widget.clearEditedPaths()
+
+    def beginUpdate(self):
+        """
+        Start bulk update of the subwidgets.
+
+        Until matching :meth:`endUpdate` is called, the signals for the changes
+        of the subwidgets are not emitted and repainting is disabled. Calls can
+        be nested, in which case only the outermost pair takes effect.
+
+        This is useful when multiple fields are changed at once, e.g.:
+
+        .. code-block:: python
+
+            dataWidget.beginUpdate()
+            try:
+                dataWidget.widget(0).setFieldValue(1)
+                dataWidget.widget(1).setFieldValue(2)
+            finally:
+                dataWidget.endUpdate()
+
+        :meth:`setDataValue` performs its update in this mode.
+
+        See Also
+        ========
+
+        updating : Context manager for bulk update.
+
+        """
+        if self._updateDepth == 0:
+            self._updatesWereEnabled = self.updatesEnabled()
+            self.setUpdatesEnabled(False)
+        self._updateDepth += 1
+
+    def endUpdate(self):
+        """
+        Finish bulk update which is started by :meth:`beginUpdate`.
+
+        If any field has changed during the update, :attr:`dataValueChanged` is
+        emitted once with the final data value and :attr:`fieldPathChanged` is
+        emitted with empty path.
+        """
+        if self._updateDepth == 0:
+            raise RuntimeError("endUpdate() called without beginUpdate()")
+        self._updateDepth -= 1
+        if self._updateDepth > 0:
+            return
+        self.setUpdatesEnabled(self._updatesWereEnabled)
+        if self._updatePending:
+            self._updatePending = False
+            # coalesced change is superseded by this emission
+            self._changePending = False
+            self._pendingPath = None
+            value = self._currentDataValue()
+            self.dataValueChanged.emit(value)
+            self.fieldPathChanged.emit((), value)
+
+    def isUpdating(self) -> bool:
+        """Whether bulk update started by :meth:`beginUpdate` is in progress."""
+        return self._updateDepth > 0
+
+    @contextlib.contextmanager
+    def updating(self) -> "Iterator[DataWidget]":
+        """
+        Context manager which wraps :meth:`beginUpdate` and :meth:`endUpdate`.
+
+        .. code-block:: python
+
+            with dataWidget.updating():
+                dataWidget.widget(0).setFieldValue(1)
+                dataWidget.widget(1).setFieldValue(2)
+
+        """
+        self.beginUpdate()
+        try:
+            yield self
+        finally:
+            self.endUpdate()
+
+    def coalesceChanges(self) -> bool:
+        """
+        Whether the signals for the field changes are coalesced until the end
+        of the current event loop iteration.
+        """
+        return self._coalesceChanges
+
+    def setCoalesceChanges(self, coalesce: bool):
+        """
+        Recursively set whether the signals for the field changes are
+        coalesced. Disabling the coalescing emits the pending change.
+        """
+        self._coalesceChanges = coalesce
+        for widget in self._fieldWidgets.values():
+            if isinstance(widget, DataWidget):
+                widget.setCoalesceChanges(coalesce)
+        if not coalesce:
+            self._emitPendingChange()
+
+    def hasPendingChange(self) -> bool:
+        """Whether the coalesced change is waiting to be emitted."""
+        return self._changePending
+
+    def flushChanges(self):
+        """Emit the pending coalesced changes of every data widget now."""
+        _ChangeScheduler.instance().flush()
+
+    def _scheduleChange(self, path: Optional[Tuple[Any, ...]], value: Any):
+        # ancestors are already dirty if self is dirty and pending
+        ancestorsDirty = self._changePending and self._dataValue is None
+        # collect the value only once when the change is emitted
+        self._dataValue = None
+        if path is not None:
+            if self._pendingPath is None:
+                self._pendingPath, self._pendingValue = path, value
+            elif self._pendingPath == path:
+                self._pendingValue = value
+            else:
+                self._pendingPath = ()
+        if not self._changePending:
+            self._changePending = True
+            _ChangeScheduler.instance().schedule(self)
+        if not ancestorsDirty:
+            self._invalidateParent()
+
+    def _invalidateParent(self):
+        """Mark the parent data widgets dirty, without emitting the signals."""
+        ref = self._parentDataWidget
+        parent = ref() if ref is not None else None
+        if parent is None:
+            return
+        if parent._coalesceChanges and parent._updateDepth == 0:
+            parent._scheduleChange(None, None)
+        else:
+            parent._dataValue = None
+            parent._invalidateParent()
+
+    def _emitPendingChange(self):
+        if not self._changePending:
+            return
+        path, pathValue = self._pendingPath, self._pendingValue
+        self._changePending = False
+        self._pendingPath = self._pendingValue = None
+        value = self._currentDataValue()
+        self.dataValueChanged.emit(value)
+        if path:
+            self.fieldPathChanged.emit(path, pathValue)
+        else:
+            self.fieldPathChanged.emit((), value)
+
+    def _onSubfieldValueChange(
+        self, name: str, emitPath: bool, track: bool, value: Any
+    ):
+        if track:
+            self._editedNames.add(name)
+        if self._updateDepth > 0:
+            # collect the value only once when the update is finished
+            self._dataValue = None
+            self._updatePending = True
+            return
+        if self._coalesceChanges:
+            self._scheduleChange((name,) if emitPath else None, value)
+            return
+        data = dict(self._currentDataValue())
+        data[name] = value
+        self._dataValue = data
+        self.dataValueChanged.emit(data)
+        if emitPath:
+            self.fieldPathChanged.emit((name,), value)
+
+    def _onSubfieldPathChange(self, name: str, path: tuple, value: Any):
+        if self._updateDepth > 0:
+            return
+        if self._coalesceChanges:
+            self._scheduleChange((name,) + path, value)
+            return
+        self.fieldPathChanged.emit((name,) + path, value)
 
     def fieldName(self) -> str:
         return self.title()
@@ -189,6 +579,78 @@ class DataWidget(QtWidgets.QGroupBox):
             widget.setRequired(required)
 
 
+def _widgetDepth(widget: QtWidgets.QWidget) -> int:
+    """Number of the ancestors of *widget*."""
+    depth = 0
+    parent = widget.parentWidget()
+    while parent is not None:
+        depth += 1
+        parent = parent.parentWidget()
+    return depth
+
+
+class _ChangeScheduler(QtCore.QObject):
+    """
+    Object which emits the coalesced changes of :class:`DataWidget`.
+
+    The data widgets are emitted at the end of the event loop iteration in the
+    order of their depth, so that the nested widget emits before its parent and
+    the parent which is scheduled by the emission is emitted in the same flush.
+    """
+
+    _instance: Optional["_ChangeScheduler"] = None
+
+    @classmethod
+    def instance(cls) -> "_ChangeScheduler":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # (-depth, sequence, widget)
+        self._heap: List[Tuple[int, int, DataWidget]] = []
+        self._scheduled: Set[DataWidget] = set()
+        self._sequence = itertools.count()
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+
+    def schedule(self, widget: DataWidget):
+        if widget in self._scheduled:
+            return
+        self._scheduled.add(widget)
+        entry = (-_widgetDepth(widget), next(self._sequence), widget)
+        heapq.heappush(self._heap, entry)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        self._timer.stop()
+        while self._heap:
+            _, _, widget = heapq.heappop(self._heap)
+            self._scheduled.discard(widget)
+            try:
+                widget._emitPendingChange()
+            except RuntimeError:
+                # underlying C++ object is already deleted
+                pass
+
+
+def _subfieldValue(widget: FieldWidgetProtocol) -> Any:
+    """Field value of *widget*, sharing the cache if *widget* is data widget."""
+    if isinstance(widget, DataWidget):
+        return widget._currentDataValue()
+    return widget.fieldValue()
+
+
+def _copyDataValue(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy *data* and its nested dictionaries."""
+    return {k: _copyDataValue(v) if isinstance(v, dict) else v for k, v in data.items()}
+
+
 def type2Widget(t: Any) -> FieldWidgetProtocol:
     """
     Construct the widget for given type annotation *t*.
@@ -203,25 +665,62 @@ def type2Widget(t: Any) -> FieldWidgetProtocol:
     * :class:`float` or :obj:`Optional[float]` -> :class:`.FloatLineEdit`
     * :class:`str` or :obj:`Optional[str]` -> :class:`.StrLineEdit`
     * :obj:`Tuple` -> :class:`.TupleGroupBox` with nested field widgets
+    * :obj:`List[T]` or :obj:`Tuple[T, ...]` -> :class:`.SequenceGroupBox` with
+      the field widget of ``T`` as item editor
+    * :obj:`Dict[K, V]` -> :class:`.MappingGroupBox` with the field widgets of
+      ``K`` and ``V`` as item editors
+    * :class:`numpy.ndarray` -> :class:`.ArrayGroupBox`, if NumPy is imported
 
-    For :obj:`Tuple`, its length must be finite (no :class:`Ellipsis` in args)
-    and item types must be the supported type.
+    Item types of :obj:`Tuple`, :obj:`List` and :obj:`Dict` must be the
+    supported type.
 
     """
     # When new type is supported, update intro.rst as well
+    return _type2WidgetFactory(t)()
+
+
+def _tristateBoolCheckBox() -> BoolCheckBox:
+    widget = BoolCheckBox()
+    widget.setTristate(True)
+    return widget
 
+
+def _type2WidgetFactory(t: Any) -> Callable[[], FieldWidgetProtocol]:
+    """
+    Resolve *t* to a zero-argument callable which constructs its widget.
+
+    This performs all the type introspection of :func:`type2Widget` once, so
+    that the returned factory can be called repeatedly without inspecting *t*.
+    """
     if isinstance(t, type) and issubclass(t, Enum):
-        return EnumComboBox.fromEnum(t)
+        return functools.partial(EnumComboBox.fromEnum, t)
     if t is bool:
-        return BoolCheckBox()
+        return BoolCheckBox
     if t is int:
-        return IntLineEdit()
+        return IntLineEdit
     if t is float:
-        return FloatLineEdit()
+        return FloatLineEdit
     if t is str:
-        return StrLineEdit()
+        return StrLineEdit
 
-    origin = getattr(t, "__origin__", None)  # t is tuple
+    origin = getattr(t, "__origin__", None)  # t is tuple, list or dict
+
+    ndarray = _ndarrayType()
+    if ndarray is not None and (t is ndarray or origin is ndarray):
+        return ArrayGroupBox
+
+    args = getattr(t, "__args__", None)
+    if origin is list or (origin is tuple and args and args[-1] is Ellipsis):
+        if args is None:
+            raise TypeError("%s does not have argument type" % t)
+        itemFactory = _type2WidgetFactory(args[0])
+        return functools.partial(SequenceGroupBox, itemFactory, origin)
+
+    if origin is dict:
+        if args is None:
+            raise TypeError("%s does not have argument type" % t)
+        keyFactory, valueFactory = (_type2WidgetFactory(arg) for arg in args)
+        return functools.partial(MappingGroupBox, keyFactory, valueFactory)
 
     if origin is tuple:
         args = getattr(t, "__args__", None)
@@ -231,11 +730,15 @@ def type2Widget(t: Any) -> FieldWidgetProtocol:
             txt = "Number of arguments of %s not fixed" % t
             raise TypeError(txt)
 
-        subwidgets = [type2Widget(arg) for arg in args]
-        tupwidget = TupleGroupBox()
-        for w in subwidgets:
-            tupwidget.addWidget(w)
-        return tupwidget
+        factories = [_type2WidgetFactory(arg) for arg in args]
+
+        def tupleFactory() -> TupleGroupBox:
+            tupwidget = TupleGroupBox()
+            for factory in factories:
+                tupwidget.addWidget(factory())
+            return tupwidget
+
+        return tupleFactory
 
     if origin is Union:
         args = [a for a in getattr(t, "__args__") if not isinstance(None, a)]
@@ -243,14 +746,188 @@ def type2Widget(t: Any) -> FieldWidgetProtocol:
             msg = f"Cannot convert Union with multiple types: {t}"
             raise TypeError(msg)
         # t is Optional[...]
-        widget = type2Widget(args[0])
-        if isinstance(widget, BoolCheckBox):
-            widget.setTristate(True)
-        return widget
+        factory = _type2WidgetFactory(args[0])
+        if factory is BoolCheckBox:
+            factory = _tristateBoolCheckBox
+        return factory
 
     raise TypeError("Unknown type or annotation: %s" % t)
 
 
+class WidgetPlanCacheInfo(NamedTuple):
+    """Statistics of the construction plan cache of :func:`dataclass2Widget`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _WidgetPlan:
+    """
+    Construction plan of :class:`DataWidget` for a dataclass.
+
+    The plan stores the field names and the widget factories, which are resolved
+    from the type hints in advance. :meth:`build` replays the plan without any
+    type introspection.
+    """
+
+    def __init__(
+        self,
+        orientation: QtCore.Qt.Orientation,
+        steps: Tuple[Tuple[str, Callable[[], FieldWidgetProtocol]], ...],
+        dependencies: FrozenSet[type],
+    ):
+        self.orientation = orientation
+        self.steps = steps
+        # every dataclass this plan depends on, including the nested ones
+        self.dependencies = dependencies
+
+    def build(self) -> "DataWidget":
+        widget = DataWidget(self.orientation)
+        for name, factory in self.steps:
+            field_w = factory()
+            field_w.setFieldName(name)
+            widget.addWidget(field_w)
+        return widget
+
+
+class _WidgetPlanCache:
+    """LRU cache of :class:`_WidgetPlan` with hit/miss statistics."""
+
+    def __init__(self, maxsize: int = 128):
+        self._plans: "OrderedDict[tuple, _WidgetPlan]" = OrderedDict()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: tuple) -> Optional[_WidgetPlan]:
+        plan = self._plans.get(key)
+        if plan is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            self._plans.move_to_end(key)
+        return plan
+
+    def put(self, key: tuple, plan: _WidgetPlan):
+        self._plans[key] = plan
+        self._plans.move_to_end(key)
+        self._evict()
+
+    def _evict(self):
+        while len(self._plans) > self._maxsize:
+            self._plans.popitem(last=False)
+
+    def info(self) -> WidgetPlanCacheInfo:
+        return WidgetPlanCacheInfo(
+            self._hits, self._misses, self._maxsize, len(self._plans)
+        )
+
+    def clear(self, dcls: Optional[type] = None):
+        if dcls is None:
+            self._plans.clear()
+            self._hits = 0
+            self._misses = 0
+        else:
+            for key in [k for k, p in self._plans.items() if dcls in p.dependencies]:
+                del self._plans[key]
+
+    def setMaxsize(self, maxsize: int):
+        if maxsize < 0:
+            raise ValueError(f"Cache size must not be negative: {maxsize}")
+        self._maxsize = maxsize
+        self._evict()
+
+
+_planCache = _WidgetPlanCache()
+
+
+def widgetPlanCacheInfo() -> WidgetPlanCacheInfo:
+    """
+    Return the statistics of the construction plan cache.
+
+    :func:`dataclass2Widget` compiles the dataclass into a construction plan
+    once, and replays the cached plan on subsequent calls with same arguments.
+    """
+    return _planCache.info()
+
+
+def clearWidgetPlanCache(dcls: Optional[Type["DataclassInstance"]] = None):
+    """
+    Invalidate the construction plans cached by :func:`dataclass2Widget`.
+
+    If *dcls* is passed, only the plans which depend on *dcls* (either directly or
+    as a nested field) are discarded. Else, the whole cache is cleared and the
+    statistics are reset.
+
+    The cache must be invalidated when the dataclass or the namespaces for its
+    forward references are modified in-place, e.g. by hot-reloading.
+    """
+    _planCache.clear(dcls)
+
+
+def setWidgetPlanCacheSize(maxsize: int):
+    """
+    Set the maximum number of plans cached by :func:`dataclass2Widget`.
+
+    Least recently used plans are discarded when the cache is full. Setting
+    ``0`` disables the cache.
+    """
+    _planCache.setMaxsize(maxsize)
+
+
+def _widgetPlan(
+    dcls: Type["DataclassInstance"],
+    field_converter: Callable[[Any], FieldWidgetProtocol],
+    orientation: QtCore.Qt.Orientation,
+    globalns: Optional[Dict],
+    localns: Optional[Dict],
+    include_extras: bool,
+) -> _WidgetPlan:
+    """
+    Get the construction plan of *dcls* from the cache, compiling if absent.
+
+    Plans resolved with custom namespaces are not cached, because namespaces
+    cannot be compared by value and their ids may be reused.
+    """
+    cacheable = globalns is None and localns is None
+    key = (dcls, field_converter, orientation, include_extras)
+    if cacheable:
+        plan = _planCache.get(key)
+        if plan is not None:
+            return plan
+
+    fields = dataclasses.fields(dcls)
+    annots = get_type_hints(dcls, globalns, localns, include_extras)
+
+    steps = []
+    deps = {dcls}
+    for f in fields:
+        typehint = f.metadata.get("Qt_typehint", annots[f.name])
+        if dataclasses.is_dataclass(typehint):
+            subplan = _widgetPlan(
+                typehint,  # type: ignore[arg-type]
+                field_converter,
+                orientation,
+                globalns,
+                localns,
+                include_extras,
+            )
+            factory: Callable[[], FieldWidgetProtocol] = subplan.build
+            deps.update(subplan.dependencies)
+        elif field_converter is type2Widget:
+            factory = _type2WidgetFactory(typehint)
+        else:
+            factory = functools.partial(field_converter, typehint)
+        steps.append((f.name, factory))
+
+    plan = _WidgetPlan(orientation, tuple(steps), frozenset(deps))
+    if cacheable:
+        _planCache.put(key, plan)
+    return plan
+
+
 def dataclass2Widget(
     dcls: Type["DataclassInstance"],
     field_converter: Callable[[Any], FieldWidgetProtocol] = type2Widget,
@@ -286,24 +963,168 @@ def dataclass2Widget(
         Arguments for :func:`get_type_hints` to resolve the forward-referenced
         type annotations.
 
+    Notes
+    =====
+
+    The type hints are resolved only once for the same arguments. The resulting
+    construction plan is cached and replayed to build the widget on the next
+    call. Plans are not cached if *globalns* or *localns* is passed. Use
+    :func:`clearWidgetPlanCache` to invalidate the cache when the dataclass is
+    redefined in-place, and :func:`widgetPlanCacheInfo` to inspect the cache
+    statistics.
+
     """
-    widget = DataWidget(orientation)
-    fields = dataclasses.fields(dcls)
-    annots = get_type_hints(dcls, globalns, localns, include_extras)
+    plan = _widgetPlan(
+        dcls, field_converter, orientation, globalns, localns, include_extras
+    )
+    return plan.build()
 
-    for f in fields:
-        typehint = f.metadata.get("Qt_typehint", annots[f.name])
-        if dataclasses.is_dataclass(typehint):
-            field_w = dataclass2Widget(
-                typehint,
-                field_converter,
-                orientation,
-                globalns,
-                localns,
-                include_extras,
+
+class DataWidgetPoolInfo(NamedTuple):
+    """Statistics of :class:`DataWidgetPool`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    capacity: int
+    size: int
+
+
+class DataWidgetPool:
+    """
+    Bounded pool which recycles the data widgets of the dataclasses.
+
+    :meth:`acquire` returns the pooled widget for the dataclass if any, or builds
+    new one by :func:`dataclass2Widget`. :meth:`release` takes the widget back to
+    the pool after resetting its data value and detaching it from the parent.
+    When the number of pooled widgets exceeds :meth:`capacity`, least recently
+    released widgets are deleted.
+
+    .. code-block:: python
+
+        pool = DataWidgetPool(capacity=8)
+        widget = pool.acquire(DataClass)
+        ...
+        pool.release(widget)
+
+    Widgets are pooled for each combination of the arguments of
+    :func:`dataclass2Widget`. Widgets built with custom namespaces are not
+    pooled, and cannot be released. Only the widgets which are acquired from the
+    pool can be released.
+
+    Notes
+    =====
+
+    The signal connections which are made by the user are not disconnected when
+    the widget is released.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self._capacity = capacity
+        # pooled widgets in release order, and their keys
+        self._pooled: "OrderedDict[DataWidget, tuple]" = OrderedDict()
+        self._widgets: Dict[tuple, list] = {}
+        self._keys: "weakref.WeakKeyDictionary[DataWidget, tuple]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def capacity(self) -> int:
+        """Maximum number of the widgets kept in the pool."""
+        return self._capacity
+
+    def setCapacity(self, capacity: int):
+        self._capacity = capacity
+        self._evict()
+
+    def info(self) -> DataWidgetPoolInfo:
+        return DataWidgetPoolInfo(
+            self._hits, self._misses, self._evictions, self._capacity, len(self)
+        )
+
+    def __len__(self) -> int:
+        return len(self._pooled)
+
+    def acquire(
+        self,
+        dcls: Type["DataclassInstance"],
+        field_converter: Callable[[Any], FieldWidgetProtocol] = type2Widget,
+        orientation: QtCore.Qt.Orientation = QtCore.Qt.Orientation.Vertical,
+        globalns: Optional[Dict] = None,
+        localns: Optional[Dict] = None,
+        include_extras: bool = False,
+    ) -> DataWidget:
+        """
+        Return the data widget for *dcls*, reusing the pooled one if exists.
+
+        The arguments are passed to :func:`dataclass2Widget` to build the new
+        widget. If *globalns* or *localns* is passed, new widget is always built
+        and it is not managed by the pool.
+        """
+        if globalns is not None or localns is not None:
+            return dataclass2Widget(
+                dcls, field_converter, orientation, globalns, localns, include_extras
             )
+        key = (dcls, field_converter, orientation, include_extras)
+        widgets = self._widgets.get(key)
+        if widgets:
+            widget = widgets.pop()
+            if not widgets:
+                del self._widgets[key]
+            del self._pooled[widget]
+            self._hits += 1
         else:
-            field_w = field_converter(typehint)  # type: ignore[assignment]
-        field_w.setFieldName(f.name)
-        widget.addWidget(field_w)
-    return widget
+            widget = dataclass2Widget(
+                dcls, field_converter, orientation, globalns, localns, include_extras
+            )
+            self._keys[widget] = key
+            self._misses += 1
+        return widget
+
+    def release(self, widget: DataWidget) -> bool:
+        """
+        Reset *widget* and take it back to the pool.
+
+        Returns False if *widget* is not acquired from this pool or is already
+        released.
+        """
+        key = self._keys.get(widget)
+        if key is None or widget in self._pooled:
+            return False
+        widget.hide()
+        widget.setParent(None)
+        widget.setDataValue(None)
+        widget.setRequired(False)
+        self._pooled[widget] = key
+        self._widgets.setdefault(key, []).append(widget)
+        self._evict()
+        return True
+
+    def clear(self, dcls: Optional[Type["DataclassInstance"]] = None):
+        """
+        Delete the pooled widgets.
+
+        If *dcls* is passed, only the widgets of *dcls* are deleted. Else, every
+        widget is deleted and the statistics are reset.
+        """
+        for widget, key in list(self._pooled.items()):
+            if dcls is None or key[0] is dcls:
+                self._discard(widget)
+        if dcls is None:
+            self._hits = self._misses = self._evictions = 0
+
+    def _evict(self):
+        while len(self._pooled) > max(self._capacity, 0):
+            self._discard(next(iter(self._pooled)))
+            self._evictions += 1
+
+    def _discard(self, widget: DataWidget):
+        key = self._pooled.pop(widget)
+        widgets = self._widgets[key]
+        widgets.remove(widget)
+        if not widgets:
+            del self._widgets[key]
+        del self._keys[widget]
+        widget.deleteLater()
@@ -5,10 +5,13 @@ Dataclass delegate
 """
 
 import dataclasses
-from .qt_compat import QtWidgets, TypeRole, DataRole
-from .datawidget import DataWidget
+import weakref
+from .qt_compat import QtCore, QtWidgets, TypeRole, DataRole
+from .converter import convertFromQt, convertToQt, _requiredFields
+from .fieldwidgets import RepolishScheduler
+from .datawidget import DataWidget, DataWidgetPool, dataclass2Widget
 from .multitype import DataclassStackedWidget, DataclassTabWidget
-from typing import Dict, Any, Type, Optional
+from typing import Any, Dict, Iterable, Set, Tuple, Type, Optional
 
 from typing import TYPE_CHECKING
 
@@ -25,223 +28,80 @@ __all__ = [
 ]
 
 
-def convertFromQt(
-    dcls: Type["DataclassInstance"],
-    data: Dict[str, Any],
-    ignoreMissing=True,
-) -> Dict[str, Any]:
-    """
-    Convert the dict from :class:`DataWidget` to structured dict for dataclass.
-
-    If the field value does not exist in *data* or is :obj:`None`, it is
-    considered to be absent. If *ignoreMissing* is True, the absent value is not
-    included in the resulting dictionary. Else, the default value of the field is
-    used if there is any.
-
-    Field may define ``fromQt_converter`` metadata to convert the widget data to
-    field data. It is a unary callable which takes the widget data and returns
-    the field data.
-
-    Examples
-    ========
-
-    ``None`` is considered as missing value.
-
-    >>> from dataclasses import dataclass, field
-    >>> from dawiq.delegate import convertFromQt
-    >>> from typing import Optional
-    >>> @dataclass
-    ... class Cls1:
-    ...     a: int
-    ...     b: int = 10
-    ...     c: Optional[int] = None
-    ...     d: list = field(default_factory=list)
-    >>> convertFromQt(Cls1, {})
-    {}
-    >>> convertFromQt(Cls1, dict(a=1, b=None, c=None))
-    {'a': 1}
-
-    *ignoreMissing* controls whether the default value should be used.
-
-    >>> convertFromQt(Cls1, {}, ignoreMissing=False)
-    {'b': 10, 'c': None, 'd': []}
-
-    Nested dataclasses are recusively converted.
-
-    >>> @dataclass
-    ... class Cls2:
-    ...     x: int = 20
-    ...     y: Cls1 = field(default_factory=lambda: Cls1(a=5))
-    >>> convertFromQt(Cls2, {}, ignoreMissing=False)
-    {'x': 20, 'y': {'a': 5, 'b': 10, 'c': None, 'd': []}}
-
-    ``fromQt_converter`` metadata converts the data from the widet.
-
-    >>> def conv(arg):
-    ...     return (arg,)
-    >>> @dataclass
-    ... class Cls3:
-    ...     x: tuple = field(default=(1,), metadata=dict(fromQt_converter=conv))
-    >>> convertFromQt(Cls3, dict(x=1))
-    {'x': (1,)}
+# dataclass which each data widget was last highlighted with
+_highlightedDataclass: "weakref.WeakKeyDictionary[DataWidget, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
+def highlightEmptyField(editor: DataWidget, dcls: Optional[Type["DataclassInstance"]]):
     """
-    # Return value is not dataclass but dictionary because necessary fields might
-    # be missing from the widget.
-    ret: Dict[str, Any] = {}
-    for f in dataclasses.fields(dcls):
-        val = data.get(f.name, None)
-        t = f.type
-
-        if val is None:
-            if ignoreMissing:
-                continue
-            val = (
-                f.default_factory()
-                if f.default_factory is not dataclasses.MISSING
-                else f.default
-            )
-            if val is dataclasses.MISSING:
-                if dataclasses.is_dataclass(t):
-                    val = convertFromQt(t, {}, ignoreMissing)
-                else:
-                    continue
-            if dataclasses.is_dataclass(val) and not isinstance(val, type):
-                val = dataclasses.asdict(val)
+    Recursively highlight the empty field whose data is required.
 
+    Whether each field is required is determined only by the absence of default
+    value and default factory, and is cached for *dcls*. When *editor* is again
+    highlighted with same *dcls*, only the required fields are visited because
+    the other fields cannot be highlighted.
+    """
+    if dcls is None:
+        editor.setRequired(False)
+        _highlightedDataclass[editor] = None
+        return
+
+    if not isinstance(dcls, type):
+        dcls = type(dcls)
+    visitAll = _highlightedDataclass.get(editor, None) is not dcls
+    for name, required, nested in _requiredFields(dcls):
+        if not (required or visitAll):
+            continue
+        widget = editor.widgetByName(name)
+        if widget is None:  # no widget for field
+            continue
+        if isinstance(widget, DataWidget) and nested is not None:
+            highlightEmptyField(widget, nested)
         else:
-            if dataclasses.is_dataclass(t):
-                val = convertFromQt(t, val, ignoreMissing)
-            converter = f.metadata.get("fromQt_converter", None)
-            if converter is not None:
-                val = converter(val)
-        ret[f.name] = val
-    return ret
+            widget.setRequired(required)
+            if isinstance(widget, DataWidget):
+                _highlightedDataclass.pop(widget, None)
+    _highlightedDataclass[editor] = dcls
 
 
-def convertToQt(
-    dcls: Type["DataclassInstance"],
-    data: Dict[str, Any],
-    ignoreMissing=True,
+def _mergePaths(
+    oldData: Dict[str, Any], newData: Dict[str, Any], paths: Iterable[Tuple[str, ...]]
 ) -> Dict[str, Any]:
     """
-    Convert structured dict from dataclass to dict for :class:`DataWidget`.
-
-    If the field value does not exist in *data* or is :obj:`None`, it is
-    considered to be absent. If *ignoreMissing* is True, ``None`` is used as the
-    placeholder in the resulting dictionary. Else, the default value of the field
-    is used if there is any.
-
-    Field may define ``toQt_converter`` metadata to convert the field data to
-    widget data. It is a unary callable which takes the field data and returns
-    the widget data.
-
-    Examples
-    ========
-
-    ``None`` is considered as missing value.
-
-    >>> from dataclasses import dataclass, field
-    >>> from dawiq.delegate import convertToQt
-    >>> from typing import Optional
-    >>> @dataclass
-    ... class Cls1:
-    ...     a: int
-    ...     b: int = 10
-    ...     c: Optional[int] = None
-    ...     d: list = field(default_factory=list)
-    >>> convertToQt(Cls1, dict(a=1, b=2, c=3))
-    {'a': 1, 'b': 2, 'c': 3, 'd': None}
-    >>> convertToQt(Cls1, {})
-    {'a': None, 'b': None, 'c': None, 'd': None}
-
-    *ignoreMissing* controls whether the default value should be used.
-
-    >>> convertToQt(Cls1, {}, ignoreMissing=False)
-    {'a': None, 'b': 10, 'c': None, 'd': []}
-
-    Nested dataclasses are recusively converted.
-
-    >>> @dataclass
-    ... class Cls2:
-    ...     x: int = 20
-    ...     y: Cls1 = field(default_factory=lambda: Cls1(a=5))
-    >>> convertToQt(Cls2, {}, ignoreMissing=False)
-    {'x': 20, 'y': {'a': 5, 'b': 10, 'c': None, 'd': []}}
-
-    ``toQt_converter`` metadata converts the data to the widget.
-
-    >>> @dataclass
-    ... class Cls3:
-    ...     x: int = field(metadata=dict(toQt_converter=lambda tup: tup[0]))
-    >>> convertToQt(Cls3, dict(x=(1,)))
-    {'x': 1}
+    Return the copy of *oldData* where the values at *paths* are replaced by
+    those of *newData*. Nested dictionaries of *oldData* are not modified.
 
+    If the path does not lead to the nested dictionary in both data, the value
+    at its longest common prefix is replaced instead. Value which is absent in
+    *newData* is removed.
     """
-    ret: Dict[str, Any] = {}
-    for f in dataclasses.fields(dcls):
-        val = data.get(f.name, None)
-        t = f.type
-
-        if val is None:
-            if ignoreMissing:
-                ret[f.name] = None
-                continue
-            val = (
-                f.default_factory()
-                if f.default_factory is not dataclasses.MISSING
-                else f.default
-            )
-            if val is dataclasses.MISSING:
-                if dataclasses.is_dataclass(t):
-                    val = convertToQt(t, {}, ignoreMissing)
-                else:
-                    ret[f.name] = None
-                    continue
-            if dataclasses.is_dataclass(val) and not isinstance(val, type):
-                val = dataclasses.asdict(val)
-
+    ret = dict(oldData)
+    for path in paths:
+        src, dst = newData, ret
+        for i, key in enumerate(path[:-1]):
+            srcChild, dstChild = src.get(key), dst.get(key)
+            if not isinstance(srcChild, dict) or not isinstance(dstChild, dict):
+                path = path[: i + 1]
+                break
+            dstChild = dict(dstChild)
+            dst[key] = dstChild
+            src, dst = srcChild, dstChild
+        key = path[-1]
+        if key in src:
+            dst[key] = src[key]
         else:
-            if dataclasses.is_dataclass(t):
-                val = convertToQt(t, val, ignoreMissing)
-            converter = f.metadata.get("toQt_converter", None)
-            if converter is not None:
-                val = converter(val)
-        ret[f.name] = val
+            dst.pop(key, None)
     return ret
 
 
-def highlightEmptyField(editor: DataWidget, dcls: Optional[Type["DataclassInstance"]]):
-    """Recursively highlight the empty field whose data is required."""
-    if dcls is None:
-        editor.setRequired(False)
-    else:
-        # get field widgets from *editor*
-        field_widgets = {}
-        for i in range(editor.count()):
-            widget = editor.widget(i)
-            if widget is None:
-                continue
-            field_widgets[widget.fieldName()] = widget
-
-        # if the field does not have default value, the field is required.
-        for f in dataclasses.fields(dcls):
-            widget = field_widgets.pop(f.name, None)
-            if widget is None:  # no widget for field
-                continue
-            default = (
-                f.default_factory()
-                if f.default_factory is not dataclasses.MISSING
-                else f.default
-            )
-            required = default is dataclasses.MISSING
-            if isinstance(widget, DataWidget):
-                if required and dataclasses.is_dataclass(f.type):
-                    highlightEmptyField(widget, f.type)
-                else:
-                    widget.setRequired(required)
-            else:
-                widget.setRequired(required)
+def _isSubclass(dcls: Any, base: Any) -> bool:
+    return isinstance(dcls, type) and isinstance(base, type) and issubclass(dcls, base)
+
+
+def _fieldNames(dcls: Any) -> Set[str]:
+    return {f.name for f in dataclasses.fields(dcls)}
 
 
 class DataclassDelegate(QtWidgets.QStyledItemDelegate):
@@ -260,9 +120,18 @@ class DataclassDelegate(QtWidgets.QStyledItemDelegate):
     Dataclass type is stored to the model with :attr:`TypeRole` as item data role
     and dataclass data is stored with :attr:`DataRole`.
 
+    When the item of a subclass is edited by the page of its base class in
+    :class:`DataclassStackedWidget` or :class:`DataclassTabWidget`, the type of
+    the item is kept and the fields which only the subclass has are preserved.
+
     By default, missing values are not replaced by default values of the fields.
     This is to preserve the intentional empty input by the user. Setting
     :meth:`ignoreMissing` changes this behavior.
+
+    When this delegate is set to item view of single-column model, the item which
+    has dataclass data but no display data is painted as the summary text from
+    :meth:`summaryText` without constructing any widget. :class:`DataWidget` is
+    built by :meth:`createEditor` only when the item is edited.
     """
 
     TypeRole = TypeRole
@@ -271,6 +140,8 @@ class DataclassDelegate(QtWidgets.QStyledItemDelegate):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._ignoreMissing = True
+        self._partialUpdate = False
+        self._editorPool: Optional[DataWidgetPool] = None
 
     def ignoreMissing(self) -> bool:
         """If True, default values are used for missing fields."""
@@ -279,20 +150,155 @@ class DataclassDelegate(QtWidgets.QStyledItemDelegate):
     def setIgnoreMissing(self, val: bool):
         self._ignoreMissing = val
 
+    def summaryText(self, index) -> Optional[str]:
+        """
+        Return the text which summarizes the dataclass data of *index*.
+
+        Only the item of single-column model is summarized, because the model
+        with multiple columns is assumed to display each field in its own
+        column. If *index* has display data or has no dataclass data, None is
+        returned. Subclass may reimplement this method to change the summary.
+        """
+        model = index.model()
+        if model is None or model.columnCount(index.parent()) != 1:
+            return None
+        if index.data(QtCore.Qt.ItemDataRole.DisplayRole) is not None:
+            return None
+        data = index.data(role=self.DataRole)
+        if not isinstance(data, dict):
+            return None
+        dcls = index.data(role=self.TypeRole)
+        args = ", ".join(f"{k}={v!r}" for k, v in data.items())
+        if dcls is None:
+            return f"{{{args}}}"
+        return f"{getattr(dcls, '__name__', dcls)}({args})"
+
+    def _summaryOption(self, option, index):
+        text = self.summaryText(index)
+        if text is None:
+            return None
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.features |= QtWidgets.QStyleOptionViewItem.ViewItemFeature.HasDisplay
+        opt.text = text
+        return opt
+
+    def paint(self, painter, option, index):
+        opt = self._summaryOption(option, index)
+        if opt is None:
+            super().paint(painter, option, index)
+            return
+        widget = opt.widget
+        style = widget.style() if widget is not None else QtWidgets.QApplication.style()
+        style.drawControl(
+            QtWidgets.QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget
+        )
+
+    def sizeHint(self, option, index):
+        opt = self._summaryOption(option, index)
+        if opt is None:
+            return super().sizeHint(option, index)
+        widget = opt.widget
+        style = widget.style() if widget is not None else QtWidgets.QApplication.style()
+        return style.sizeFromContents(
+            QtWidgets.QStyle.ContentsType.CT_ItemViewItem, opt, QtCore.QSize(), widget
+        )
+
+    def createEditor(self, parent, option, index):
+        dcls = index.data(role=self.TypeRole)
+        if not isinstance(dcls, type) or not dataclasses.is_dataclass(dcls):
+            return super().createEditor(parent, option, index)
+        pool = self.editorPool()
+        if pool is not None:
+            editor = pool.acquire(dcls)
+        else:
+            editor = dataclass2Widget(dcls)
+        editor.setParent(parent)
+        editor.setAutoFillBackground(True)
+        return editor
+
+    def destroyEditor(self, editor, index):
+        pool = self.editorPool()
+        if pool is not None and isinstance(editor, DataWidget) and pool.release(editor):
+            return
+        super().destroyEditor(editor, index)
+
+    def editorPool(self) -> Optional[DataWidgetPool]:
+        """
+        Pool which recycles the editors built by :meth:`createEditor`.
+
+        By default no pool is set, and the editor is built every time.
+        """
+        return self._editorPool
+
+    def setEditorPool(self, pool: Optional[DataWidgetPool]):
+        self._editorPool = pool
+
+    def updateEditorGeometry(self, editor, option, index):
+        if not isinstance(editor, DataWidget):
+            super().updateEditorGeometry(editor, option, index)
+            return
+        rect = QtCore.QRect(option.rect)
+        rect.setHeight(max(rect.height(), editor.sizeHint().height()))
+        editor.setGeometry(rect)
+
+    def partialUpdate(self) -> bool:
+        """
+        If True, only the edited fields of :class:`DataWidget` are written.
+
+        By default, whole data is converted and written to the model. In partial
+        update mode, the paths from :meth:`DataWidget.editedPaths` are merged
+        into the existing data of the model and :meth:`cachePartialModelData` is
+        called. If no field is edited, nothing is written. Whole data is written
+        if the model does not have the data or if the dataclass type changes.
+        """
+        return self._partialUpdate
+
+    def setPartialUpdate(self, val: bool):
+        self._partialUpdate = val
+
     def setModelData(self, editor, model, index):
         if isinstance(editor, (DataclassStackedWidget, DataclassTabWidget)):
             dcls = editor.currentDataclass()
-            self.cacheModelData(model, index, dcls, self.TypeRole)
-            self.setModelData(editor.currentWidget(), model, index)
+            rowType = model.data(index, role=self.TypeRole)
+            if _isSubclass(rowType, dcls):
+                # page of the base class edits the row; keep the row's own type
+                typeChanged = False
+            else:
+                typeChanged = rowType is not dcls
+                self.cacheModelData(model, index, dcls, self.TypeRole)
+            widget = editor.currentWidget()
+            if isinstance(widget, DataWidget):
+                self._setDataWidgetModelData(widget, model, index, typeChanged, dcls)
+            else:
+                self.setModelData(widget, model, index)
 
         elif isinstance(editor, DataWidget):
-            dcls = model.data(index, role=self.TypeRole)
-            data = editor.dataValue()
-            if dcls is not None:
-                data = convertFromQt(dcls, data, self.ignoreMissing())
-            self.cacheModelData(model, index, data, self.DataRole)
+            self._setDataWidgetModelData(editor, model, index, False, None)
 
-        super().setModelData(editor, model, index)
+        else:
+            # DataWidget is QGroupBox whose user property must not be stored
+            super().setModelData(editor, model, index)
+
+    def _setDataWidgetModelData(self, editor, model, index, typeChanged, editorType):
+        dcls = model.data(index, role=self.TypeRole)
+        data = editor.dataValue()
+        if dcls is not None:
+            data = convertFromQt(dcls, data, self.ignoreMissing())
+
+        oldData = model.data(index, role=self.DataRole)
+        if editorType not in (None, dcls) and isinstance(oldData, dict):
+            # fields of the subclass which the editor of base class does not have
+            names = _fieldNames(dcls) - _fieldNames(editorType)
+            data.update((k, v) for k, v in oldData.items() if k in names)
+        if self.partialUpdate() and not typeChanged and isinstance(oldData, dict):
+            paths = editor.editedPaths()
+            if paths:
+                data = _mergePaths(oldData, data, paths)
+                self.cachePartialModelData(model, index, data, paths)
+        else:
+            self.cacheModelData(model, index, data, self.DataRole)
+        editor.clearEditedPaths()
 
     @classmethod
     def cacheModelData(cls, model, index, value, role):
@@ -309,6 +315,21 @@ class DataclassDelegate(QtWidgets.QStyledItemDelegate):
         """
         model.setData(index, value, role)
 
+    @classmethod
+    def cachePartialModelData(cls, model, index, value, paths):
+        """
+        Cache the partially updated data to *model*'s *index* in partial update
+        mode.
+
+        *value* is the whole data where the fields at *paths* are updated.
+        *paths* is the set of tuples of the field names. By default, this method
+        calls :meth:`cacheModelData` with *value*.
+
+        Subclass may reimplement this method to write only the updated fields.
+
+        """
+        cls.cacheModelData(model, index, value, cls.DataRole)
+
     def setEditorData(self, editor, index):
         if isinstance(editor, (DataclassStackedWidget, DataclassTabWidget)):
             dcls = index.data(role=self.TypeRole)
@@ -326,10 +347,12 @@ class DataclassDelegate(QtWidgets.QStyledItemDelegate):
                 data = {}
             if dcls is not None:
                 data = convertToQt(dcls, data, self.ignoreMissing())
-            editor.setDataValue(data)
-            highlightEmptyField(editor, dcls)
+            with RepolishScheduler.instance().deferring():
+                editor.setDataValue(data)
+                highlightEmptyField(editor, dcls)
 
-        super().setEditorData(editor, index)
+        else:
+            super().setEditorData(editor, index)
 
 
 class DataclassMapper(QtWidgets.QDataWidgetMapper):
@@ -342,6 +365,11 @@ class DataclassMapper(QtWidgets.QDataWidgetMapper):
     * :class:`DataclassStackedWidget`
     * :class:`DataclassTabWidget`
 
+    When the mapped widget is edited, the data is submitted to the model. By
+    default it is submitted immediately, but :meth:`setSubmitDelay` can merge
+    the burst of edits into one model write. Pending submission is flushed
+    before the current index changes, or by calling :meth:`flush`.
+
     Notes
     =====
 
@@ -352,23 +380,102 @@ class DataclassMapper(QtWidgets.QDataWidgetMapper):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setSubmitPolicy(self.SubmitPolicy.ManualSubmit)
+        self._submitDelay = -1
+        self._submitTimer = QtCore.QTimer(self)
+        self._submitTimer.setSingleShot(True)
+        self._submitTimer.timeout.connect(self.submit)
+
+    def submitDelay(self) -> int:
+        """
+        Delay in milliseconds to submit the edited data to the model.
+
+        Negative value means that the data is submitted immediately, which is
+        the default. Zero means that the data is submitted when the event loop
+        becomes idle. Positive value means that the data is submitted when the
+        widget is not edited for the time.
+        """
+        return self._submitDelay
+
+    def setSubmitDelay(self, msec: int):
+        self._submitDelay = msec
+        if msec < 0:
+            self.flush()
+
+    def hasPendingSubmit(self) -> bool:
+        """Return True if the edited data is waiting to be submitted."""
+        return self._submitTimer.isActive()
+
+    def requestSubmit(self):
+        """Submit the data to the model according to :meth:`submitDelay`."""
+        if self._submitDelay < 0:
+            self.submit()
+        else:
+            self._submitTimer.start(self._submitDelay)
+
+    def flush(self) -> bool:
+        """
+        Immediately submit the pending data to the model.
+
+        Returns False if submitting failed. If no data is pending, returns True.
+        """
+        if not self._submitTimer.isActive():
+            return True
+        self._submitTimer.stop()
+        return self.submit()
+
+    def submit(self) -> bool:
+        self._submitTimer.stop()
+        return super().submit()
+
+    def revert(self):
+        self._submitTimer.stop()
+        super().revert()
+
+    def setCurrentIndex(self, index):
+        self.flush()
+        super().setCurrentIndex(index)
+
+    def setCurrentModelIndex(self, index):
+        self.flush()
+        super().setCurrentModelIndex(index)
+
+    def toFirst(self):
+        self.flush()
+        super().toFirst()
+
+    def toLast(self):
+        self.flush()
+        super().toLast()
+
+    def toNext(self):
+        self.flush()
+        super().toNext()
+
+    def toPrevious(self):
+        self.flush()
+        super().toPrevious()
+
+    def clearMapping(self):
+        self.flush()
+        super().clearMapping()
 
     def addMapping(self, widget, section, propertyName=b""):
         if isinstance(widget, DataclassStackedWidget):
-            widget.currentDataEdited.connect(self.submit)
+            widget.currentDataEdited.connect(self.requestSubmit)
         elif isinstance(widget, DataclassTabWidget):
-            widget.activated.connect(self.submit)
-            widget.currentDataEdited.connect(self.submit)
+            widget.activated.connect(self.requestSubmit)
+            widget.currentDataEdited.connect(self.requestSubmit)
         elif isinstance(widget, DataWidget):
-            widget.dataEdited.connect(self.submit)
+            widget.dataEdited.connect(self.requestSubmit)
         super().addMapping(widget, section, propertyName)
 
     def removeMapping(self, widget):
+        self.flush()
         if isinstance(widget, DataclassStackedWidget):
-            widget.currentDataEdited.disconnect(self.submit)
+            widget.currentDataEdited.disconnect(self.requestSubmit)
         elif isinstance(widget, DataclassTabWidget):
-            widget.activated.disconnect(self.submit)
-            widget.currentDataEdited.disconnect(self.submit)
+            widget.activated.disconnect(self.requestSubmit)
+            widget.currentDataEdited.disconnect(self.requestSubmit)
         elif isinstance(widget, DataWidget):
-            widget.dataEdited.disconnect(self.submit)
+            widget.dataEdited.disconnect(self.requestSubmit)
         super().removeMapping(widget)
@@ -8,22 +8,181 @@ dataclass. Widgets are compatible to :class:`dawiq.typing.FieldWidgetProtocol`.
 
 from .qt_compat import QtCore, QtWidgets, QtGui
 from enum import Enum
-from typing import Optional, Union, Tuple, TypeVar, Type, Any
+import bisect
+import contextlib
+import functools
+import sys
+from typing import (
+    Optional,
+    Union,
+    Tuple,
+    TypeVar,
+    Type,
+    Any,
+    Dict,
+    Callable,
+    Iterator,
+    List,
+    Iterable,
+    NamedTuple,
+)
 from .typing import FieldWidgetProtocol
 
 
 __all__ = [
+    "RepolishScheduler",
     "BoolCheckBox",
     "EmptyIntValidator",
     "IntLineEdit",
     "EmptyFloatValidator",
     "FloatLineEdit",
     "StrLineEdit",
+    "EnumItemModel",
     "EnumComboBox",
+    "FieldWriteInfo",
     "TupleGroupBox",
+    "SequenceItemModel",
+    "SequenceItemDelegate",
+    "SequenceGroupBox",
+    "ArrayTableModel",
+    "ArrayGroupBox",
+    "MappingItemModel",
+    "MappingGroupBox",
 ]
 
 
+class RepolishScheduler(QtCore.QObject):
+    """
+    Object to set the dynamic properties of widgets and re-polish them.
+
+    Style sheet does not reflect the change of dynamic property until the widget
+    is re-polished, which is expensive. :meth:`setWidgetProperty` sets the
+    property and re-polishes the widget immediately by default. Between
+    :meth:`beginDefer` and :meth:`endDefer`, the widgets are collected instead
+    and re-polished once at the end of current event loop iteration.
+
+    Field widgets in :mod:`dawiq` use the global instance from :meth:`instance`
+    to set ``requiresFieldValue`` property, and :class:`.DataclassDelegate`
+    defers re-polishing while setting the editor data.
+
+    .. code-block:: python
+
+        scheduler = RepolishScheduler.instance()
+        with scheduler.deferring():
+            for widget in widgets:
+                widget.setRequired(True)
+
+    Re-polishing is saved when the property of a pending widget is changed again,
+    or when it returns to its value at the last re-polish. The number of saved
+    re-polishes is returned by :meth:`savedCount`.
+    """
+
+    _instance: Optional["RepolishScheduler"] = None
+
+    @classmethod
+    def instance(cls) -> "RepolishScheduler":
+        """Global instance which is used by the field widgets."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._deferDepth = 0
+        # widget -> {property name: value at the last re-polish}
+        self._pending: Dict[QtWidgets.QWidget, Dict[str, Any]] = {}
+        self._savedCount = 0
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+
+    def setWidgetProperty(self, widget: QtWidgets.QWidget, name: str, value: Any):
+        """Set the dynamic property of *widget* and re-polish it if changed."""
+        old = widget.property(name)
+        if old == value:
+            return
+        widget.setProperty(name, value)
+        if self._deferDepth == 0 and not self._pending:
+            self._repolish(widget)
+            return
+        properties = self._pending.setdefault(widget, {})
+        if properties:
+            self._savedCount += 1
+        properties.setdefault(name, old)
+        if self._deferDepth == 0:
+            self._timer.start()
+
+    def beginDefer(self):
+        """Start deferring the re-polish. Calls can be nested."""
+        self._deferDepth += 1
+
+    def endDefer(self):
+        """
+        Finish deferring which is started by :meth:`beginDefer`.
+
+        When the outermost deferring finishes, the pending widgets are scheduled
+        to be re-polished at the end of the current event loop iteration.
+        """
+        if self._deferDepth == 0:
+            raise RuntimeError("endDefer() called without beginDefer()")
+        self._deferDepth -= 1
+        if self._deferDepth == 0 and self._pending:
+            self._timer.start()
+
+    @contextlib.contextmanager
+    def deferring(self) -> Iterator["RepolishScheduler"]:
+        """Context manager which wraps :meth:`beginDefer` and :meth:`endDefer`."""
+        self.beginDefer()
+        try:
+            yield self
+        finally:
+            self.endDefer()
+
+    def isDeferring(self) -> bool:
+        return self._deferDepth > 0
+
+    def pendingCount(self) -> int:
+        """Number of widgets waiting for re-polish."""
+        return len(self._pending)
+
+    def savedCount(self) -> int:
+        """Number of re-polishes which have been saved by deferring."""
+        return self._savedCount
+
+    def flush(self):
+        """Immediately re-polish the pending widgets."""
+        self._timer.stop()
+        pending, self._pending = self._pending, {}
+        for widget, properties in pending.items():
+            try:
+                changed = any(widget.property(k) != v for k, v in properties.items())
+                if changed:
+                    self._repolish(widget)
+                else:
+                    self._savedCount += 1
+            except RuntimeError:  # widget is already deleted
+                continue
+
+    def _repolish(self, widget: QtWidgets.QWidget):
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+
+
+# Field value of each check state, including the integer values of the states
+_CHECKSTATE_VALUES: Dict[Any, Optional[bool]] = {}
+for _state, _value in [
+    (QtCore.Qt.CheckState.Checked, True),
+    (QtCore.Qt.CheckState.Unchecked, False),
+    (QtCore.Qt.CheckState.PartiallyChecked, None),
+]:
+    _CHECKSTATE_VALUES[_state] = _value
+    _CHECKSTATE_VALUES[getattr(_state, "value", _state)] = _value
+del _state, _value
+
+
 class BoolCheckBox(QtWidgets.QCheckBox):
     """
     Checkbox for fuzzy boolean value.
@@ -46,14 +205,7 @@ class BoolCheckBox(QtWidgets.QCheckBox):
         self.clicked.connect(self.fieldEdited)
 
     def fieldValue(self) -> Optional[bool]:
-        checkstate = self.checkState()
-        if checkstate == QtCore.Qt.CheckState.Checked:
-            state = True
-        elif checkstate == QtCore.Qt.CheckState.Unchecked:
-            state = False
-        else:
-            state = None
-        return state
+        return _CHECKSTATE_VALUES.get(self.checkState())
 
     def setFieldValue(self, value: Optional[bool]):
         if value is None and not self.isTristate():
@@ -71,14 +223,7 @@ class BoolCheckBox(QtWidgets.QCheckBox):
         self.setCheckState(state)
 
     def _onStateChange(self, checkstate: Union[int, QtCore.Qt.CheckState]):
-        checkstate = QtCore.Qt.CheckState(checkstate)
-        if checkstate == QtCore.Qt.CheckState.Checked:
-            state = True
-        elif checkstate == QtCore.Qt.CheckState.Unchecked:
-            state = False
-        else:
-            state = None
-        self.fieldValueChanged.emit(state)
+        self.fieldValueChanged.emit(_CHECKSTATE_VALUES.get(checkstate))
 
     def fieldName(self) -> str:
         return self.text()
@@ -111,6 +256,9 @@ class IntLineEdit(QtWidgets.QLineEdit):
     integer, ``None`` is the field value. Setting ``None`` as field value clears
     the line edit.
 
+    The converted value is cached with the text, so that the text is parsed only
+    once when it changes.
+
     """
 
     fieldValueChanged = QtCore.Signal(object)
@@ -120,39 +268,38 @@ class IntLineEdit(QtWidgets.QLineEdit):
         super().__init__(parent)
 
         self.setValidator(EmptyIntValidator(self))
+        # last parsed text and its value
+        self._parsed: Tuple[str, Optional[int]] = ("", None)
 
         self.textChanged.connect(self._onTextChange)
         self.editingFinished.connect(self.fieldEdited)
 
-    def fieldValue(self) -> Optional[int]:
-        text = self.text()
-        if not text:
-            val: Optional[int] = None
-        else:
+    def _parse(self, text: str) -> Optional[int]:
+        cachedText, val = self._parsed
+        if text != cachedText:
             try:
-                val = int(text)
+                val = int(text) if text else None
             except ValueError:
                 val = None
+            self._parsed = (text, val)
         return val
 
+    def fieldValue(self) -> Optional[int]:
+        return self._parse(self.text())
+
     def setFieldValue(self, value: Optional[int]):
         if value is None:
             txt = ""
         elif isinstance(value, int):
-            txt = str(int(value))
+            value = int(value)
+            txt = str(value)
         else:
             raise TypeError(f"IntLineEdit value must be int, not {type(value)}")
+        self._parsed = (txt, value)
         self.setText(txt)
 
     def _onTextChange(self, text: str):
-        if not text:
-            val: Optional[int] = None
-        else:
-            try:
-                val = int(text)
-            except ValueError:
-                val = None
-        self.fieldValueChanged.emit(val)
+        self.fieldValueChanged.emit(self._parse(text))
 
     def fieldName(self) -> str:
         return self.placeholderText()
@@ -166,10 +313,9 @@ class IntLineEdit(QtWidgets.QLineEdit):
             requires = True
         else:
             requires = False
-        if self.property("requiresFieldValue") != requires:
-            self.setProperty("requiresFieldValue", requires)
-            self.style().unpolish(self)
-            self.style().polish(self)
+        RepolishScheduler.instance().setWidgetProperty(
+            self, "requiresFieldValue", requires
+        )
 
 
 class EmptyFloatValidator(QtGui.QDoubleValidator):
@@ -190,6 +336,9 @@ class FloatLineEdit(QtWidgets.QLineEdit):
     converted to. If the line edit is empty or the text cannot be converted to
     float, ``None`` is the field value. Setting ``None`` as field value clears
     the line edit.
+
+    The converted value is cached with the text, so that the text is parsed only
+    once when it changes.
     """
 
     fieldValueChanged = QtCore.Signal(object)
@@ -199,39 +348,38 @@ class FloatLineEdit(QtWidgets.QLineEdit):
         super().__init__(parent)
 
         self.setValidator(EmptyFloatValidator(self))
+        # last parsed text and its value
+        self._parsed: Tuple[str, Optional[float]] = ("", None)
 
         self.textChanged.connect(self._onTextChange)
         self.editingFinished.connect(self.fieldEdited)
 
-    def fieldValue(self) -> Optional[float]:
-        text = self.text()
-        if not text:
-            val: Optional[float] = None
-        else:
+    def _parse(self, text: str) -> Optional[float]:
+        cachedText, val = self._parsed
+        if text != cachedText:
             try:
-                val = float(text)
+                val = float(text) if text else None
             except ValueError:
                 val = None
+            self._parsed = (text, val)
         return val
 
+    def fieldValue(self) -> Optional[float]:
+        return self._parse(self.text())
+
     def setFieldValue(self, value: Optional[float]):
         if value is None:
             txt = ""
         elif isinstance(value, float):
-            txt = str(float(value))
+            value = float(value)
+            txt = str(value)
         else:
             raise TypeError(f"FloatLineEdit value must be float, not {type(value)}")
+        self._parsed = (txt, value)
         self.setText(txt)
 
     def _onTextChange(self, text: str):
-        if not text:
-            val: Optional[float] = None
-        else:
-            try:
-                val = float(text)
-            except ValueError:
-                val = None
-        self.fieldValueChanged.emit(val)
+        self.fieldValueChanged.emit(self._parse(text))
 
     def fieldName(self) -> str:
         return self.placeholderText()
@@ -245,10 +393,9 @@ class FloatLineEdit(QtWidgets.QLineEdit):
             requires = True
         else:
             requires = False
-        if self.property("requiresFieldValue") != requires:
-            self.setProperty("requiresFieldValue", requires)
-            self.style().unpolish(self)
-            self.style().polish(self)
+        RepolishScheduler.instance().setWidgetProperty(
+            self, "requiresFieldValue", requires
+        )
 
 
 class StrLineEdit(QtWidgets.QLineEdit):
@@ -295,24 +442,136 @@ class StrLineEdit(QtWidgets.QLineEdit):
             requires = True
         else:
             requires = False
-        if self.property("requiresFieldValue") != requires:
-            self.setProperty("requiresFieldValue", requires)
-            self.style().unpolish(self)
-            self.style().polish(self)
+        RepolishScheduler.instance().setWidgetProperty(
+            self, "requiresFieldValue", requires
+        )
 
 
 T = TypeVar("T", bound="EnumComboBox")
 
 
+def _flagValue(flag: Any) -> int:
+    """Integer value of Qt flag, for both enum and integer flag types."""
+    return int(getattr(flag, "value", flag))
+
+
+class EnumItemModel(QtCore.QAbstractListModel):
+    """
+    Read-only list model of the members of :class:`enum.Enum`.
+
+    N-th row is N-th member of the Enum. Display role returns the name of the
+    member and user role returns the member itself. The model of each Enum is
+    shared by :class:`EnumComboBox` instances, and is returned by
+    :meth:`forEnum`.
+
+    :meth:`rowOfMember` looks up the row in constant time. Keyboard search of
+    the views uses :meth:`rowsWithPrefix`, which searches the index of sorted
+    member names. The index is built when it is first used.
+    """
+
+    _shared: Dict[Type[Enum], "EnumItemModel"] = {}
+
+    @classmethod
+    def forEnum(cls, enum: Type[Enum]) -> "EnumItemModel":
+        """Shared model of *enum*, which is constructed at the first call."""
+        model = cls._shared.get(enum)
+        if model is None:
+            model = cls._shared[enum] = cls(enum)
+        return model
+
+    def __init__(self, enum: Type[Enum], parent=None):
+        super().__init__(parent)
+        self._enum = enum
+        self._members = list(enum)
+        self._names = [e.name for e in self._members]
+        self._rows = {e: i for i, e in enumerate(self._members)}
+        # sorted (folded name, row) pairs
+        self._prefixIndex: Optional[List[Tuple[str, int]]] = None
+
+    def enum(self) -> Type[Enum]:
+        return self._enum
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._members)
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.ItemFlag.NoItemFlags
+        return QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (
+            QtCore.Qt.ItemDataRole.DisplayRole,
+            QtCore.Qt.ItemDataRole.EditRole,
+            QtCore.Qt.ItemDataRole.ToolTipRole,
+        ):
+            return self._names[index.row()]
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            return self._members[index.row()]
+        return None
+
+    def rowOfMember(self, member: Enum) -> int:
+        """Return the row of *member*, or -1 if it is not in the model."""
+        return self._rows.get(member, -1)
+
+    def rowsWithPrefix(self, prefix: str, caseSensitive: bool = False) -> List[int]:
+        """Return the sorted rows of the members whose names start with *prefix*."""
+        if self._prefixIndex is None:
+            self._prefixIndex = sorted(
+                (name.casefold(), row) for row, name in enumerate(self._names)
+            )
+        key = prefix.casefold()
+        rows = []
+        i = bisect.bisect_left(self._prefixIndex, (key, -1))
+        for name, row in self._prefixIndex[i:]:
+            if not name.startswith(key):
+                break
+            if caseSensitive and not self._names[row].startswith(prefix):
+                continue
+            rows.append(row)
+        rows.sort()
+        return rows
+
+    def match(self, start, role, value, hits=1, flags=None):
+        if flags is None:
+            flags = QtCore.Qt.MatchFlag.MatchStartsWith | QtCore.Qt.MatchFlag.MatchWrap
+        flagValue = _flagValue(flags)
+        if not (
+            start.isValid()
+            and start.column() == 0
+            and role == QtCore.Qt.ItemDataRole.DisplayRole
+            and isinstance(value, str)
+            and flagValue & 0x0F == _flagValue(QtCore.Qt.MatchFlag.MatchStartsWith)
+        ):
+            return super().match(start, role, value, hits, flags)
+        rows = self.rowsWithPrefix(
+            value, bool(flagValue & _flagValue(QtCore.Qt.MatchFlag.MatchCaseSensitive))
+        )
+        startRow = start.row()
+        matched = [row for row in rows if row >= startRow]
+        if flagValue & _flagValue(QtCore.Qt.MatchFlag.MatchWrap):
+            matched.extend(row for row in rows if row < startRow)
+        if hits != -1:
+            matched = matched[:hits]
+        return [self.index(row, 0) for row in matched]
+
+
 class EnumComboBox(QtWidgets.QComboBox):
     """
     Combo box for :class:`enum.Enum` type.
 
-    Standard way to construct this widget is by :meth:`fromEnum` class method.
-    N-th item contains N-th member of the Enum as its data.
+    Standard way to construct this widget is by :meth:`fromEnum` class method,
+    which sets the shared :class:`EnumItemModel` of the Enum. N-th item contains
+    N-th member of the Enum as its data. Items must not be added to or removed
+    from the shared model.
 
     Enum instance is stored in item data. Field value is the data of currently
-    activated item. If the current index is -1, field value is ``None``.
+    activated item. If the current index is -1, field value is ``None``. The
+    data of current item is cached when the current index changes.
 
     """
 
@@ -322,35 +581,41 @@ class EnumComboBox(QtWidgets.QComboBox):
     @classmethod
     def fromEnum(cls: Type[T], enum: Type[Enum]) -> T:
         obj = cls()
-        for e in enum:
-            obj.addItem(e.name, userData=e)
+        obj.setModel(EnumItemModel.forEnum(enum))
         obj.setCurrentIndex(-1)
         return obj
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # current index and its data
+        self._currentData: Tuple[int, Optional[Enum]] = (-1, None)
         self.currentIndexChanged.connect(self._onCurrentIndexChange)
         self.activated.connect(self.fieldEdited)
 
     def fieldValue(self) -> Optional[Enum]:
         index = self.currentIndex()
-        if index == -1:
-            ret = None
-        else:
-            ret = self.itemData(index)
+        cachedIndex, ret = self._currentData
+        if index != cachedIndex:
+            ret = None if index == -1 else self.itemData(index)
+            self._currentData = (index, ret)
         return ret
 
     def setFieldValue(self, value: Optional[Enum]):
         if value is None:
             index = -1
         elif isinstance(value, Enum):
-            index = self.findData(value)
+            model = self.model()
+            if isinstance(model, EnumItemModel):
+                index = model.rowOfMember(value)
+            else:
+                index = self.findData(value)
         else:
             raise TypeError(f"EnumComboBox data must be Enum, not {type(value)}")
         self.setCurrentIndex(index)
 
     def _onCurrentIndexChange(self, index: int):
-        data = self.itemData(index)
+        data = None if index == -1 else self.itemData(index)
+        self._currentData = (index, data)
         self.fieldValueChanged.emit(data)
 
     def fieldName(self) -> str:
@@ -365,26 +630,84 @@ class EnumComboBox(QtWidgets.QComboBox):
             requires = True
         else:
             requires = False
-        if self.property("requiresFieldValue") != requires:
-            self.setProperty("requiresFieldValue", requires)
-            self.style().unpolish(self)
-            self.style().polish(self)
+        RepolishScheduler.instance().setWidgetProperty(
+            self, "requiresFieldValue", requires
+        )
+
+
+class FieldWriteInfo(NamedTuple):
+    """
+    Numbers of the field values which are written to or skipped by the nested
+    field widget when its value is set.
+    """
+
+    applied: int
+    skipped: int
+
+
+# immutable types whose equal values are interchangeable
+_SCALAR_TYPES = (bool, int, float, str, Enum)
+
+
+def _sameValue(a: Any, b: Any) -> bool:
+    """
+    Return if *a* can be kept instead of *b*.
+
+    Values of immutable scalar types are same if they have same type and compare
+    equal. Other values are same only if they are identical, because equal
+    object, e.g. an array, may be modified in-place afterwards.
+    """
+    if a is b:
+        return True
+    if type(a) is not type(b) or not isinstance(a, _SCALAR_TYPES):
+        return False
+    return bool(a == b)
 
 
 V = TypeVar("V", bound="TupleGroupBox")
 
 
+def _fieldWriteInfo(
+    applied: int, skipped: int, widgets: Iterable[Any]
+) -> FieldWriteInfo:
+    """Add the numbers of nested *widgets* to *applied* and *skipped*."""
+    for widget in widgets:
+        fieldWriteInfo = getattr(widget, "fieldWriteInfo", None)
+        if fieldWriteInfo is not None:
+            info = fieldWriteInfo()
+            applied += info.applied
+            skipped += info.skipped
+    return FieldWriteInfo(applied, skipped)
+
+
+def _clearFieldWriteInfo(widgets: Iterable[Any]):
+    for widget in widgets:
+        clearFieldWriteInfo = getattr(widget, "clearFieldWriteInfo", None)
+        if clearFieldWriteInfo is not None:
+            clearFieldWriteInfo()
+
+
 class TupleGroupBox(QtWidgets.QGroupBox):
     """
     Group box for tuple with fixed length.
 
     This is the group box which contains field widgets as subwidgets. Field value
-    is the tuple of subwidgets values.
+    is the tuple of subwidgets values, which is cached and updated by the changed
+    item. :attr:`fieldPathChanged` signal emits the index of the changed item
+    and its value.
+
+    When the field value is set, the item which is equal to the cached value is
+    not set to its subwidget. Only the items of immutable scalar types are
+    compared by equality and the others by identity. ``None`` is always set to
+    clear the partial text. Nested subwidgets are always set, and they skip their
+    unchanged items in turn. The numbers of written and skipped items are
+    returned by :meth:`fieldWriteInfo`.
 
     """
 
     fieldValueChanged = QtCore.Signal(tuple)
     fieldEdited = QtCore.Signal()
+    fieldPathChanged = QtCore.Signal(tuple, object)
 
     def __init__(
         self,
@@ -393,6 +716,11 @@ class TupleGroupBox(QtWidgets.QGroupBox):
     ):
         super().__init__(parent)
         self._orientation = orientation
+        self._fieldValue: Optional[tuple] = None
+        self._subfieldSlots: Dict[Any, Tuple[Callable, Callable]] = {}
+        self._settingValue = False
+        self._appliedCount = 0
+        self._skippedCount = 0
 
         if orientation == QtCore.Qt.Orientation.Vertical:
             layout = QtWidgets.QVBoxLayout()
@@ -427,13 +755,9 @@ class TupleGroupBox(QtWidgets.QGroupBox):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag(0),
     ):
         """Insert the widget to layout and connect the signals."""
-        for i in range(self.count()):
-            w = self.widget(i)
-            if w is None:
-                break
-        widget.fieldValueChanged.connect(self._onSubfieldValueChange)
-        widget.fieldEdited.connect(self.fieldEdited)
+        self._connectSubfield(widget)
         self.layout().insertWidget(index, widget, stretch, alignment)
+        self._fieldValue = None
 
     def addWidget(
         self,
@@ -442,34 +766,69 @@ class TupleGroupBox(QtWidgets.QGroupBox):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag(0),
     ):
         """Add the widget to layout and connect the signals."""
-        for i in range(self.count()):
-            w = self.widget(i)
-            if w is None:
-                break
-        widget.fieldValueChanged.connect(self._onSubfieldValueChange)
-        widget.fieldEdited.connect(self.fieldEdited)
+        self._connectSubfield(widget)
         self.layout().addWidget(widget, stretch, alignment)
+        self._fieldValue = None
 
     def removeWidget(self, widget: FieldWidgetProtocol):
         """Remove the widget from layout and disconnect the signals."""
-        for i in range(self.count()):
-            w = self.widget(i)
-            if w is None:
-                break
-            if w == widget:
-                widget.fieldValueChanged.disconnect(self._onSubfieldValueChange)
-                widget.fieldEdited.disconnect(self.fieldEdited)
-                break
+        if widget in self._subfieldSlots:
+            self._setSubfieldConnected(widget, False)
+            widget.fieldEdited.disconnect(self.fieldEdited)
+            del self._subfieldSlots[widget]
+            self._fieldValue = None
         self.layout().removeWidget(widget)
 
+    def widgetByPath(self, path: Tuple[Any, ...]) -> Optional[FieldWidgetProtocol]:
+        """
+        Returns the nested subwidget at *path*, or None for invalid path.
+
+        First item of *path* is the index of the subwidget, and the rest is
+        passed to the subwidget. Empty path returns *self*.
+        """
+        if not path:
+            return self
+        if not isinstance(path[0], int):
+            return None
+        widget = self.widget(path[0])
+        if widget is None or len(path) == 1:
+            return widget
+        widgetByPath = getattr(widget, "widgetByPath", None)
+        if widgetByPath is None:
+            return None
+        return widgetByPath(path[1:])
+
+    def _connectSubfield(self, widget: FieldWidgetProtocol):
+        # nested widget reports its own path, leaf widget reports only the value
+        emitPath = not hasattr(widget, "fieldPathChanged")
+        valueSlot = functools.partial(self._onSubfieldValueChange, widget, emitPath)
+        pathSlot = functools.partial(self._onSubfieldPathChange, widget)
+        self._subfieldSlots[widget] = (valueSlot, pathSlot)
+        self._setSubfieldConnected(widget, True)
+        widget.fieldEdited.connect(self.fieldEdited)
+
+    def _setSubfieldConnected(self, widget: FieldWidgetProtocol, connected: bool):
+        valueSlot, pathSlot = self._subfieldSlots[widget]
+        pathSignal = getattr(widget, "fieldPathChanged", None)
+        if connected:
+            widget.fieldValueChanged.connect(valueSlot)
+            if pathSignal is not None:
+                pathSignal.connect(pathSlot)
+        else:
+            widget.fieldValueChanged.disconnect(valueSlot)
+            if pathSignal is not None:
+                pathSignal.disconnect(pathSlot)
+
     def fieldValue(self) -> tuple:
-        ret = []
-        for i in range(self.count()):
-            widget = self.widget(i)
-            if widget is None:
-                break
-            ret.append(widget.fieldValue())
-        return tuple(ret)
+        if self._fieldValue is None:
+            ret = []
+            for i in range(self.count()):
+                widget = self.widget(i)
+                if widget is None:
+                    break
+                ret.append(widget.fieldValue())
+            self._fieldValue = tuple(ret)
+        return self._fieldValue
 
     def setFieldValue(self, value: Optional[tuple]):
         if value is None:
@@ -479,17 +838,64 @@ class TupleGroupBox(QtWidgets.QGroupBox):
         else:
             raise TypeError(f"TupleGroupBox value must be tuple, not {type(value)}")
 
-        for i in range(self.count()):
-            widget = self.widget(i)
-            if widget is None:
-                break
-            widget.fieldValueChanged.disconnect(self._onSubfieldValueChange)
-            widget.setFieldValue(value[i])
-            widget.fieldValueChanged.connect(self._onSubfieldValueChange)
+        current = self.fieldValue()
+        # subwidget signals are ignored while setting
+        self._settingValue = True
+        try:
+            for i in range(self.count()):
+                widget = self.widget(i)
+                if widget is None:
+                    break
+                nested = hasattr(widget, "fieldPathChanged")
+                if (
+                    not nested
+                    and value[i] is not None
+                    and _sameValue(current[i], value[i])
+                ):
+                    self._skippedCount += 1
+                    continue
+                widget.setFieldValue(value[i])
+                if not nested:
+                    self._appliedCount += 1
+        finally:
+            self._settingValue = False
+            self._fieldValue = None
+        value = self.fieldValue()
         self.fieldValueChanged.emit(value)
+        self.fieldPathChanged.emit((), value)
 
-    def _onSubfieldValueChange(self, value: Any):
-        self.fieldValueChanged.emit(self.fieldValue())
+    def fieldWriteInfo(self) -> FieldWriteInfo:
+        """
+        Numbers of the items written and skipped by :meth:`setFieldValue`,
+        including the nested subwidgets.
+        """
+        return _fieldWriteInfo(
+            self._appliedCount,
+            self._skippedCount,
+            (self.widget(i) for i in range(self.count())),
+        )
+
+    def clearFieldWriteInfo(self):
+        """Recursively reset the numbers returned by :meth:`fieldWriteInfo`."""
+        self._appliedCount = self._skippedCount = 0
+        _clearFieldWriteInfo(self.widget(i) for i in range(self.count()))
+
+    def _onSubfieldValueChange(self, widget: FieldWidgetProtocol, emitPath, value):
+        if self._settingValue:
+            return
+        index = self.layout().indexOf(widget)
+        values = list(self.fieldValue())
+        values[index] = value
+        self._fieldValue = tuple(values)
+        self.fieldValueChanged.emit(self._fieldValue)
+        if emitPath:
+            self.fieldPathChanged.emit((index,), value)
+
+    def _onSubfieldPathChange(self, widget: FieldWidgetProtocol, path: tuple, value):
+        if self._settingValue:
+            return
+        index = self.layout().indexOf(widget)
+        self.fieldPathChanged.emit((index,) + path, value)
 
     def fieldName(self) -> str:
         return self.title()
@@ -505,3 +911,728 @@ class TupleGroupBox(QtWidgets.QGroupBox):
             if widget is None:
                 continue
             widget.setRequired(required)
+
+
+def _displayText(value: Any) -> str:
+    """Text of *value* in the item view."""
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.name
+    return str(value)
+
+
+def _rowRanges(rows: Iterable[int]) -> List[Tuple[int, int]]:
+    """Group *rows* into contiguous ``(first, last)`` ranges, from the last one."""
+    ranges: List[Tuple[int, int]] = []
+    for row in sorted(set(rows), reverse=True):
+        if ranges and ranges[-1][0] == row + 1:
+            ranges[-1] = (row, ranges[-1][1])
+        else:
+            ranges.append((row, row))
+    return ranges
+
+
+class SequenceItemModel(QtCore.QAbstractListModel):
+    """
+    List model which stores the items of variable-length sequence.
+
+    Items are stored in a Python list. Edit role returns the item itself and
+    display role returns its text. Appending and removing the rows at the end
+    are amortized O(1).
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._values: List[Any] = []
+
+    def values(self) -> List[Any]:
+        """List of the items. Must not be modified in-place."""
+        return self._values
+
+    def setValues(self, values: Iterable[Any]):
+        """Replace all the items by *values*."""
+        self.beginResetModel()
+        self._values = list(values)
+        self.endResetModel()
+
+    def appendValue(self, value: Any):
+        """Append *value* as new row."""
+        row = len(self._values)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._values.append(value)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._values)
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid():
+            flags |= QtCore.Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.ItemDataRole.EditRole:
+            return self._values[index.row()]
+        if role in (
+            QtCore.Qt.ItemDataRole.DisplayRole,
+            QtCore.Qt.ItemDataRole.ToolTipRole,
+        ):
+            return _displayText(self._values[index.row()])
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.EditRole:
+            return False
+        self._values[index.row()] = value
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def insertRows(self, row, count, parent=QtCore.QModelIndex()) -> bool:
+        if parent.isValid() or count < 1 or not (0 <= row <= len(self._values)):
+            return False
+        self.beginInsertRows(parent, row, row + count - 1)
+        self._values[row:row] = [None] * count
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QtCore.QModelIndex()) -> bool:
+        if parent.isValid() or count < 1 or row < 0 or row + count > len(self._values):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._values[row : row + count]
+        self.endRemoveRows()
+        return True
+
+    def removeRowsAt(self, rows: Iterable[int]):
+        """Remove *rows*, removing each contiguous range at once."""
+        for start, end in _rowRanges(rows):
+            self.removeRows(start, end - start + 1)
+
+
+class SequenceItemDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Delegate which edits the item of :class:`SequenceItemModel` by field widget.
+
+    *factory* is a zero-argument callable which constructs the field widget of
+    the item type. The editor is constructed only for the item being edited.
+    Edit role of the model is used, so the delegate can be used for any model
+    which stores the field value in edit role, e.g. :class:`MappingItemModel`.
+    """
+
+    def __init__(self, factory: Callable[[], FieldWidgetProtocol], parent=None):
+        super().__init__(parent)
+        self._factory = factory
+
+    def createEditor(self, parent, option, index):
+        editor = self._factory()
+        editor.setParent(parent)  # type: ignore[attr-defined]
+        editor.setAutoFillBackground(True)  # type: ignore[attr-defined]
+        editor.fieldEdited.connect(functools.partial(self.commitData.emit, editor))
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setFieldValue(index.data(QtCore.Qt.ItemDataRole.EditRole))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.fieldValue(), QtCore.Qt.ItemDataRole.EditRole)
+
+
+class SequenceGroupBox(QtWidgets.QGroupBox):
+    """
+    Group box for variable-length sequence, e.g. ``List[int]``.
+
+    The items are stored in :class:`SequenceItemModel` and displayed by
+    :class:`QListView`. Only the item being edited has the field widget as its
+    editor, which is constructed by *factory*. Therefore large sequence does not
+    create the widget for each item.
+
+    Field value is the sequence of *sequenceType* which contains the items. It is
+    cached and rebuilt only when the items are changed. If there is no item, the
+    field value is ``None``. "Add" and "Remove" buttons append new row and remove
+    the selected rows.
+
+    Changes of the items are coalesced, and :attr:`fieldValueChanged` is emitted
+    once at the end of the current event loop iteration. Therefore appending the
+    items one by one does not rebuild the field value for each item. The pending
+    change is emitted before :attr:`fieldEdited`, and setting the field value
+    emits the signal immediately. :meth:`flushPendingChange` emits the pending
+    change on demand.
+
+    """
+
+    fieldValueChanged = QtCore.Signal(object)
+    fieldEdited = QtCore.Signal()
+
+    def __init__(
+        self,
+        factory: Callable[[], FieldWidgetProtocol],
+        sequenceType: Type[Union[list, tuple]] = list,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._sequenceType = sequenceType
+        self._fieldValue: Optional[Union[list, tuple]] = None
+        self._valid = True
+        self._settingValue = False
+
+        self._changeTimer = QtCore.QTimer(self)
+        self._changeTimer.setSingleShot(True)
+        self._changeTimer.setInterval(0)
+        self._changeTimer.timeout.connect(self._emitChange)
+
+        self._model = SequenceItemModel(self)
+        self._delegate = SequenceItemDelegate(factory, self)
+        self._view = QtWidgets.QListView()
+        self._view.setUniformItemSizes(True)
+        self._view.setSelectionMode(
+            QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection
+        )
+        self._view.setModel(self._model)
+        self._view.setItemDelegate(self._delegate)
+        self._addButton = QtWidgets.QPushButton("Add")
+        self._removeButton = QtWidgets.QPushButton("Remove")
+
+        self._model.dataChanged.connect(self._onItemsChange)
+        self._model.rowsInserted.connect(self._onItemsChange)
+        self._model.rowsRemoved.connect(self._onItemsChange)
+        self._model.modelReset.connect(self._onItemsChange)
+        self._delegate.commitData.connect(self._emitEdited)
+        self._addButton.clicked.connect(self._onAddClick)
+        self._removeButton.clicked.connect(self._onRemoveClick)
+
+        buttonLayout = QtWidgets.QHBoxLayout()
+        buttonLayout.addWidget(self._addButton)
+        buttonLayout.addWidget(self._removeButton)
+        layout = QtWidgets.QVBoxLayout()
+        layout.addWidget(self._view)
+        layout.addLayout(buttonLayout)
+        self.setLayout(layout)
+
+    def sequenceType(self) -> Type[Union[list, tuple]]:
+        """Type of the field value."""
+        return self._sequenceType
+
+    def model(self) -> SequenceItemModel:
+        return self._model
+
+    def view(self) -> QtWidgets.QListView:
+        return self._view
+
+    def fieldValue(self) -> Optional[Union[list, tuple]]:
+        if not self._valid:
+            values = self._model.values()
+            self._fieldValue = self._sequenceType(values) if values else None
+            self._valid = True
+        return self._fieldValue
+
+    def setFieldValue(self, value: Optional[Union[list, tuple]]):
+        if value is None:
+            value = []
+        elif not isinstance(value, (list, tuple)):
+            raise TypeError(
+                f"SequenceGroupBox value must be list or tuple, not {type(value)}"
+            )
+        # model signals are ignored while setting
+        self._settingValue = True
+        try:
+            self._model.setValues(value)
+        finally:
+            self._settingValue = False
+            self._valid = False
+        self._emitChange()
+
+    def hasPendingChange(self) -> bool:
+        """Whether the change of the items is waiting to be emitted."""
+        return self._changeTimer.isActive()
+
+    def flushPendingChange(self):
+        """Emit the pending change of the items now."""
+        if self._changeTimer.isActive():
+            self._emitChange()
+
+    def _onItemsChange(self):
+        self._valid = False
+        if not self._settingValue and not self._changeTimer.isActive():
+            self._changeTimer.start()
+
+    def _emitChange(self):
+        self._changeTimer.stop()
+        self.fieldValueChanged.emit(self.fieldValue())
+
+    def _emitEdited(self):
+        self.flushPendingChange()
+        self.fieldEdited.emit()
+
+    def _onAddClick(self):
+        self._model.appendValue(None)
+        index = self._model.index(self._model.rowCount() - 1, 0)
+        self._view.setCurrentIndex(index)
+        self._view.edit(index)
+        self._emitEdited()
+
+    def _onRemoveClick(self):
+        rows = [i.row() for i in self._view.selectionModel().selectedRows()]
+        if not rows:
+            return
+        self._model.removeRowsAt(rows)
+        self._emitEdited()
+
+    def fieldName(self) -> str:
+        return self.title()
+
+    def setFieldName(self, name: str):
+        self.setTitle(name)
+        self.setToolTip(name)
+
+    def setRequired(self, required: bool):
+        if required and self.fieldValue() is None:
+            requires = True
+        else:
+            requires = False
+        RepolishScheduler.instance().setWidgetProperty(
+            self, "requiresFieldValue", requires
+        )
+
+
+def _ndarrayType() -> Optional[type]:
+    """:class:`numpy.ndarray` if NumPy is already imported, else ``None``."""
+    return getattr(sys.modules.get("numpy"), "ndarray", None)
+
+
+_BOOL_TEXTS = {"true": True, "1": True, "false": False, "0": False}
+
+
+class ArrayTableModel(QtCore.QAbstractTableModel):
+    """
+    Table model which displays NumPy array without copying it.
+
+    Zero-dimensional array has one cell, one-dimensional array has one column,
+    and two-dimensional array is displayed as it is. Each cell reads the element
+    directly from the array, and editing the cell writes the element in-place
+    unless the array is read-only.
+
+    Display role and edit role return the text of the element, which is parsed
+    by the scalar type of the array dtype when set.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._array: Any = None
+
+    def array(self) -> Any:
+        """The array which is displayed, or ``None``."""
+        return self._array
+
+    def setArray(self, array: Any):
+        """Display *array*, which must have at most two dimensions."""
+        if array is not None and array.ndim > 2:
+            raise ValueError(f"Array must be at most 2D, not {array.ndim}D")
+        self.beginResetModel()
+        self._array = array
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        if parent.isValid() or self._array is None:
+            return 0
+        if self._array.ndim == 0:
+            return 1
+        return self._array.shape[0]
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        if parent.isValid() or self._array is None:
+            return 0
+        if self._array.ndim < 2:
+            return 1
+        return self._array.shape[1]
+
+    def _key(self, index) -> Tuple[int, ...]:
+        return (index.row(), index.column())[: self._array.ndim]
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and self._array.flags.writeable:
+            flags |= QtCore.Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return str(section)
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role not in (
+            QtCore.Qt.ItemDataRole.DisplayRole,
+            QtCore.Qt.ItemDataRole.EditRole,
+        ):
+            return None
+        return str(self._array[self._key(index)].item())
+
+    def setData(self, index, value, role=QtCore.Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.EditRole:
+            return False
+        scalarType = self._array.dtype.type
+        try:
+            if self._array.dtype.kind == "b":
+                value = _BOOL_TEXTS[str(value).strip().lower()]
+            self._array[self._key(index)] = scalarType(value)
+        except (KeyError, ValueError, TypeError, OverflowError):
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+
+class ArrayGroupBox(QtWidgets.QGroupBox):
+    """
+    Group box for :class:`numpy.ndarray`, displayed by :class:`QTableView`.
+
+    Field value is the array object itself, which is stored by reference in
+    :class:`ArrayTableModel`. Editing the cell modifies the array in-place, and
+    :attr:`fieldValueChanged` emits the same array object. If no array is set,
+    the field value is ``None``.
+
+    NumPy is not imported by this class. Field value must be the array whose
+    number of dimensions is at most two.
+
+    """
+
+    fieldValueChanged = QtCore.Signal(object)
+    fieldEdited = QtCore.Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._model = ArrayTableModel(self)
+        self._view = QtWidgets.QTableView()
+        self._view.setModel(self._model)
+
+        self._model.dataChanged.connect(self._onArrayChange)
+        self._view.itemDelegate().commitData.connect(self.fieldEdited)
+
+        layout = QtWidgets.QVBoxLayout()
+        layout.addWidget(self._view)
+        self.setLayout(layout)
+
+    def model(self) -> ArrayTableModel:
+        return self._model
+
+    def view(self) -> QtWidgets.QTableView:
+        return self._view
+
+    def fieldValue(self) -> Any:
+        return self._model.array()
+
+    def setFieldValue(self, value: Any):
+        ndarray = _ndarrayType()
+        if value is not None and (ndarray is None or not isinstance(value, ndarray)):
+            raise TypeError(f"ArrayGroupBox value must be ndarray, not {type(value)}")
+        self._model.setArray(value)
+        self.fieldValueChanged.emit(value)
+
+    def _onArrayChange(self):
+        self.fieldValueChanged.emit(self._model.array())
+
+    def fieldName(self) -> str:
+        return self.title()
+
+    def setFieldName(self, name: str):
+        self.setTitle(name)
+        self.setToolTip(name)
+
+    def setRequired(self, required: bool):
+        if required and self.fieldValue() is None:
+            requires = True
+        else:
+            requires = False
+        RepolishScheduler.instance().setWidgetProperty(
+            self, "requiresFieldValue", requires
+        )
+
+
+class MappingItemModel(QtCore.QAbstractTableModel):
+    """
+    Table model which stores the items of mapping.
+
+    Each row is an item, whose key is in the first column and value is in the
+    second column. Edit role returns the key or the value itself and display
+    role returns its text. The row of each key is indexed by a dictionary.
+
+    :meth:`setMapping` compares the new mapping with the current items by the
+    keys, and updates only the rows which are removed, changed or added.
+    :meth:`mapping` returns the cached dictionary of the items. Editing the
+    value replaces the cache by the copy with the edited item, instead of
+    rebuilding it from the rows. The cached dictionary is never modified
+    in-place.
+
+    The row whose key is ``None`` is an incomplete item, which is not included
+    in the mapping.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._keys: List[Any] = []
+        self._values: List[Any] = []
+        self._rows: Dict[Any, int] = {}
+        self._mapping: Optional[Dict[Any, Any]] = {}
+
+    def mapping(self) -> Dict[Any, Any]:
+        """Dictionary of the items. Must not be modified in-place."""
+        if self._mapping is None:
+            self._mapping = {
+                k: v for k, v in zip(self._keys, self._values) if k is not None
+            }
+        return self._mapping
+
+    def setMapping(self, mapping: Dict[Any, Any]):
+        """Update the rows to the items of *mapping*."""
+        self.removeRowsAt(row for key, row in self._rows.items() if key not in mapping)
+
+        added = []
+        for key, value in mapping.items():
+            row = self._rows.get(key)
+            if row is None:
+                added.append((key, value))
+            elif not _sameValue(self._values[row], value):
+                self._values[row] = value
+                self._mapping = None
+                index = self.index(row, 1)
+                self.dataChanged.emit(index, index)
+
+        if added:
+            row = len(self._keys)
+            self.beginInsertRows(QtCore.QModelIndex(), row, row + len(added) - 1)
+            for i, (key, value) in enumerate(added, start=row):
+                self._keys.append(key)
+                self._values.append(value)
+                self._rows[key] = i
+            self.endInsertRows()
+            self._mapping = None
+
+    def removeRowsAt(self, rows: Iterable[int]):
+        """
+        Remove *rows*, removing each contiguous range at once. The key index is
+        rebuilt only once.
+        """
+        ranges = _rowRanges(rows)
+        if not ranges:
+            return
+        for start, end in ranges:
+            self.beginRemoveRows(QtCore.QModelIndex(), start, end)
+            del self._keys[start : end + 1]
+            del self._values[start : end + 1]
+            self.endRemoveRows()
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+        self._mapping = None
+
+    def appendItem(self, key: Any, value: Any) -> bool:
+        """Append new row. Return False if *key* already exists."""
+        if key in self._rows:
+            return False
+        row = len(self._keys)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._keys.append(key)
+        self._values.append(value)
+        self._rows[key] = row
+        self.endInsertRows()
+        if key is not None:
+            self._mapping = None
+        return True
+
+    def rowOfKey(self, key: Any) -> int:
+        """Return the row of *key*, or -1 if it does not exist."""
+        return self._rows.get(key, -1)
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._keys)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return 2
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid():
+            flags |= QtCore.Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == QtCore.Qt.Orientation.Horizontal
+            and role == QtCore.Qt.ItemDataRole.DisplayRole
+            and 0 <= section < 2
+        ):
+            return ("Key", "Value")[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        items = self._keys if index.column() == 0 else self._values
+        if role == QtCore.Qt.ItemDataRole.EditRole:
+            return items[index.row()]
+        if role in (
+            QtCore.Qt.ItemDataRole.DisplayRole,
+            QtCore.Qt.ItemDataRole.ToolTipRole,
+        ):
+            return _displayText(items[index.row()])
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.EditRole:
+            return False
+        row = index.row()
+        key = self._keys[row]
+        if index.column() == 0:
+            if _sameValue(key, value):
+                return True
+            if value in self._rows:
+                return False
+            del self._rows[key]
+            self._rows[value] = row
+            self._keys[row] = value
+            self._mapping = None
+        else:
+            self._values[row] = value
+            if self._mapping is not None and key is not None:
+                self._mapping = {**self._mapping, key: value}
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def removeRows(self, row, count, parent=QtCore.QModelIndex()) -> bool:
+        if parent.isValid() or count < 1 or row < 0 or row + count > len(self._keys):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._keys[row : row + count]
+        del self._values[row : row + count]
+        self._rows = {key: i for i, key in enumerate(self._keys)}
+        self._mapping = None
+        self.endRemoveRows()
+        return True
+
+
+class MappingGroupBox(QtWidgets.QGroupBox):
+    """
+    Group box for mapping, e.g. ``Dict[str, int]``.
+
+    The items are stored in :class:`MappingItemModel` and displayed by
+    :class:`QTableView`. The keys and the values are edited by the field widgets
+    which are constructed by *keyFactory* and *valueFactory*. Only the item
+    being edited has the editor.
+
+    Field value is the dictionary which is cached by the model. Setting the
+    field value updates only the changed rows. If there is no item, the field
+    value is ``None``. "Add" button appends new row without the key, and
+    "Remove" button removes the selected rows.
+
+    """
+
+    fieldValueChanged = QtCore.Signal(object)
+    fieldEdited = QtCore.Signal()
+
+    def __init__(
+        self,
+        keyFactory: Callable[[], FieldWidgetProtocol],
+        valueFactory: Callable[[], FieldWidgetProtocol],
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._settingValue = False
+
+        self._model = MappingItemModel(self)
+        self._keyDelegate = SequenceItemDelegate(keyFactory, self)
+        self._valueDelegate = SequenceItemDelegate(valueFactory, self)
+        self._view = QtWidgets.QTableView()
+        self._view.setSelectionBehavior(
+            QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self._view.setModel(self._model)
+        self._view.setItemDelegateForColumn(0, self._keyDelegate)
+        self._view.setItemDelegateForColumn(1, self._valueDelegate)
+        self._addButton = QtWidgets.QPushButton("Add")
+        self._removeButton = QtWidgets.QPushButton("Remove")
+
+        self._model.dataChanged.connect(self._onItemsChange)
+        self._model.rowsInserted.connect(self._onItemsChange)
+        self._model.rowsRemoved.connect(self._onItemsChange)
+        self._keyDelegate.commitData.connect(self.fieldEdited)
+        self._valueDelegate.commitData.connect(self.fieldEdited)
+        self._addButton.clicked.connect(self._onAddClick)
+        self._removeButton.clicked.connect(self._onRemoveClick)
+
+        buttonLayout = QtWidgets.QHBoxLayout()
+        buttonLayout.addWidget(self._addButton)
+        buttonLayout.addWidget(self._removeButton)
+        layout = QtWidgets.QVBoxLayout()
+        layout.addWidget(self._view)
+        layout.addLayout(buttonLayout)
+        self.setLayout(layout)
+
+    def model(self) -> MappingItemModel:
+        return self._model
+
+    def view(self) -> QtWidgets.QTableView:
+        return self._view
+
+    def fieldValue(self) -> Optional[Dict[Any, Any]]:
+        return self._model.mapping() or None
+
+    def setFieldValue(self, value: Optional[Dict[Any, Any]]):
+        if value is None:
+            value = {}
+        elif not isinstance(value, dict):
+            raise TypeError(f"MappingGroupBox value must be dict, not {type(value)}")
+        # model signals are ignored while setting
+        self._settingValue = True
+        try:
+            self._model.setMapping(value)
+        finally:
+            self._settingValue = False
+        self.fieldValueChanged.emit(self.fieldValue())
+
+    def _onItemsChange(self):
+        if not self._settingValue:
+            self.fieldValueChanged.emit(self.fieldValue())
+
+    def _onAddClick(self):
+        # if incomplete item already exists, it is edited instead
+        self._model.appendItem(None, None)
+        index = self._model.index(self._model.rowOfKey(None), 0)
+        self._view.setCurrentIndex(index)
+        self._view.edit(index)
+        self.fieldEdited.emit()
+
+    def _onRemoveClick(self):
+        rows = [i.row() for i in self._view.selectionModel().selectedRows()]
+        if not rows:
+            return
+        # removed ranges are emitted at once
+        self._settingValue = True
+        try:
+            self._model.removeRowsAt(rows)
+        finally:
+            self._settingValue = False
+        self.fieldValueChanged.emit(self.fieldValue())
+        self.fieldEdited.emit()
+
+    def fieldName(self) -> str:
+        return self.title()
+
+    def setFieldName(self, name: str):
+        self.setTitle(name)
+        self.setToolTip(name)
+
+    def setRequired(self, required: bool):
+        if required and self.fieldValue() is None:
+            requires = True
+        else:
+            requires = False
+        RepolishScheduler.instance().setWidgetProperty(
+            self, "requiresFieldValue", requires
+        )
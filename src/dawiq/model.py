@@ -0,0 +1,288 @@
+"""
+Item model
+==========
+
+:mod:`dawiq.model` provides :class:`DataclassTableModel` which stores the records
+of a dataclass in columnar layout.
+"""
+
+import array
+import dataclasses
+from .qt_compat import QtCore, TypeRole, DataRole
+from typing import Any, Dict, Iterable, List, Optional, Type, Union, get_type_hints
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from _typeshed import DataclassInstance
+
+
+__all__ = [
+    "DataclassTableModel",
+]
+
+
+# States of the cell
+_MISSING = object()
+_ABSENT = 0
+_PRESENT = 1
+_NONE = 2
+
+# Typecode of compact array for field type
+_TYPECODES = {int: "q", float: "d", bool: "b"}
+_CODETYPES = {code: t for t, code in _TYPECODES.items()}
+
+
+def _columnTypecode(t: Any) -> Optional[str]:
+    """Return the array typecode for field type *t*, or None for Python list."""
+    if getattr(t, "__origin__", None) is Union:
+        args = [a for a in t.__args__ if a is not type(None)]  # noqa: E721
+        if len(args) == 1:
+            t = args[0]
+    return _TYPECODES.get(t)
+
+
+class DataclassTableModel(QtCore.QAbstractTableModel):
+    """
+    Table model which stores the records of single dataclass.
+
+    Each row is a record, and each column is a field of the dataclass. Values
+    of ``int``, ``float`` and ``bool`` fields (including optional ones) are
+    stored in compact typed arrays, and other values are stored in lists. If
+    a value which cannot be stored in the typed array is set, the column is
+    converted to list.
+
+    The model is compatible to :class:`DataclassDelegate`. On any column,
+    :attr:`TypeRole` returns the dataclass and :attr:`DataRole` returns the
+    record as a :class:`dict` which does not contain the absent fields.
+    ``DisplayRole`` and ``EditRole`` return the value of each field.
+
+    .. code-block:: python
+
+        model = DataclassTableModel(DataClass)
+        model.appendRecords([dict(x=1.0, y=True), dict(x=2.0)])
+        mapper.setModel(model)
+
+    Notes
+    =====
+
+    Setting different dataclass with :attr:`TypeRole` is not supported. Keys in
+    the record which are not the fields of the dataclass are discarded.
+    """
+
+    TypeRole = TypeRole
+    DataRole = DataRole
+
+    def __init__(self, dataclass: Type["DataclassInstance"], parent=None):
+        super().__init__(parent)
+        self._dataclass = dataclass
+        fields = dataclasses.fields(dataclass)
+        try:
+            hints = get_type_hints(dataclass)
+        except (NameError, TypeError):
+            hints = {}
+        self._fieldNames = [f.name for f in fields]
+        self._fieldColumns = {name: i for i, name in enumerate(self._fieldNames)}
+        self._typecodes = [_columnTypecode(hints.get(f.name, f.type)) for f in fields]
+        self._columns: List[Union[array.array, list]] = [
+            array.array(code) if code else [] for code in self._typecodes
+        ]
+        self._states = [bytearray() for _ in fields]
+        self._rowCount = 0
+
+    def dataclass(self) -> Type["DataclassInstance"]:
+        return self._dataclass
+
+    def fieldNames(self) -> List[str]:
+        return list(self._fieldNames)
+
+    def columnOfField(self, name: str) -> int:
+        """Return the column of field *name*, or -1 if it does not exist."""
+        return self._fieldColumns.get(name, -1)
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._rowCount
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._fieldNames)
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid():
+            flags |= QtCore.Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == QtCore.Qt.Orientation.Horizontal
+            and role == QtCore.Qt.ItemDataRole.DisplayRole
+            and 0 <= section < len(self._fieldNames)
+        ):
+            return self._fieldNames[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == self.TypeRole:
+            return self._dataclass
+        if role == self.DataRole:
+            return self.record(index.row())
+        if role in (
+            QtCore.Qt.ItemDataRole.DisplayRole,
+            QtCore.Qt.ItemDataRole.EditRole,
+        ):
+            return self._value(index.row(), index.column())
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid():
+            return False
+        row = index.row()
+        if role == self.TypeRole:
+            return value is self._dataclass
+        if role == self.DataRole:
+            self.setRecord(row, value)
+            return True
+        if role == QtCore.Qt.ItemDataRole.EditRole:
+            self._setValue(row, index.column(), value, True)
+            self.dataChanged.emit(index, index, [role])
+            return True
+        return False
+
+    def record(self, row: int) -> Dict[str, Any]:
+        """Return the dictionary of present fields at *row*."""
+        ret = {}
+        for col, name in enumerate(self._fieldNames):
+            state = self._states[col][row]
+            if state == _PRESENT:
+                value = self._columns[col][row]
+                if self._typecodes[col] == "b":
+                    value = bool(value)
+                ret[name] = value
+            elif state == _NONE:
+                ret[name] = None
+        return ret
+
+    def setRecord(self, row: int, data: Optional[Dict[str, Any]]):
+        """Replace the record at *row* with *data*. Missing fields are absent."""
+        if data is None:
+            data = {}
+        for col, name in enumerate(self._fieldNames):
+            present = name in data
+            self._setValue(row, col, data.get(name), present)
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, self.columnCount() - 1)
+        )
+
+    def insertRows(self, row, count, parent=QtCore.QModelIndex()) -> bool:
+        if parent.isValid() or count < 1 or not (0 <= row <= self._rowCount):
+            return False
+        self.beginInsertRows(parent, row, row + count - 1)
+        self._insertEmpty(row, count)
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QtCore.QModelIndex()) -> bool:
+        if parent.isValid() or count < 1 or row < 0 or row + count > self._rowCount:
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        for col in range(len(self._fieldNames)):
+            del self._columns[col][row : row + count]
+            del self._states[col][row : row + count]
+        self._rowCount -= count
+        self.endRemoveRows()
+        return True
+
+    def appendRecords(self, records: Iterable[Dict[str, Any]]):
+        """Append *records* at once."""
+        records = list(records)
+        if not records:
+            return
+        row, count = self._rowCount, len(records)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row + count - 1)
+        for col, name in enumerate(self._fieldNames):
+            values = [data.get(name, _MISSING) for data in records]
+            self._appendColumn(col, values)
+        self._rowCount += count
+        self.endInsertRows()
+
+    def _appendColumn(self, col: int, values: list):
+        states = bytes(
+            _ABSENT if v is _MISSING else _NONE if v is None else _PRESENT
+            for v in values
+        )
+        code = self._typecodes[col]
+        if code is not None:
+            valueType = _CODETYPES[code]
+            if not all(
+                type(v) is valueType for v, s in zip(values, states) if s == _PRESENT
+            ):
+                self._convertToList(col)
+            else:
+                try:
+                    typed = array.array(
+                        code,
+                        [v if s == _PRESENT else 0 for v, s in zip(values, states)],
+                    )
+                except OverflowError:
+                    self._convertToList(col)
+                else:
+                    self._columns[col].extend(typed)  # type: ignore[arg-type]
+        if self._typecodes[col] is None:
+            self._columns[col].extend(
+                v if s == _PRESENT else None for v, s in zip(values, states)
+            )
+        self._states[col].extend(states)
+
+    def _insertEmpty(self, row: int, count: int):
+        for col, code in enumerate(self._typecodes):
+            column = self._columns[col]
+            if isinstance(column, array.array):
+                column[row:row] = array.array(
+                    column.typecode, bytes(count * column.itemsize)
+                )
+            else:
+                column[row:row] = [None] * count
+            self._states[col][row:row] = bytes(count)
+        self._rowCount += count
+
+    def _value(self, row: int, col: int) -> Any:
+        if self._states[col][row] != _PRESENT:
+            return None
+        value = self._columns[col][row]
+        if self._typecodes[col] == "b":
+            value = bool(value)
+        return value
+
+    def _setValue(self, row: int, col: int, value: Any, present: bool):
+        states = self._states[col]
+        if not present or value is None:
+            states[row] = _NONE if present else _ABSENT
+            return
+        code = self._typecodes[col]
+        if code is not None:
+            if type(value) is not _CODETYPES[code]:
+                self._convertToList(col)
+            else:
+                try:
+                    self._columns[col][row] = value
+                except OverflowError:
+                    self._convertToList(col)
+        if self._typecodes[col] is None:
+            self._columns[col][row] = value
+        states[row] = _PRESENT
+
+    def _convertToList(self, col: int):
+        """Store the values of *col* in list instead of typed array."""
+        convert = _CODETYPES[self._typecodes[col]]  # type: ignore[index]
+        states = self._states[col]
+        self._columns[col] = [
+            convert(v) if s == _PRESENT else None
+            for v, s in zip(self._columns[col], states)
+        ]
+        self._typecodes[col] = None
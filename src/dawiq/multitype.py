@@ -6,9 +6,10 @@ Data widget container
 to support multiple dataclass types.
 """
 
+from collections import OrderedDict
 from .qt_compat import QtWidgets, QtCore
-from .datawidget import DataWidget
-from typing import Type, Optional
+from .datawidget import DataWidget, dataclass2Widget
+from typing import Type, Optional, Callable, Dict, List
 
 from typing import TYPE_CHECKING
 
@@ -22,12 +23,209 @@ __all__ = [
 ]
 
 
-class DataclassStackedWidget(QtWidgets.QStackedWidget):
+class _DataclassIndex:
+    """
+    Bidirectional mapping between the pages and their dataclasses.
+
+    Looking up the page by dataclass walks its MRO, so that a subclass resolves
+    to the page of nearest registered base class. The resolution is cached per
+    type until a dataclass is registered or unregistered. If multiple pages are
+    bound to same dataclass, the one registered first is returned.
+
+    The page indices are cached as well. Cached index is validated on lookup,
+    and all indices are rebuilt when the pages have moved.
+    """
+
+    def __init__(self):
+        self._dataclasses: Dict[QtWidgets.QWidget, type] = {}
+        self._widgets: Dict[type, List[QtWidgets.QWidget]] = {}
+        self._resolved: Dict[type, Optional[type]] = {}
+        self._pageIndices: Dict[QtWidgets.QWidget, int] = {}
+
+    def __contains__(self, widget: QtWidgets.QWidget) -> bool:
+        return widget in self._dataclasses
+
+    def add(self, widget: QtWidgets.QWidget, dataclass: type):
+        self.remove(widget)
+        self._dataclasses[widget] = dataclass
+        widgets = self._widgets.setdefault(dataclass, [])
+        if not widgets:
+            self._resolved.clear()
+        widgets.append(widget)
+
+    def remove(self, widget: QtWidgets.QWidget) -> Optional[type]:
+        dataclass = self._dataclasses.pop(widget, None)
+        if dataclass is not None:
+            widgets = self._widgets[dataclass]
+            widgets.remove(widget)
+            if not widgets:
+                del self._widgets[dataclass]
+                self._resolved.clear()
+        self._pageIndices.pop(widget, None)
+        return dataclass
+
+    def replace(self, old: QtWidgets.QWidget, new: QtWidgets.QWidget):
+        """Bind *new* to the dataclass of *old*, keeping the registration order."""
+        dataclass = self._dataclasses.pop(old)
+        self._dataclasses[new] = dataclass
+        widgets = self._widgets[dataclass]
+        widgets[widgets.index(old)] = new
+        index = self._pageIndices.pop(old, None)
+        if index is not None:
+            self._pageIndices[new] = index
+
+    def indexOf(self, widget: QtWidgets.QWidget, container) -> int:
+        """Return the page index of *widget* in *container*, or -1."""
+        index = self._pageIndices.get(widget, -1)
+        if index < 0 or container.widget(index) is not widget:
+            self._pageIndices = {
+                container.widget(i): i for i in range(container.count())
+            }
+            index = self._pageIndices.get(widget, -1)
+        return index
+
+    def dataclass(self, widget: QtWidgets.QWidget) -> Optional[type]:
+        return self._dataclasses.get(widget)
+
+    def widget(self, dataclass: type) -> Optional[QtWidgets.QWidget]:
+        try:
+            registered = self._resolved[dataclass]
+        except KeyError:
+            registered = None
+            for base in getattr(dataclass, "__mro__", (dataclass,)):
+                if base in self._widgets:
+                    registered = base
+                    break
+            self._resolved[dataclass] = registered
+        except TypeError:  # unhashable
+            return None
+        if registered is None:
+            return None
+        return self._widgets[registered][0]
+
+
+class _DataWidgetPlaceholder(QtWidgets.QWidget):
+    """Empty page which is replaced by the data widget when it is required."""
+
+    def __init__(self, dataclass, factory, parent=None):
+        super().__init__(parent)
+        self.dataclass = dataclass
+        self.factory = factory
+
+
+class _DataclassPagesMixin:
+    """
+    Common implementation of the containers whose pages are bound to dataclasses.
+
+    Container class must call :meth:`_initDataclassPages` in its constructor, and
+    implement :meth:`_insertPage` and :meth:`_replacePage`.
+    """
+
+    def _initDataclassPages(self):
+        self._dataclassIndex = _DataclassIndex()
+        # lazily loaded widgets and their factories, in LRU order
+        self._lazyWidgets: "OrderedDict[QtWidgets.QWidget, Callable]" = OrderedDict()
+        self._maxLoadedCount = -1
+
+    def _insertPage(self, index: int, widget: QtWidgets.QWidget, *args) -> int:
+        """Insert *widget* as a page, passing *args* to the container."""
+        raise NotImplementedError
+
+    def _replacePage(self, index: int, widget: QtWidgets.QWidget):
+        """Replace the page at *index* by *widget* without changing current page."""
+        raise NotImplementedError
+
+    def _insertDataclass(self, index: int, dataclass, factory, *args) -> int:
+        placeholder = _DataWidgetPlaceholder(dataclass, factory)
+        self._dataclassIndex.add(placeholder, dataclass)
+        index = self._insertPage(index, placeholder, *args)
+        if placeholder not in self._dataclassIndex:
+            # loaded during insertion because it became current
+            index = self.currentIndex()  # type: ignore[attr-defined]
+        return index
+
+    def loadDataWidget(self, index: int) -> Optional[QtWidgets.QWidget]:
+        """
+        Return the widget at *index*, building it if it is not loaded yet.
+
+        The widget which is registered by :meth:`addDataclass` or
+        :meth:`insertDataclass` is built by its factory when this method is
+        called. Long-unvisited widgets may be unloaded again, see
+        :meth:`setMaximumLoadedCount`.
+        """
+        widget = self.widget(index)  # type: ignore[attr-defined]
+        if isinstance(widget, _DataWidgetPlaceholder):
+            placeholder = widget
+            widget = placeholder.factory(placeholder.dataclass)
+            self._replacePage(index, widget)
+            self._dataclassIndex.replace(placeholder, widget)
+            self._lazyWidgets[widget] = placeholder.factory
+            placeholder.deleteLater()
+            self._unloadExceeding(widget)
+        elif widget in self._lazyWidgets:
+            self._lazyWidgets.move_to_end(widget)
+        return widget
+
+    def isDataWidgetLoaded(self, index: int) -> bool:
+        """Return if the widget at *index* is built."""
+        widget = self.widget(index)  # type: ignore[attr-defined]
+        return not isinstance(widget, _DataWidgetPlaceholder)
+
+    def maximumLoadedCount(self) -> int:
+        return self._maxLoadedCount
+
+    def setMaximumLoadedCount(self, count: int):
+        """
+        Set the maximum number of loaded widgets which are lazily built.
+
+        When the number exceeds *count*, least recently visited widgets are
+        destroyed and replaced by placeholders, losing their data values. The
+        current widget is never unloaded. Negative value means no limit, which
+        is the default.
+        """
+        self._maxLoadedCount = count
+        self._unloadExceeding(None)
+
+    def _unloadExceeding(self, keep: Optional[QtWidgets.QWidget]):
+        if self._maxLoadedCount < 0:
+            return
+        protected = (keep, self.currentWidget())  # type: ignore[attr-defined]
+        candidates = [w for w in self._lazyWidgets if w not in protected]
+        excess = len(self._lazyWidgets) - self._maxLoadedCount
+        for widget in candidates[: max(excess, 0)]:
+            index = self._dataclassIndex.indexOf(widget, self)
+            factory = self._lazyWidgets.pop(widget)
+            dataclass = self._dataclassIndex.dataclass(widget)
+            placeholder = _DataWidgetPlaceholder(dataclass, factory)
+            self._dataclassIndex.replace(widget, placeholder)
+            self._replacePage(index, placeholder)
+            widget.deleteLater()
+
+    def currentDataclass(self) -> Optional[Type["DataclassInstance"]]:
+        widget = self.currentWidget()  # type: ignore[attr-defined]
+        return self._dataclassIndex.dataclass(widget)
+
+    def indexOfDataclass(self, dataclass: Type["DataclassInstance"]) -> int:
+        """
+        Return the index of the widget bound to *dataclass*.
+
+        If *dataclass* is not bound, the widget of its nearest base class is
+        searched. If no widget is found, -1 is returned.
+        """
+        widget = self._dataclassIndex.widget(dataclass)
+        if widget is None:
+            return -1
+        return self._dataclassIndex.indexOf(widget, self)
+
+
+class DataclassStackedWidget(_DataclassPagesMixin, QtWidgets.QStackedWidget):
     """
     Stacked widget containing multiple :class:`DataWidget` and their dataclasses.
 
     To add :class:`DataWidget`, pass the widget and its dataclass to
-    :meth:`addDataWidget` or to :meth:`insertDataWidget`.
+    :meth:`addDataWidget` or to :meth:`insertDataWidget`. Alternatively, pass
+    the dataclass to :meth:`addDataclass` or :meth:`insertDataclass` to build
+    the widget lazily when its page becomes current.
 
     When the data value of current data widget changes, this widget emits
     :attr:`currentDataValueChanged` signal. When the current data widget is
@@ -35,70 +233,108 @@ class DataclassStackedWidget(QtWidgets.QStackedWidget):
 
     """
 
-    currentDataValueChanged = QtCore.Signal(dict)
+    currentDataValueChanged = QtCore.Signal(object)
     currentDataEdited = QtCore.Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._dataWidgets = {}
+        self._initDataclassPages()
         self._previousIndex = -1
         self.currentChanged.connect(self._onCurrentChange)
 
+    def setCurrentIndex(self, index):
+        self.loadDataWidget(index)
+        super().setCurrentIndex(index)
+
+    def setCurrentWidget(self, widget):
+        self.setCurrentIndex(self.indexOf(widget))
+
     def _onCurrentChange(self, index: int):
         """Handle the signals of old widget and current widget."""
         old = self.widget(self._previousIndex)
         if isinstance(old, DataWidget):
             old.dataValueChanged.disconnect(self.currentDataValueChanged)
             old.dataEdited.disconnect(self.currentDataEdited)
-        new = self.widget(index)
+        new = self.loadDataWidget(index)
         if isinstance(new, DataWidget):
             new.dataValueChanged.connect(self.currentDataValueChanged)
             new.dataEdited.connect(self.currentDataEdited)
         self._previousIndex = index
+        self._unloadExceeding(None)
 
     def addDataWidget(
         self, widget: DataWidget, dataclass: Type["DataclassInstance"]
     ) -> int:
         """Add *widget* with binding it to *dataclass*."""
         index = self.addWidget(widget)
-        self._dataWidgets[widget] = dataclass
+        self._dataclassIndex.add(widget, dataclass)
         return index
 
     def insertDataWidget(
         self, index: int, widget: DataWidget, dataclass: Type["DataclassInstance"]
     ) -> int:
         index = self.insertWidget(index, widget)
-        self._dataWidgets[widget] = dataclass
+        self._dataclassIndex.add(widget, dataclass)
         return index
 
+    def addDataclass(
+        self,
+        dataclass: Type["DataclassInstance"],
+        factory: Callable[
+            [Type["DataclassInstance"]], QtWidgets.QWidget
+        ] = dataclass2Widget,
+    ) -> int:
+        """
+        Add *dataclass* whose widget is built by *factory* when required.
+
+        The widget is built when its page becomes current, or when
+        :meth:`loadDataWidget` is called.
+        """
+        return self.insertDataclass(-1, dataclass, factory)
+
+    def insertDataclass(
+        self,
+        index: int,
+        dataclass: Type["DataclassInstance"],
+        factory: Callable[
+            [Type["DataclassInstance"]], QtWidgets.QWidget
+        ] = dataclass2Widget,
+    ) -> int:
+        """Insert *dataclass* whose widget is built by *factory* when required."""
+        return self._insertDataclass(index, dataclass, factory)
+
+    def _insertPage(self, index: int, widget: QtWidgets.QWidget, *args) -> int:
+        return self.insertWidget(index, widget)
+
+    def _replacePage(self, index: int, widget: QtWidgets.QWidget):
+        current = self.currentIndex()
+        old = self.widget(index)
+        blocked = self.blockSignals(True)
+        try:
+            super().insertWidget(index, widget)
+            super().removeWidget(old)
+            super().setCurrentIndex(current)
+        finally:
+            self.blockSignals(blocked)
+
     def removeWidget(self, widget: QtWidgets.QWidget):
+        self._dataclassIndex.remove(widget)
+        self._lazyWidgets.pop(widget, None)
         if isinstance(widget, DataWidget):
-            self._dataWidgets.pop(widget, None)
             if widget == self.currentWidget():
                 widget.dataValueChanged.disconnect(self.currentDataValueChanged)
                 widget.dataEdited.disconnect(self.currentDataEdited)
         super().removeWidget(widget)
 
-    def currentDataclass(self) -> Optional[Type["DataclassInstance"]]:
-        return self._dataWidgets.get(self.currentWidget())
-
-    def indexOfDataclass(self, dataclass: Type["DataclassInstance"]) -> int:
-        """Return the index of the widget bound to *dataclass*."""
-        for widget, dcls in self._dataWidgets.items():
-            if dcls == dataclass:
-                index = self.indexOf(widget)
-                break
-        else:
-            index = -1
-        return index
-
 
-class DataclassTabWidget(QtWidgets.QTabWidget):
+class DataclassTabWidget(_DataclassPagesMixin, QtWidgets.QTabWidget):
     """
     Tab widget containing multiple :class:`DataWidget` and dataclasses.
 
     To add :class:`DataWidget`, pass the widget and its dataclass to
-    :meth:`addDataWidget` or to :meth:`insertDataWidget`.
+    :meth:`addDataWidget` or to :meth:`insertDataWidget`. Alternatively, pass
+    the dataclass to :meth:`addDataclass` or :meth:`insertDataclass` to build
+    the widget lazily when its tab becomes current.
 
     When current index is changed by user, :attr:`activated` signal is emitted.
     When the data value of current data widget changes, this widget emits
@@ -108,17 +344,21 @@ class DataclassTabWidget(QtWidgets.QTabWidget):
     """
 
     activated = QtCore.Signal(int)
-    currentDataValueChanged = QtCore.Signal(dict)
+    currentDataValueChanged = QtCore.Signal(object)
     currentDataEdited = QtCore.Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._dataWidgets = {}
+        self._initDataclassPages()
         self._previousIndex = -1
         self._blockActivated = False
         self.currentChanged.connect(self._onCurrentChange)
 
+    def setCurrentWidget(self, widget):
+        self.setCurrentIndex(self.indexOf(widget))
+
     def setCurrentIndex(self, index):
+        self.loadDataWidget(index)
         self._blockActivated = True
         super().setCurrentIndex(index)
         self._blockActivated = False
@@ -129,11 +369,12 @@ class DataclassTabWidget(QtWidgets.QTabWidget):
         if isinstance(old, DataWidget):
             old.dataValueChanged.disconnect(self.currentDataValueChanged)
             old.dataEdited.disconnect(self.currentDataEdited)
-        new = self.widget(index)
+        new = self.loadDataWidget(index)
         if isinstance(new, DataWidget):
             new.dataValueChanged.connect(self.currentDataValueChanged)
             new.dataEdited.connect(self.currentDataEdited)
         self._previousIndex = index
+        self._unloadExceeding(None)
         if not self._blockActivated:
             self.activated.emit(index)
 
@@ -141,34 +382,62 @@ class DataclassTabWidget(QtWidgets.QTabWidget):
         """Add *widget* with binding it to *dataclass*."""
         args = [arg for arg in [icon, label] if arg is not None]
         index = self.addTab(widget, *args)
-        self._dataWidgets[widget] = dataclass
+        self._dataclassIndex.add(widget, dataclass)
         return index
 
     def insertDataWidget(self, index, widget, dataclass, icon=None, label=None) -> int:
         """Insert *widget* with binding it to *dataclass*."""
         args = [arg for arg in [icon, label] if arg is not None]
         index = self.insertTab(index, widget, *args)
-        self._dataWidgets[widget] = dataclass
+        self._dataclassIndex.add(widget, dataclass)
         return index
 
+    def addDataclass(
+        self, dataclass, factory=dataclass2Widget, icon=None, label=None
+    ) -> int:
+        """
+        Add *dataclass* whose widget is built by *factory* when required.
+
+        The widget is built when its tab becomes current, or when
+        :meth:`loadDataWidget` is called. If tab label is not passed, name of
+        *dataclass* is used.
+        """
+        return self.insertDataclass(-1, dataclass, factory, icon, label)
+
+    def insertDataclass(
+        self, index, dataclass, factory=dataclass2Widget, icon=None, label=None
+    ) -> int:
+        """Insert *dataclass* whose widget is built by *factory* when required."""
+        args = [arg for arg in [icon, label] if arg is not None]
+        if not args:
+            args = [dataclass.__name__]
+        return self._insertDataclass(index, dataclass, factory, *args)
+
+    def _insertPage(self, index: int, widget: QtWidgets.QWidget, *args) -> int:
+        return self.insertTab(index, widget, *args)
+
+    def _replacePage(self, index: int, widget: QtWidgets.QWidget):
+        current = self.currentIndex()
+        icon = self.tabIcon(index)
+        text = self.tabText(index)
+        toolTip = self.tabToolTip(index)
+        enabled = self.isTabEnabled(index)
+        blocked = self.blockSignals(True)
+        try:
+            super().insertTab(index, widget, icon, text)
+            super().removeTab(index + 1)
+            super().setCurrentIndex(current)
+        finally:
+            self.blockSignals(blocked)
+        self.setTabToolTip(index, toolTip)
+        self.setTabEnabled(index, enabled)
+
     def removeTab(self, index: int):
         widget = self.widget(index)
+        self._dataclassIndex.remove(widget)
+        self._lazyWidgets.pop(widget, None)
         if isinstance(widget, DataWidget):
-            self._dataWidgets.pop(widget, None)
             if widget == self.currentWidget():
                 widget.dataValueChanged.disconnect(self.currentDataValueChanged)
                 widget.dataEdited.disconnect(self.currentDataEdited)
         super().removeTab(index)
-
-    def currentDataclass(self) -> Optional[Type["DataclassInstance"]]:
-        return self._dataWidgets.get(self.currentWidget())
-
-    def indexOfDataclass(self, dataclass: Type["DataclassInstance"]) -> int:
-        """Return the index of the widget bound to *dataclass*."""
-        for widget, dcls in self._dataWidgets.items():
-            if dcls == dataclass:
-                index = self.indexOf(widget)
-                break
-        else:
-            index = -1
-        return index
@@ -28,7 +28,11 @@ Based on from https://github.com/pytest-dev/pytest-qt.
 """
 
 
+import importlib
+import importlib.util
 import os
+import sys
+from typing import Any, Dict, Optional, Tuple
 
 
 __all__ = [
@@ -38,15 +42,79 @@ __all__ = [
 ]
 
 
+_QT_APIS = {
+    "pyside6": "PySide6",
+    "pyside2": "PySide2",
+    "pyqt6": "PyQt6",
+    "pyqt5": "PyQt5",
+}
+
+# Detected binding for (api, interpreter environment)
+_detected_bindings: Dict[Tuple, str] = {}
+
+
+def _environment_key(api: Optional[str]) -> Tuple:
+    return (api, sys.executable, sys.prefix, tuple(sys.path))
+
+
+def _binding_error(qtapi: str) -> Optional[str]:
+    """Return the reason why *qtapi* cannot be imported, or None if it can."""
+    # Not checking only the root namespace because when uninstalling from
+    # conda, the namespace can still be there.
+    name = f"{qtapi}.QtCore"
+    try:
+        spec = importlib.util.find_spec(name)
+    except ImportError as e:
+        return str(e)
+    if spec is None:
+        return f"No module named '{name}'"
+    return None
+
+
+def _detect_binding(api: Optional[str]) -> str:
+    """Find the Qt binding without importing the Qt modules."""
+    key = _environment_key(api)
+    binding = _detected_bindings.get(key)
+    if binding is not None:
+        return binding
+
+    # If api is specified, use it.
+    if api is not None:
+        binding = _QT_APIS[api.lower()]
+        error = _binding_error(binding)
+        if error is not None:
+            raise QtAPIError(
+                f"Specified Qt API is not installed: '{binding}' ({error})"
+            )
+    # If api is not specified, find supported Qt modules.
+    else:
+        import_errors = {}
+        for qtapi in _QT_APIS.values():
+            error = _binding_error(qtapi)
+            if error is None:
+                binding = qtapi
+                break
+            import_errors[qtapi] = error
+        else:
+            errors = "\n".join(
+                f"  {module}: {reason}"
+                for module, reason in sorted(import_errors.items())
+            )
+            msg = "Supported Qt not installed.\n" + errors
+            raise QtAPIError(msg)
+
+    _detected_bindings[key] = binding
+    return binding
+
+
 class QtAPI:
     """
     Interface to access the Qt binding package installed in the environment.
 
     The instance of this class can be treated as root namespace of Qt package.
-    At construction, this object determines the Qt binding package where it will
-    import the submodules. When attribute starting with ``Qt`` is called
-    (e.g. ``QtCore`` - this is the naming rule for Qt subpackages) this object
-    imports the module from root package.
+    When attribute starting with ``Qt`` is called (e.g. ``QtCore`` - this is the
+    naming rule for Qt subpackages) this object imports the module from root
+    package.
 
     For example, the following code imports :mod:`PyQt5.QtWidgets` module where
     :class:`QWidget` is retrieved.
@@ -56,94 +124,87 @@ class QtAPI:
         from dawiq.qt_compat import QtAPI
         widget = QtAPI("PyQt5").QtWidgets.QWidget()
 
-    Qt binding is determined by following steps.
+    Qt binding is determined when :attr:`qt_binding` or any Qt module is first
+    accessed, by following steps.
 
     1. If *api* argument is passed, use it.
 
     2. If ``DAWIQ_QT_API`` environment variable is set, use it.
 
-    3. Try import the packages in following order.
+    3. Find the packages in following order.
 
         * PySide6
         * PySide2
         * PyQt6
         * PyQt5
 
-    Letter case does not matter when specifying the API. If importing fails,
-    :class:`QtAPIError` is raised.
+    Letter case does not matter when specifying the API. Unsupported API raises
+    :class:`QtAPIError` at construction. If the binding is not installed,
+    :class:`QtAPIError` is raised when it is determined. The result of the
+    detection is cached for the interpreter environment.
 
     """
 
     # When new API is supported, update README and intro.rst
 
-    def __init__(self, api=os.environ.get("DAWIQ_QT_API")):
-        self._import_errors = {}
-
-        def _can_import(name):
-            try:
-                __import__(name)
-                return True
-            except ModuleNotFoundError as e:
-                self._import_errors[name] = str(e)
-                return False
-
-        # If api is specified, use it.
-        if api is not None:
-            qtapi = {
-                "pyside6": "PySide6",
-                "pyside2": "PySide2",
-                "pyqt6": "PyQt6",
-                "pyqt5": "PyQt5",
-            }.get(api.lower())
-            if qtapi is None:
-                raise QtAPIError(f"Specified Qt API is not supported: '{api}'")
-            try:
-                __import__(f"{qtapi}.QtCore")
-            except ModuleNotFoundError:
-                raise QtAPIError(f"Specified Qt API is not installed: '{qtapi}'")
-            self.qt_binding = qtapi
-        # If api is not specified, try import supported Qt modules.
-        # Not importing only the root namespace because when uninstalling from
-        # conda, the namespace can still be there.
-        elif _can_import("PySide6.QtCore"):
-            self.qt_binding = "PySide6"
-        elif _can_import("PySide2.QtCore"):
-            self.qt_binding = "PySide2"
-        elif _can_import("PyQt6.QtCore"):
-            self.qt_binding = "PyQt6"
-        elif _can_import("PyQt5.QtCore"):
-            self.qt_binding = "PyQt5"
-        else:
-            errors = "\n".join(
-                f"  {module}: {reason}"
-                for module, reason in sorted(self._import_errors.items())
+    def __init__(self, api=None):
+        if api is None:
+            api = os.environ.get("DAWIQ_QT_API")
+        if api is not None and api.lower() not in _QT_APIS:
+            raise QtAPIError(f"Specified Qt API is not supported: '{api}'")
+        self._api = api
+        self._qt_binding = None
+
+    @property
+    def qt_binding(self) -> str:
+        """Name of the Qt binding package."""
+        if self._qt_binding is None:
+            self._qt_binding = _detect_binding(self._api)
+        return self._qt_binding
+
+    def __getattr__(self, name):
+        # Called only when the module is not imported yet
+        if not name.startswith("Qt"):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
             )
-            msg = "Supported Qt not installed.\n" + errors
-            raise QtAPIError(msg)
-
-        def _import_module(module_name):
-            m = __import__(self.qt_binding, globals(), locals(), [module_name], 0)
-            return getattr(m, module_name)
-
-        self.QtCore = _import_module("QtCore")
-        self.QtWidgets = _import_module("QtWidgets")
-        self.QtGui = _import_module("QtGui")
-
-        if self.qt_binding in ("PyQt5", "PyQt6"):
-            self.QtCore.Signal = self.QtCore.pyqtSignal
-            self.QtCore.Slot = self.QtCore.pyqtSlot
+        try:
+            module = importlib.import_module(f"{self.qt_binding}.{name}")
+        except ModuleNotFoundError as e:
+            raise AttributeError(f"{self.qt_binding} has no module '{name}'") from e
+        if name == "QtCore" and self.qt_binding in ("PyQt5", "PyQt6"):
+            module.Signal = module.pyqtSignal
+            module.Slot = module.pyqtSlot
+        setattr(self, name, module)
+        return module
 
 
 class QtAPIError(Exception):
     pass
 
 
-qt_api = QtAPI()
-
-QtCore = qt_api.QtCore
-QtWidgets = qt_api.QtWidgets
-QtGui = qt_api.QtGui
-
-# define roles for delegate here to mock them in document build
-TypeRole = QtCore.Qt.ItemDataRole.UserRole
-DataRole = QtCore.Qt.ItemDataRole.UserRole + 1
+# Module attributes below are resolved by __getattr__ on first access.
+qt_api: QtAPI
+QtCore: Any
+QtWidgets: Any
+QtGui: Any
+TypeRole: Any
+DataRole: Any
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve :obj:`qt_api` and the Qt modules on first access."""
+    module = sys.modules[__name__]
+    if name == "qt_api":
+        value = QtAPI()
+    elif name in ("QtCore", "QtWidgets", "QtGui"):
+        value = getattr(module.qt_api, name)
+    # define roles for delegate here to mock them in document build
+    elif name == "TypeRole":
+        value = module.QtCore.Qt.ItemDataRole.UserRole
+    elif name == "DataRole":
+        value = module.QtCore.Qt.ItemDataRole.UserRole + 1
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    setattr(module, name, value)
+    return value
@@ -89,6 +89,8 @@ class FieldWidgetProtocol(Protocol):
 
         The editor widget is usually *self*, but there are exceptions such as
         :class:`TupleGroupBox`. Note that the widget needs to be re-polished.
+        :meth:`RepolishScheduler.setWidgetProperty` can be used instead so that
+        re-polishing is deferred and batched when setting the whole form.
 
         Style sheet can be set to highlight the required field with empty widget.
         Common way is to set the style sheet of :class:`QApplication` before
@@ -0,0 +1,57 @@
+from dawiq.converter import (
+    convertFromQt,
+    convertToQt,
+    convertManyFromQt,
+    convertManyToQt,
+)
+import concurrent.futures
+import dataclasses
+import pytest
+import subprocess
+import sys
+
+
+def test_import_without_qt():
+    code = "\n".join(
+        [
+            "import dataclasses, sys",
+            "from dawiq import convertFromQt, convertToQt",
+            "@dataclasses.dataclass",
+            "class Cls:",
+            "    x: int = 1",
+            "assert convertFromQt(Cls, {}, ignoreMissing=False) == {'x': 1}",
+            "assert convertToQt(Cls, {}) == {'x': None}",
+            "qt = ('PySide2', 'PySide6', 'PyQt5', 'PyQt6', 'shiboken2', 'shiboken6')",
+            "assert not [m for m in sys.modules if m.split('.')[0] in qt]",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@dataclasses.dataclass
+class ManyCls:
+    x: int
+    y: str = "y"
+
+
+def test_convertMany():
+    data = ({"x": i} for i in range(10))
+    result = convertManyFromQt(ManyCls, data, ignoreMissing=False)
+    assert next(result) == {"x": 0, "y": "y"}
+    assert list(result)[-1] == {"x": 9, "y": "y"}
+
+    data = [{"x": i} for i in range(10)]
+    assert list(convertManyToQt(ManyCls, data)) == [
+        convertToQt(ManyCls, d) for d in data
+    ]
+
+
+def test_convertMany_executor():
+    data = [{"x": i} for i in range(25)]
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        result = convertManyFromQt(
+            ManyCls, iter(data), False, executor, chunksize=3, maxPending=2
+        )
+        assert list(result) == [convertFromQt(ManyCls, d, False) for d in data]
+        with pytest.raises(ValueError):
+            convertManyToQt(ManyCls, data, executor=executor, chunksize=0)
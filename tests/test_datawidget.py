@@ -2,17 +2,26 @@ from dawiq import (
     DataWidget,
     type2Widget,
     dataclass2Widget,
+    widgetPlanCacheInfo,
+    clearWidgetPlanCache,
+    setWidgetPlanCacheSize,
+    DataWidgetPoolInfo,
+    DataWidgetPool,
+    FieldWriteInfo,
     BoolCheckBox,
     IntLineEdit,
     FloatLineEdit,
     StrLineEdit,
     EnumComboBox,
     TupleGroupBox,
+    SequenceGroupBox,
+    ArrayGroupBox,
+    MappingGroupBox,
 )
 from dawiq.qt_compat import QtCore
 import dataclasses
 from enum import Enum
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import pytest
 
 
@@ -150,6 +159,72 @@ def test_DataWidget_setDataValue(qtbot):
     assert dataWidget.dataValue() == dict(a=None, b=dict(x=False))
 
 
+def test_DataWidget_editedPaths(qtbot):
+    @dataclasses.dataclass
+    class Nested:
+        x: bool
+        y: Tuple[int, int]
+
+    @dataclasses.dataclass
+    class Dcls:
+        a: int
+        b: Nested
+
+    dataWidget = dataclass2Widget(Dcls)
+    assert dataWidget.editedPaths() == set()
+    dataWidget.widget(0).setFieldValue(1)
+    dataWidget.widget(1).widget(0).click()
+    dataWidget.widget(1).widget(1).widget(0).setFieldValue(2)
+    assert dataWidget.editedPaths() == {("a",), ("b", "x"), ("b", "y")}
+    assert dataWidget.widget(1).editedPaths() == {("x",), ("y",)}
+
+    dataWidget.clearEditedPaths()
+    assert dataWidget.editedPaths() == set()
+    dataWidget.widget(1).widget(0).click()
+    dataWidget.setDataValue(dict(a=3))
+    assert dataWidget.editedPaths() == set()
+
+
+def test_DataWidget_beginUpdate(qtbot):
+    @dataclasses.dataclass
+    class Cls1:
+        x: int
+
+    @dataclasses.dataclass
+    class Cls2:
+        a: int
+        b: Cls1
+
+    dataWidget = dataclass2Widget(Cls2)
+    values = []
+    paths = []
+    dataWidget.dataValueChanged.connect(values.append)
+    dataWidget.fieldPathChanged.connect(lambda path, val: paths.append(path))
+
+    dataWidget.beginUpdate()
+    assert dataWidget.isUpdating()
+    assert not dataWidget.updatesEnabled()
+    with dataWidget.updating():
+        dataWidget.widget(0).setText("1")
+        dataWidget.widget(1).widget(0).setText("2")
+    dataWidget.widget(0).setText("3")
+    assert values == []
+    assert paths == []
+    dataWidget.endUpdate()
+    assert not dataWidget.isUpdating()
+    assert dataWidget.updatesEnabled()
+    assert values == [dict(a=3, b=dict(x=2))]
+    assert paths == [()]
+
+    # no signal if nothing changed
+    with dataWidget.updating():
+        pass
+    assert len(values) == 1
+
+    with pytest.raises(RuntimeError):
+        dataWidget.endUpdate()
+
+
 def test_DataWidget_subwidget(qtbot):
     @dataclasses.dataclass
     class Cls1:
@@ -178,6 +253,273 @@ def test_DataWidget_subwidget(qtbot):
     assert dataWidget.dataValue() == dict(a=1, b=dict(x=True))
 
 
+def test_DataWidget_fieldPathChanged(qtbot):
+    @dataclasses.dataclass
+    class Cls1:
+        x: int
+        y: Tuple[int, int]
+
+    @dataclasses.dataclass
+    class Cls2:
+        a: int
+        b: Cls1
+
+    dataWidget = dataclass2Widget(Cls2)
+
+    with qtbot.waitSignal(
+        dataWidget.fieldPathChanged,
+        check_params_cb=lambda path, val: path == ("a",) and val == 1,
+    ):
+        dataWidget.widget(0).setText("1")
+    with qtbot.waitSignal(
+        dataWidget.fieldPathChanged,
+        check_params_cb=lambda path, val: path == ("b", "x") and val == 2,
+    ):
+        dataWidget.widget(1).widget(0).setText("2")
+    with qtbot.waitSignal(
+        dataWidget.fieldPathChanged,
+        check_params_cb=lambda path, val: path == ("b", "y", 1) and val == 3,
+    ):
+        dataWidget.widget(1).widget(1).widget(1).setText("3")
+    assert dataWidget.dataValue() == dict(a=1, b=dict(x=2, y=(None, 3)))
+
+    with qtbot.waitSignal(
+        dataWidget.fieldPathChanged,
+        check_params_cb=lambda path, val: path == ("b",)
+        and val == dict(x=None, y=(None, None)),
+    ):
+        dataWidget.widget(1).setDataValue(None)
+    assert dataWidget.dataValue() == dict(a=1, b=dict(x=None, y=(None, None)))
+
+
+def test_DataWidget_dataValue_cache(qtbot):
+    @dataclasses.dataclass
+    class Cls1:
+        x: int
+
+    @dataclasses.dataclass
+    class Cls2:
+        a: int
+        b: Cls1
+
+    dataWidget = dataclass2Widget(Cls2)
+    emitted = []
+    dataWidget.dataValueChanged.connect(emitted.append)
+
+    dataWidget.widget(0).setText("1")
+    dataWidget.widget(1).widget(0).setText("2")
+    assert emitted == [dict(a=1, b=dict(x=None)), dict(a=1, b=dict(x=2))]
+
+    # returned value is a copy which does not affect the cache
+    value = dataWidget.dataValue()
+    value["b"]["x"] = 10
+    assert dataWidget.dataValue() == dict(a=1, b=dict(x=2))
+
+    w = IntLineEdit()
+    w.setFieldName("c")
+    dataWidget.insertWidget(0, w)
+    assert list(dataWidget.dataValue()) == ["c", "a", "b"]
+    dataWidget.removeWidget(w)
+    assert dataWidget.dataValue() == dict(a=1, b=dict(x=2))
+
+
+def test_DataWidget_setDataValue_diff(qtbot):
+    @dataclasses.dataclass
+    class Cls1:
+        x: int
+        y: Tuple[int, int]
+
+    @dataclasses.dataclass
+    class Cls2:
+        a: int
+        b: str
+        c: Cls1
+
+    dataWidget = dataclass2Widget(Cls2)
+    dataWidget.setDataValue(dict(a=1, b="foo", c=dict(x=2, y=(3, 4))))
+    assert dataWidget.fieldWriteInfo() == FieldWriteInfo(5, 0)
+    assert dataWidget.dataValue() == dict(a=1, b="foo", c=dict(x=2, y=(3, 4)))
+
+    dataWidget.clearFieldWriteInfo()
+    assert dataWidget.fieldWriteInfo() == FieldWriteInfo(0, 0)
+    textChanges = []
+    dataWidget.widget(1).textChanged.connect(textChanges.append)
+    emitted = []
+    dataWidget.dataValueChanged.connect(emitted.append)
+    dataWidget.setDataValue(dict(a=10, b="foo", c=dict(x=2, y=(3, 40))))
+    assert dataWidget.fieldWriteInfo() == FieldWriteInfo(2, 3)
+    assert not textChanges
+    assert emitted == [dict(a=10, b="foo", c=dict(x=2, y=(3, 40)))]
+
+    # value of different type is written
+    dataWidget.clearFieldWriteInfo()
+    dataWidget.setDataValue(dict(a=True, b="foo", c=dict(x=2, y=(3, 40))))
+    assert dataWidget.fieldWriteInfo() == FieldWriteInfo(1, 4)
+    assert dataWidget.dataValue()["a"] == 1
+
+
+def test_DataWidget_setDataValue_identity(qtbot):
+    np = pytest.importorskip("numpy")
+
+    dataWidget = DataWidget()
+    arrayWidget = ArrayGroupBox()
+    arrayWidget.setFieldName("arr")
+    dataWidget.addWidget(arrayWidget)
+    a1, a2 = np.array([1.0]), np.array([1.0])
+    dataWidget.setDataValue(dict(arr=a1))
+
+    # equal array is written to keep the identity
+    dataWidget.setDataValue(dict(arr=a2))
+    assert dataWidget.dataValue()["arr"] is a2
+    assert arrayWidget.fieldValue() is a2
+    assert dataWidget.fieldWriteInfo() == FieldWriteInfo(2, 0)
+
+    # identical array is skipped
+    dataWidget.setDataValue(dict(arr=a2))
+    assert dataWidget.fieldWriteInfo() == FieldWriteInfo(2, 1)
+
+
+def test_DataWidget_setDataValue_partialText(qtbot):
+    @dataclasses.dataclass
+    class Cls:
+        x: int
+        y: float
+
+    dataWidget = dataclass2Widget(Cls)
+    dataWidget.widget(0).setText("-")
+    dataWidget.widget(1).setText("1e")
+    assert dataWidget.dataValue() == dict(x=None, y=None)
+
+    # partial text is cleared by None
+    dataWidget.setDataValue(dict(x=None, y=None))
+    assert dataWidget.widget(0).text() == ""
+    assert dataWidget.widget(1).text() == ""
+    assert dataWidget.fieldWriteInfo() == FieldWriteInfo(2, 0)
+
+
+def test_DataWidget_pendingSequenceChange(qtbot):
+    @dataclasses.dataclass
+    class Cls1:
+        x: List[int]
+
+    @dataclasses.dataclass
+    class Cls2:
+        a: List[int]
+        b: Cls1
+
+    dataWidget = dataclass2Widget(Cls2)
+    dataWidget.setDataValue(dict(a=[1], b=dict(x=[2])))
+    dataWidget.widget(0).model().appendValue(10)
+    dataWidget.widget(1).widget(0).model().appendValue(20)
+    assert dataWidget.widget(0).hasPendingChange()
+
+    # pending changes are in the data value
+    assert dataWidget.dataValue() == dict(a=[1, 10], b=dict(x=[2, 20]))
+    assert not dataWidget.widget(0).hasPendingChange()
+
+    # pending change is not skipped by comparing with the stale cache
+    dataWidget.widget(0).model().appendValue(100)
+    dataWidget.setDataValue(dict(a=[1, 10], b=dict(x=[2, 20])))
+    assert dataWidget.widget(0).fieldValue() == [1, 10]
+
+
+def test_DataWidget_coalesceChanges(qtbot):
+    @dataclasses.dataclass
+    class Cls1:
+        x: int
+        y: int
+
+    @dataclasses.dataclass
+    class Cls2:
+        a: int
+        b: Cls1
+
+    dataWidget = dataclass2Widget(Cls2)
+    subWidget = dataWidget.widget(1)
+    dataWidget.setCoalesceChanges(True)
+    assert subWidget.coalesceChanges()
+
+    emitted, subEmitted, paths = [], [], []
+    dataWidget.dataValueChanged.connect(emitted.append)
+    subWidget.dataValueChanged.connect(subEmitted.append)
+    dataWidget.fieldPathChanged.connect(lambda p, v: paths.append((p, v)))
+
+    # burst of changes in nested field is emitted once
+    assert dataWidget.dataValue() == dict(a=None, b=dict(x=None, y=None))
+    for i in range(10):
+        subWidget.widget(0).setFieldValue(i)
+    assert not emitted
+    assert dataWidget.dataValue() == dict(a=None, b=dict(x=9, y=None))
+    assert dataWidget.hasPendingChange()
+    qtbot.waitUntil(lambda: bool(emitted))
+    assert emitted == [dict(a=None, b=dict(x=9, y=None))]
+    assert subEmitted == [dict(x=9, y=None)]
+    assert paths == [(("b", "x"), 9)]
+    assert not dataWidget.hasPendingChange()
+
+    # multiple fields are emitted with empty path
+    emitted.clear()
+    paths.clear()
+    dataWidget.widget(0).setFieldValue(1)
+    subWidget.widget(1).setFieldValue(2)
+    dataWidget.flushChanges()
+    assert emitted == [dict(a=1, b=dict(x=9, y=2))]
+    assert paths == [((), dict(a=1, b=dict(x=9, y=2)))]
+
+    # disabling emits the pending change
+    emitted.clear()
+    dataWidget.widget(0).setFieldValue(3)
+    dataWidget.setCoalesceChanges(False)
+    assert emitted == [dict(a=3, b=dict(x=9, y=2))]
+    dataWidget.widget(0).setFieldValue(4)
+    assert len(emitted) == 2
+
+
+def test_DataWidget_widgetByName(qtbot):
+    datawidget = DataWidget()
+    w0 = BoolCheckBox()
+    w0.setFieldName("w0")
+    datawidget.addWidget(w0)
+    w1 = IntLineEdit()
+    w1.setFieldName("w1")
+    datawidget.insertWidget(0, w1)
+
+    assert datawidget.widgetByName("w0") is w0
+    assert datawidget.widgetByName("w1") is w1
+    assert datawidget.widgetByName("w2") is None
+
+    datawidget.removeWidget(w0)
+    assert datawidget.widgetByName("w0") is None
+    datawidget.addWidget(w0)
+    assert datawidget.widgetByName("w0") is w0
+
+
+def test_DataWidget_widgetByPath(qtbot):
+    @dataclasses.dataclass
+    class Cls1:
+        x: int
+        y: Tuple[int, Tuple[bool]]
+
+    @dataclasses.dataclass
+    class Cls2:
+        a: int
+        b: Cls1
+
+    dataWidget = dataclass2Widget(Cls2)
+    assert dataWidget.widgetByPath(()) is dataWidget
+    assert dataWidget.widgetByPath(("a",)) is dataWidget.widget(0)
+    assert dataWidget.widgetByPath(("b", "x")) is dataWidget.widget(1).widget(0)
+    tupleWidget = dataWidget.widget(1).widget(1)
+    assert dataWidget.widgetByPath(("b", "y")) is tupleWidget
+    assert dataWidget.widgetByPath(("b", "y", 0)) is tupleWidget.widget(0)
+    assert dataWidget.widgetByPath(("b", "y", 1, 0)) is tupleWidget.widget(1).widget(0)
+
+    assert dataWidget.widgetByPath(("c",)) is None
+    assert dataWidget.widgetByPath(("a", "x")) is None
+    assert dataWidget.widgetByPath(("b", "y", 2)) is None
+    assert dataWidget.widgetByPath(("b", "y", "z")) is None
+
+
 def test_type2Widget(qtbot):
     assert isinstance(type2Widget(bool), BoolCheckBox)
     assert not type2Widget(bool).isTristate()
@@ -201,10 +543,28 @@ def test_type2Widget(qtbot):
 
     with pytest.raises(TypeError):
         type2Widget(Tuple)
-    with pytest.raises(TypeError):
-        type2Widget(Tuple[int, ...])
     assert isinstance(type2Widget(Tuple[int, bool, E]), TupleGroupBox)
 
+    widget = type2Widget(Tuple[int, ...])
+    assert isinstance(widget, SequenceGroupBox)
+    assert widget.sequenceType() is tuple
+    widget = type2Widget(List[E])
+    assert isinstance(widget, SequenceGroupBox)
+    assert widget.sequenceType() is list
+    with pytest.raises(TypeError):
+        type2Widget(List)
+    assert isinstance(type2Widget(Dict[str, int]), MappingGroupBox)
+    with pytest.raises(TypeError):
+        type2Widget(Dict)
+
+
+def test_type2Widget_ndarray(qtbot):
+    np = pytest.importorskip("numpy")
+    import numpy.typing as npt
+
+    assert isinstance(type2Widget(np.ndarray), ArrayGroupBox)
+    assert isinstance(type2Widget(npt.NDArray[np.float64]), ArrayGroupBox)
+
 
 def test_dataclass2Widget(qtbot):
     @dataclasses.dataclass
@@ -233,3 +593,101 @@ def test_dataclass2Widget(qtbot):
     assert dataWidget.widget(3).fieldName() == "d"
     assert isinstance(dataWidget.widget(3).widget(0), IntLineEdit)
     assert dataWidget.widget(3).widget(0).fieldName() == "x"
+
+
+def test_dataclass2Widget_cache(qtbot):
+    @dataclasses.dataclass
+    class Cls1:
+        x: int
+
+    @dataclasses.dataclass
+    class Cls2:
+        a: Tuple[int, Optional[bool]]
+        b: Cls1
+
+    clearWidgetPlanCache()
+    assert widgetPlanCacheInfo().currsize == 0
+
+    w1 = dataclass2Widget(Cls2)
+    info = widgetPlanCacheInfo()
+    assert info.hits == 0
+    assert info.misses == 2
+    assert info.currsize == 2
+
+    w2 = dataclass2Widget(Cls2)
+    assert widgetPlanCacheInfo().hits == 1
+    assert w1 is not w2
+    assert w1.widget(1).widget(0) is not w2.widget(1).widget(0)
+    assert isinstance(w2.widget(0), TupleGroupBox)
+    assert w2.widget(0).widget(1).isTristate()
+    assert w2.dataValue() == dict(a=(None, False), b=dict(x=None))
+
+    # plans depending on the nested dataclass are invalidated as well
+    clearWidgetPlanCache(Cls1)
+    assert widgetPlanCacheInfo().currsize == 0
+    dataclass2Widget(Cls2)
+    assert widgetPlanCacheInfo().misses == 4
+
+    # different arguments are cached separately
+    dataclass2Widget(Cls1, orientation=QtCore.Qt.Orientation.Horizontal)
+    assert widgetPlanCacheInfo().misses == 5
+    assert widgetPlanCacheInfo().currsize == 3
+
+    # plans with custom namespaces are not cached
+    dataclass2Widget(Cls2, localns={})
+    assert widgetPlanCacheInfo() == (1, 5, 128, 3)
+
+    setWidgetPlanCacheSize(1)
+    assert widgetPlanCacheInfo().currsize == 1
+    setWidgetPlanCacheSize(128)
+    clearWidgetPlanCache()
+
+
+def test_DataWidgetPool(qtbot):
+    @dataclasses.dataclass
+    class Dcls1:
+        x: int
+
+    @dataclasses.dataclass
+    class Dcls2:
+        y: bool
+
+    pool = DataWidgetPool(capacity=2)
+    widget1 = pool.acquire(Dcls1)
+    widget1.setDataValue(dict(x=1))
+    assert pool.release(widget1)
+    assert not pool.release(widget1)
+    assert not pool.release(dataclass2Widget(Dcls1))
+    assert widget1.dataValue() == dict(x=None)
+    assert pool.info() == DataWidgetPoolInfo(0, 1, 0, 2, 1)
+
+    assert pool.acquire(Dcls1) is widget1
+    assert pool.acquire(Dcls1) is not widget1
+    horizontal = pool.acquire(Dcls1, orientation=QtCore.Qt.Orientation.Horizontal)
+    assert horizontal.orientation() == QtCore.Qt.Orientation.Horizontal
+    assert pool.info() == DataWidgetPoolInfo(1, 3, 0, 2, 0)
+
+    widget2 = pool.acquire(Dcls2)
+    pool.release(widget1)
+    pool.release(widget2)
+    pool.release(horizontal)
+    assert pool.info().evictions == 1
+    assert pool.acquire(Dcls1) is not widget1
+    assert pool.acquire(Dcls2) is widget2
+
+    pool.release(widget2)
+    pool.clear(Dcls2)
+    assert len(pool) == 1
+    pool.clear()
+    assert pool.info() == DataWidgetPoolInfo(0, 0, 0, 2, 0)
+
+    # widgets built with different arguments are not shared
+    widget = pool.acquire(Dcls1)
+    pool.release(widget)
+    assert pool.acquire(Dcls1, include_extras=True) is not widget
+    assert pool.acquire(Dcls1) is widget
+
+    # widgets with custom namespaces are not pooled
+    widget = pool.acquire(Dcls1, globalns={})
+    assert not pool.release(widget)
+    assert len(pool) == 0
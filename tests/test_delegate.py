@@ -1,5 +1,12 @@
 import dataclasses
-from dawiq import dataclass2Widget, DataclassStackedWidget, DataclassTabWidget
+from dawiq import (
+    DataWidget,
+    DataWidgetPool,
+    dataclass2Widget,
+    DataclassStackedWidget,
+    DataclassTabWidget,
+    DataclassTableModel,
+)
 from dawiq.delegate import (
     convertFromQt,
     convertToQt,
@@ -8,7 +15,7 @@ from dawiq.delegate import (
     DataclassMapper,
 )
 from dawiq.qt_compat import QtGui, QtWidgets, QtCore
-from typing import Tuple
+from typing import Optional, Tuple
 import pytest
 
 
@@ -162,6 +169,33 @@ def test_convertToQt_defaultvalue():
     assert convertToQt(Cls2, dict(d=dict())) == dict(c=None, d=dict(a=None, b=None))
 
 
+def test_convert_compiled():
+    @dataclasses.dataclass
+    class Cls0:
+        x: int = 1
+        y: list = dataclasses.field(default_factory=list)
+
+    @dataclasses.dataclass
+    class Cls1:
+        a: Cls0
+        b: Cls0 = dataclasses.field(default_factory=Cls0)
+
+    # compiled converters are reused for every call
+    for _ in range(2):
+        assert convertFromQt(Cls1, dict(a=dict(x=2))) == dict(a=dict(x=2))
+        assert convertToQt(Cls1, dict(a=dict(x=2))) == dict(a=dict(x=2, y=None), b=None)
+
+    # default values are newly created for each call
+    ret1 = convertFromQt(Cls1, {}, ignoreMissing=False)
+    ret2 = convertFromQt(Cls1, {}, ignoreMissing=False)
+    assert ret1 == ret2 == dict(a=dict(x=1, y=[]), b=dict(x=1, y=[]))
+    assert ret1["a"]["y"] is not ret2["a"]["y"]
+    assert ret1["b"] is not ret2["b"]
+
+    # dataclass instance can be passed instead of the type
+    assert convertToQt(Cls0(), {}, ignoreMissing=0) == dict(x=1, y=[])
+
+
 def test_highlightEmptyField(qtbot):
     @dataclasses.dataclass
     class DataClass1:
@@ -225,6 +259,43 @@ def test_highlightEmptyField_noDataclass(qtbot):
     assert not editor.widget(0).widget(1).property("requiresFieldValue")
 
 
+def test_highlightEmptyField_defaultFactory(qtbot):
+    calls = []
+
+    def factory():
+        calls.append(None)
+        return 1
+
+    @dataclasses.dataclass
+    class DataClass1:
+        x: int
+        y: int = dataclasses.field(default_factory=factory)
+
+    @dataclasses.dataclass
+    class DataClass2:
+        a: DataClass1
+        b: int = 1
+
+    editor = dataclass2Widget(DataClass2)
+    highlightEmptyField(editor, DataClass2)
+    assert editor.widget(0).widget(0).property("requiresFieldValue")
+    assert not editor.widget(0).widget(1).property("requiresFieldValue")
+    assert not editor.widget(1).property("requiresFieldValue")
+    assert not calls
+
+    editor.setDataValue(dict(a=dict(x=1)))
+    highlightEmptyField(editor, DataClass2)
+    assert not editor.widget(0).widget(0).property("requiresFieldValue")
+    assert not calls
+
+    # switching dataclass visits every field again
+    highlightEmptyField(editor, None)
+    editor.setDataValue(None)
+    assert not editor.widget(0).widget(0).property("requiresFieldValue")
+    highlightEmptyField(editor, DataClass2)
+    assert editor.widget(0).widget(0).property("requiresFieldValue")
+
+
 @dataclasses.dataclass
 class DataClass1:
     x: bool
@@ -348,6 +419,39 @@ def test_DataclassDelegate_setModelData_dataclassTabWidget(qtbot, dataclassTabWi
     assert model.data(modelIndex, role=DataclassDelegate.DataRole) == dict(x=True)
 
 
+def test_DataclassDelegate_setModelData_subclass(qtbot):
+    @dataclasses.dataclass
+    class Base:
+        x: int
+
+    @dataclasses.dataclass
+    class Sub(Base):
+        y: int
+
+    delegate = DataclassDelegate()
+    model = QtGui.QStandardItemModel()
+    item = QtGui.QStandardItem()
+    item.setData(Sub, role=DataclassDelegate.TypeRole)
+    item.setData(dict(x=1, y=2), role=DataclassDelegate.DataRole)
+    model.appendRow(item)
+
+    editor = DataclassStackedWidget()
+    editor.addDataWidget(dataclass2Widget(Base), Base)
+    mapper = QtWidgets.QDataWidgetMapper()
+    mapper.setModel(model)
+    mapper.addMapping(editor, 0)
+    mapper.setItemDelegate(delegate)
+    modelIndex = model.index(0, 0)
+    mapper.setCurrentModelIndex(modelIndex)
+    assert editor.currentDataclass() is Base
+
+    # item is edited by the page of base class
+    editor.currentWidget().widget(0).setText("5")
+    mapper.submit()
+    assert model.data(modelIndex, role=DataclassDelegate.TypeRole) is Sub
+    assert model.data(modelIndex, role=DataclassDelegate.DataRole) == dict(x=5, y=2)
+
+
 def test_DataclassDelegate_setEditorData(qtbot):
     @dataclasses.dataclass
     class Dcls:
@@ -634,3 +738,256 @@ def test_DataclassMapper_default(qtbot):
 
     assert model.data(modelIndex, role=DataclassDelegate.DataRole) is None
     assert dataWidget.dataValue() == dict(x=None)
+
+
+def test_DataclassDelegate_paint(qtbot):
+    @dataclasses.dataclass
+    class Dcls:
+        x: int
+        y: bool
+
+    model = QtGui.QStandardItemModel()
+    for data in [dict(x=1, y=True), dict(x=2)]:
+        item = QtGui.QStandardItem()
+        item.setData(Dcls, role=DataclassDelegate.TypeRole)
+        item.setData(data, role=DataclassDelegate.DataRole)
+        model.appendRow(item)
+    model.appendRow(QtGui.QStandardItem("text"))
+
+    delegate = DataclassDelegate()
+    assert delegate.summaryText(model.index(0, 0)) == "Dcls(x=1, y=True)"
+    assert delegate.summaryText(model.index(1, 0)) == "Dcls(x=2)"
+    assert delegate.summaryText(model.index(2, 0)) is None
+
+    view = QtWidgets.QListView()
+    view.setItemDelegate(delegate)
+    view.setModel(model)
+    qtbot.addWidget(view)
+    option = QtWidgets.QStyleOptionViewItem()
+    option.rect = QtCore.QRect(0, 0, 200, 20)
+    assert (
+        delegate.sizeHint(option, model.index(0, 0)).width()
+        > delegate.sizeHint(option, model.index(2, 0)).width()
+    )
+    view.grab()
+
+
+def test_DataclassDelegate_summaryText_table(qtbot):
+    @dataclasses.dataclass
+    class Dcls:
+        x: int
+        y: Optional[int] = None
+        z: Optional[str] = None
+
+    model = DataclassTableModel(Dcls)
+    model.appendRecords([dict(x=1)])
+    delegate = DataclassDelegate()
+    # each field is displayed in its own column
+    for column in range(3):
+        assert delegate.summaryText(model.index(0, column)) is None
+
+    view = QtWidgets.QTableView()
+    view.setItemDelegate(delegate)
+    view.setModel(model)
+    qtbot.addWidget(view)
+    view.grab()
+
+
+def test_DataclassDelegate_createEditor(qtbot):
+    @dataclasses.dataclass
+    class Dcls:
+        x: int
+
+    model = QtGui.QStandardItemModel()
+    item = QtGui.QStandardItem()
+    item.setData(Dcls, role=DataclassDelegate.TypeRole)
+    model.appendRow(item)
+    delegate = DataclassDelegate()
+    view = QtWidgets.QListView()
+    view.setItemDelegate(delegate)
+    view.setModel(model)
+    qtbot.addWidget(view)
+
+    index = model.index(0, 0)
+    view.edit(index)
+    editor = view.indexWidget(index)
+    assert isinstance(editor, DataWidget)
+    editor.widget(0).setText("3")
+    qtbot.keyPress(editor.widget(0), QtCore.Qt.Key.Key_Return)
+    qtbot.waitUntil(
+        lambda: model.data(index, role=DataclassDelegate.DataRole) == dict(x=3)
+    )
+
+
+def test_DataclassDelegate_closeEditor(qtbot):
+    @dataclasses.dataclass
+    class Dcls:
+        x: int
+
+    model = QtGui.QStandardItemModel()
+    item = QtGui.QStandardItem()
+    item.setData(Dcls, role=DataclassDelegate.TypeRole)
+    model.appendRow(item)
+    delegate = DataclassDelegate()
+    view = QtWidgets.QListView()
+    view.setItemDelegate(delegate)
+    view.setModel(model)
+    qtbot.addWidget(view)
+    with qtbot.waitActive(view):
+        view.show()
+        view.activateWindow()
+
+    index = model.index(0, 0)
+    view.openPersistentEditor(index)
+    editor = view.indexWidget(index)
+    editor.widget(0).setFocus()
+    qtbot.waitUntil(editor.widget(0).hasFocus)
+    qtbot.keyClicks(editor.widget(0), "3")
+
+    # only the editor which belongs to the view commits the data
+    committed = []
+    delegate.commitData.connect(
+        lambda e: committed.append(e is view.indexWidget(index))
+    )
+    view.closePersistentEditor(index)
+    assert all(committed)
+
+
+def test_DataclassMapper_submitDelay(qtbot):
+    @dataclasses.dataclass
+    class Dcls:
+        x: int
+        y: bool
+
+    model = QtGui.QStandardItemModel()
+    for _ in range(2):
+        item = QtGui.QStandardItem()
+        item.setData(Dcls, role=DataclassDelegate.TypeRole)
+        model.appendRow(item)
+
+    dataWidget = dataclass2Widget(Dcls)
+    mapper = DataclassMapper()
+    mapper.setModel(model)
+    mapper.addMapping(dataWidget, 0)
+    mapper.setItemDelegate(DataclassDelegate())
+    mapper.setCurrentIndex(0)
+    index = model.index(0, 0)
+
+    writes = []
+    model.dataChanged.connect(lambda *args: writes.append(args))
+
+    # debounce
+    mapper.setSubmitDelay(50)
+    dataWidget.widget(1).click()
+    dataWidget.widget(1).click()
+    dataWidget.widget(1).click()
+    assert mapper.hasPendingSubmit()
+    assert model.data(index, role=DataclassDelegate.DataRole) is None
+    qtbot.waitUntil(lambda: not mapper.hasPendingSubmit())
+    assert model.data(index, role=DataclassDelegate.DataRole) == dict(y=True)
+    assert len(writes) == 1
+
+    # idle
+    mapper.setSubmitDelay(0)
+    dataWidget.widget(1).click()
+    assert model.data(index, role=DataclassDelegate.DataRole) == dict(y=True)
+    qtbot.waitUntil(lambda: not mapper.hasPendingSubmit())
+    assert model.data(index, role=DataclassDelegate.DataRole) == dict(y=False)
+
+    # flush on save and on navigation
+    mapper.setSubmitDelay(10000)
+    dataWidget.widget(1).click()
+    assert mapper.flush()
+    assert model.data(index, role=DataclassDelegate.DataRole) == dict(y=True)
+    dataWidget.widget(1).click()
+    mapper.toNext()
+    assert model.data(index, role=DataclassDelegate.DataRole) == dict(y=False)
+    assert not mapper.hasPendingSubmit()
+
+
+def test_DataclassDelegate_partialUpdate(qtbot):
+    @dataclasses.dataclass
+    class Nested:
+        x: int
+        y: bool
+
+    @dataclasses.dataclass
+    class Dcls:
+        a: int
+        b: Nested
+
+    class Delegate(DataclassDelegate):
+        partialPaths: list = []
+
+        @classmethod
+        def cachePartialModelData(cls, model, index, value, paths):
+            cls.partialPaths.append(paths)
+            super().cachePartialModelData(model, index, value, paths)
+
+    model = QtGui.QStandardItemModel()
+    item = QtGui.QStandardItem()
+    item.setData(Dcls, role=DataclassDelegate.TypeRole)
+    item.setData(dict(a=1, b=dict(x=2, y=True), c=0), role=DataclassDelegate.DataRole)
+    model.appendRow(item)
+    index = model.index(0, 0)
+
+    delegate = Delegate()
+    delegate.setPartialUpdate(True)
+    dataWidget = dataclass2Widget(Dcls)
+    delegate.setEditorData(dataWidget, index)
+
+    delegate.setModelData(dataWidget, model, index)
+    assert Delegate.partialPaths == []
+
+    dataWidget.widget(1).widget(1).click()
+    dataWidget.widget(1).widget(0).clear()
+    delegate.setModelData(dataWidget, model, index)
+    assert Delegate.partialPaths == [{("b", "x"), ("b", "y")}]
+    assert model.data(index, role=DataclassDelegate.DataRole) == dict(
+        a=1, b=dict(y=False), c=0
+    )
+    assert dataWidget.editedPaths() == set()
+
+    delegate.setPartialUpdate(False)
+    dataWidget.widget(0).setFieldValue(5)
+    delegate.setModelData(dataWidget, model, index)
+    assert len(Delegate.partialPaths) == 1
+    assert model.data(index, role=DataclassDelegate.DataRole) == dict(
+        a=5, b=dict(y=False)
+    )
+
+
+def test_DataclassDelegate_editorPool(qtbot):
+    @dataclasses.dataclass
+    class Dcls:
+        x: int
+
+    model = QtGui.QStandardItemModel()
+    for i in range(2):
+        item = QtGui.QStandardItem()
+        item.setData(Dcls, role=DataclassDelegate.TypeRole)
+        item.setData(dict(x=i), role=DataclassDelegate.DataRole)
+        model.appendRow(item)
+    pool = DataWidgetPool()
+    delegate = DataclassDelegate()
+    delegate.setEditorPool(pool)
+    view = QtWidgets.QListView()
+    view.setItemDelegate(delegate)
+    view.setModel(model)
+    qtbot.addWidget(view)
+
+    view.edit(model.index(0, 0))
+    editor = view.indexWidget(model.index(0, 0))
+    assert editor.dataValue() == dict(x=0)
+    view.closePersistentEditor(model.index(0, 0))
+    view.openPersistentEditor(model.index(1, 0))
+    assert view.indexWidget(model.index(1, 0)) is editor
+    assert editor.dataValue() == dict(x=1)
+    assert pool.info().hits == 1
+
+    editor.widget(0).setText("5")
+    qtbot.keyPress(editor.widget(0), QtCore.Qt.Key.Key_Return)
+    qtbot.waitUntil(
+        lambda: model.data(model.index(1, 0), role=DataclassDelegate.DataRole)
+        == dict(x=5)
+    )
@@ -1,14 +1,21 @@
 from dawiq import (
+    RepolishScheduler,
     BoolCheckBox,
     EmptyIntValidator,
     IntLineEdit,
     EmptyFloatValidator,
     FloatLineEdit,
     StrLineEdit,
+    EnumItemModel,
     EnumComboBox,
+    FieldWriteInfo,
     TupleGroupBox,
+    SequenceGroupBox,
+    ArrayGroupBox,
+    MappingGroupBox,
 )
 import enum
+import pytest
 from dawiq.qt_compat import QtCore, QtWidgets
 
 
@@ -151,6 +158,21 @@ def test_IntLineEdit(qtbot):
     assert widget.fieldValue() == 1
 
 
+def test_IntLineEdit_cache(qtbot):
+    widget = IntLineEdit()
+    widget.setFieldValue(True)
+    assert widget.fieldValue() == 1
+    assert type(widget.fieldValue()) is int
+
+    # cache must follow the text even if signals are blocked
+    widget.blockSignals(True)
+    widget.setText("23")
+    widget.blockSignals(False)
+    assert widget.fieldValue() == 23
+    widget.setText("-")
+    assert widget.fieldValue() is None
+
+
 def test_IntLineEdit_setRequired(qtbot):
     widget = IntLineEdit()
 
@@ -235,6 +257,19 @@ def test_FloatLineEdit(qtbot):
     assert widget.fieldValue() == 1.2
 
 
+def test_FloatLineEdit_cache(qtbot):
+    widget = FloatLineEdit()
+    widget.setFieldValue(0.1)
+    assert widget.fieldValue() == 0.1
+
+    widget.blockSignals(True)
+    widget.setText("2.5")
+    widget.blockSignals(False)
+    assert widget.fieldValue() == 2.5
+    widget.clear()
+    assert widget.fieldValue() is None
+
+
 def test_FloatLineEdit_setRequired(qtbot):
     widget = FloatLineEdit()
 
@@ -371,6 +406,44 @@ def test_EnumComboBox(qtbot):
     assert widget.fieldValue() == MyEnum.x
 
 
+def test_EnumItemModel(qtbot):
+    class MyEnum(enum.Enum):
+        apple = 1
+        Apricot = 2
+        banana = 3
+        avocado = 4
+
+    model = EnumItemModel.forEnum(MyEnum)
+    assert EnumItemModel.forEnum(MyEnum) is model
+    assert model.rowCount() == 4
+    assert model.data(model.index(1, 0)) == "Apricot"
+    assert model.data(model.index(1, 0), QtCore.Qt.ItemDataRole.UserRole) is (
+        MyEnum.Apricot
+    )
+    assert model.rowOfMember(MyEnum.banana) == 2
+    assert model.rowsWithPrefix("a") == [0, 1, 3]
+    assert model.rowsWithPrefix("A", caseSensitive=True) == [1]
+    assert model.rowsWithPrefix("c") == []
+
+    flags = QtCore.Qt.MatchFlag.MatchStartsWith | QtCore.Qt.MatchFlag.MatchWrap
+    matched = model.match(
+        model.index(2, 0), QtCore.Qt.ItemDataRole.DisplayRole, "a", -1, flags
+    )
+    assert [i.row() for i in matched] == [3, 0, 1]
+
+    # combo boxes share the model
+    widget1 = EnumComboBox.fromEnum(MyEnum)
+    widget2 = EnumComboBox.fromEnum(MyEnum)
+    assert widget1.model() is widget2.model() is model
+    widget1.setFieldValue(MyEnum.avocado)
+    assert widget1.currentIndex() == 3
+    assert widget2.currentIndex() == -1
+
+    # type-ahead with the prefix index
+    qtbot.keyClicks(widget2, "av")
+    assert widget2.fieldValue() is MyEnum.avocado
+
+
 def test_EnumComboBox_setRequired(qtbot):
     class MyEnum(enum.Enum):
         x = 1
@@ -514,6 +587,40 @@ def test_TupleGroupBox_setFieldValue(qtbot):
     assert counter.i == 1
 
 
+def test_TupleGroupBox_setFieldValue_diff(qtbot):
+    widget = TupleGroupBox()
+    widget.addWidget(IntLineEdit())
+    widget.addWidget(IntLineEdit())
+    widget.setFieldValue((1, 2))
+    assert widget.fieldWriteInfo() == FieldWriteInfo(2, 0)
+
+    widget.setFieldValue((1, 3))
+    assert widget.fieldWriteInfo() == FieldWriteInfo(3, 1)
+    assert widget.fieldValue() == (1, 3)
+
+    widget.clearFieldWriteInfo()
+    assert widget.fieldWriteInfo() == FieldWriteInfo(0, 0)
+
+    # partial text is cleared by None
+    widget.widget(0).setText("-")
+    assert widget.fieldValue() == (None, 3)
+    widget.setFieldValue((None, 3))
+    assert widget.widget(0).text() == ""
+    assert widget.fieldWriteInfo() == FieldWriteInfo(1, 1)
+
+
+def test_TupleGroupBox_setFieldValue_identity(qtbot):
+    np = pytest.importorskip("numpy")
+
+    widget = TupleGroupBox()
+    widget.addWidget(ArrayGroupBox())
+    a1, a2 = np.array(1.0), np.array(1.0)
+    widget.setFieldValue((a1,))
+    widget.setFieldValue((a2,))
+    assert widget.fieldValue()[0] is a2
+    assert widget.fieldWriteInfo() == FieldWriteInfo(2, 0)
+
+
 def test_TupleGroupBox_subwidget(qtbot):
     widget = TupleGroupBox()
     widget.addWidget(IntLineEdit())
@@ -536,6 +643,32 @@ def test_TupleGroupBox_subwidget(qtbot):
     assert widget.fieldValue() == (1, 2)
 
 
+def test_TupleGroupBox_fieldPathChanged(qtbot):
+    widget = TupleGroupBox()
+    widget.addWidget(IntLineEdit())
+    subwidget = TupleGroupBox()
+    subwidget.addWidget(IntLineEdit())
+    widget.addWidget(subwidget)
+
+    with qtbot.waitSignal(
+        widget.fieldPathChanged,
+        check_params_cb=lambda path, val: path == (0,) and val == 1,
+    ):
+        widget.widget(0).setText("1")
+    with qtbot.waitSignal(
+        widget.fieldPathChanged,
+        check_params_cb=lambda path, val: path == (1, 0) and val == 2,
+    ):
+        subwidget.widget(0).setText("2")
+    assert widget.fieldValue() == (1, (2,))
+
+    with qtbot.waitSignal(
+        widget.fieldPathChanged,
+        check_params_cb=lambda path, val: path == () and val == (None, (None,)),
+    ):
+        widget.setFieldValue(None)
+
+
 def test_TupleGroupBox_setRequired(qtbot):
     widget = TupleGroupBox()
     widget.addWidget(IntLineEdit())
@@ -567,3 +700,270 @@ def test_TupleGroupBox_setRequired(qtbot):
     widget.setRequired(False)
     assert not widget.widget(0).property("requiresFieldValue")
     assert not widget.widget(1).property("requiresFieldValue")
+
+
+def test_RepolishScheduler(qtbot):
+    scheduler = RepolishScheduler()
+    widget = IntLineEdit()
+
+    scheduler.setWidgetProperty(widget, "requiresFieldValue", True)
+    assert widget.property("requiresFieldValue")
+    assert scheduler.pendingCount() == 0
+
+    with scheduler.deferring():
+        scheduler.setWidgetProperty(widget, "requiresFieldValue", False)
+        scheduler.setWidgetProperty(widget, "requiresFieldValue", True)
+        assert scheduler.isDeferring()
+        assert scheduler.pendingCount() == 1
+    assert not scheduler.isDeferring()
+    # widget is requested twice, and property returned to original value
+    qtbot.waitUntil(lambda: scheduler.pendingCount() == 0)
+    assert scheduler.savedCount() == 2
+
+    with scheduler.deferring():
+        scheduler.setWidgetProperty(widget, "requiresFieldValue", False)
+    scheduler.flush()
+    assert scheduler.pendingCount() == 0
+    assert not widget.property("requiresFieldValue")
+    assert scheduler.savedCount() == 2
+
+
+def test_RepolishScheduler_setRequired(qtbot):
+    scheduler = RepolishScheduler.instance()
+    widget = TupleGroupBox()
+    widget.addWidget(IntLineEdit())
+    widget.addWidget(FloatLineEdit())
+
+    with scheduler.deferring():
+        widget.setRequired(True)
+        assert widget.widget(0).property("requiresFieldValue")
+        assert widget.widget(1).property("requiresFieldValue")
+        assert scheduler.pendingCount() == 2
+    qtbot.waitUntil(lambda: scheduler.pendingCount() == 0)
+
+
+def test_SequenceGroupBox(qtbot):
+    widget = SequenceGroupBox(IntLineEdit)
+    assert widget.fieldValue() is None
+
+    with qtbot.waitSignal(
+        widget.fieldValueChanged,
+        check_params_cb=lambda val: val == [1, 2, 3],
+    ):
+        widget.setFieldValue([1, 2, 3])
+    assert widget.fieldValue() == [1, 2, 3]
+    assert widget.fieldValue() is widget.fieldValue()
+    assert widget.model().data(widget.model().index(1, 0)) == "2"
+
+    with qtbot.waitSignal(
+        widget.fieldValueChanged,
+        check_params_cb=lambda val: val == [1, 2, 3, 4],
+    ):
+        widget.model().appendValue(4)
+    with qtbot.waitSignal(
+        widget.fieldValueChanged,
+        check_params_cb=lambda val: val == [2, 3, 4],
+    ):
+        widget.model().removeRows(0, 1)
+
+    with qtbot.waitSignal(
+        widget.fieldValueChanged,
+        check_params_cb=lambda val: val is None,
+    ):
+        widget.setFieldValue(None)
+    with pytest.raises(TypeError):
+        widget.setFieldValue(1)
+
+    widget = SequenceGroupBox(IntLineEdit, tuple)
+    widget.setFieldValue([1, 2])
+    assert widget.fieldValue() == (1, 2)
+
+
+def test_SequenceGroupBox_coalesce(qtbot):
+    widget = SequenceGroupBox(IntLineEdit)
+    widget.setFieldValue([0])
+    emitted = []
+    widget.fieldValueChanged.connect(emitted.append)
+
+    # appended items are emitted once
+    for i in range(1, 100):
+        widget.model().appendValue(i)
+    assert not emitted
+    assert widget.hasPendingChange()
+    assert widget.fieldValue() == list(range(100))
+    qtbot.waitUntil(lambda: bool(emitted))
+    assert emitted == [list(range(100))]
+
+    # selected ranges are removed at once
+    removed = []
+    widget.model().rowsRemoved.connect(lambda p, f, last: removed.append((f, last)))
+    selection = QtCore.QItemSelection()
+    for row in (1, 2, 3, 7, 8):
+        index = widget.model().index(row, 0)
+        selection.select(index, index)
+    widget.view().selectionModel().select(
+        selection, QtCore.QItemSelectionModel.SelectionFlag.ClearAndSelect
+    )
+    emitted.clear()
+    with qtbot.waitSignal(widget.fieldEdited):
+        widget._removeButton.click()
+    assert removed == [(7, 8), (1, 3)]
+    assert len(emitted) == 1
+    assert emitted[0][:5] == [0, 4, 5, 6, 9]
+
+
+def test_SequenceGroupBox_edit(qtbot):
+    widget = SequenceGroupBox(IntLineEdit)
+    qtbot.addWidget(widget)
+    widget.setFieldValue(list(range(100000)))
+    assert len(widget.findChildren(IntLineEdit)) == 0
+
+    # only the edited item has the editor
+    view = widget.view()
+    index = widget.model().index(5, 0)
+    view.edit(index)
+    (editor,) = widget.findChildren(IntLineEdit)
+    assert editor.fieldValue() == 5
+    with qtbot.waitSignals(
+        [widget.fieldValueChanged, widget.fieldEdited],
+        check_params_cbs=[lambda val: val[5] == 50, lambda: True],
+    ):
+        editor.setFieldValue(50)
+        editor.editingFinished.emit()
+    assert widget.fieldValue()[5] == 50
+
+    with qtbot.waitSignal(widget.fieldEdited):
+        widget._addButton.click()
+    assert len(widget.fieldValue()) == 100001
+
+    view.selectionModel().select(
+        widget.model().index(0, 0),
+        QtCore.QItemSelectionModel.SelectionFlag.ClearAndSelect,
+    )
+    with qtbot.waitSignal(widget.fieldEdited):
+        widget._removeButton.click()
+    assert widget.fieldValue()[:2] == [1, 2]
+
+
+def test_SequenceGroupBox_setRequired(qtbot):
+    widget = SequenceGroupBox(IntLineEdit)
+    widget.setRequired(True)
+    assert widget.property("requiresFieldValue")
+    widget.setFieldValue([1])
+    widget.setRequired(True)
+    assert not widget.property("requiresFieldValue")
+
+
+def test_ArrayGroupBox(qtbot):
+    np = pytest.importorskip("numpy")
+    widget = ArrayGroupBox()
+    assert widget.fieldValue() is None
+    model = widget.model()
+
+    arr = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    with qtbot.waitSignal(
+        widget.fieldValueChanged,
+        check_params_cb=lambda val: val is arr,
+    ):
+        widget.setFieldValue(arr)
+    assert (model.rowCount(), model.columnCount()) == (2, 3)
+    assert model.data(model.index(1, 2)) == "6.0"
+
+    # edit in-place
+    with qtbot.waitSignal(
+        widget.fieldValueChanged,
+        check_params_cb=lambda val: val is arr,
+    ):
+        assert model.setData(model.index(0, 1), "2.5")
+    assert arr[0, 1] == 2.5
+    assert not model.setData(model.index(0, 1), "x")
+
+    vec = np.array([True, False])
+    widget.setFieldValue(vec)
+    assert (model.rowCount(), model.columnCount()) == (2, 1)
+    assert model.setData(model.index(0, 0), "false")
+    assert not vec[0]
+
+    vec.flags.writeable = False
+    widget.setFieldValue(vec)
+    assert not model.flags(model.index(0, 0)) & QtCore.Qt.ItemFlag.ItemIsEditable
+
+    with pytest.raises(TypeError):
+        widget.setFieldValue([1, 2])
+    with pytest.raises(ValueError):
+        widget.setFieldValue(np.zeros((1, 1, 1)))
+
+
+def test_MappingGroupBox(qtbot):
+    widget = MappingGroupBox(StrLineEdit, IntLineEdit)
+    model = widget.model()
+    assert widget.fieldValue() is None
+
+    with qtbot.waitSignal(
+        widget.fieldValueChanged,
+        check_params_cb=lambda val: val == dict(a=1, b=2, c=3, d=4),
+    ):
+        widget.setFieldValue(dict(a=1, b=2, c=3, d=4))
+    assert model.rowOfKey("c") == 2
+    assert widget.fieldValue() is widget.fieldValue()
+
+    # only the changed rows are updated
+    changed, removed, inserted = [], [], []
+    model.dataChanged.connect(lambda i1, i2: changed.append((i1.row(), i2.row())))
+    model.rowsRemoved.connect(lambda p, first, last: removed.append((first, last)))
+    model.rowsInserted.connect(lambda p, first, last: inserted.append((first, last)))
+    model.modelReset.connect(lambda: pytest.fail("model reset"))
+    with qtbot.waitSignal(
+        widget.fieldValueChanged,
+        check_params_cb=lambda val: val == dict(a=1, c=30, e=5),
+    ):
+        widget.setFieldValue(dict(a=1, c=30, e=5))
+    assert removed == [(3, 3), (1, 1)]
+    assert changed == [(1, 1)]
+    assert inserted == [(2, 2)]
+    assert model.rowOfKey("e") == 2
+
+    # cache is updated by the edited value
+    old = widget.fieldValue()
+    with qtbot.waitSignal(
+        widget.fieldValueChanged,
+        check_params_cb=lambda val: val == dict(a=10, c=30, e=5),
+    ):
+        model.setData(model.index(0, 1), 10)
+    assert old == dict(a=1, c=30, e=5)
+
+    # key cannot be duplicate
+    assert not model.setData(model.index(0, 0), "c")
+    assert model.setData(model.index(0, 0), "z")
+    assert widget.fieldValue() == dict(z=10, c=30, e=5)
+
+    # incomplete item is not in the field value
+    with qtbot.waitSignal(widget.fieldEdited):
+        widget._addButton.click()
+    assert model.rowCount() == 4
+    assert widget.fieldValue() == dict(z=10, c=30, e=5)
+
+    with pytest.raises(TypeError):
+        widget.setFieldValue([1])
+
+
+def test_MappingGroupBox_removeRows(qtbot):
+    widget = MappingGroupBox(StrLineEdit, IntLineEdit)
+    model = widget.model()
+    widget.setFieldValue({str(i): i for i in range(10)})
+    emitted, removed = [], []
+    widget.fieldValueChanged.connect(emitted.append)
+    model.rowsRemoved.connect(lambda p, first, last: removed.append((first, last)))
+
+    # selected ranges are removed at once
+    selection = QtCore.QItemSelection()
+    for row in (1, 2, 3, 7, 8):
+        selection.select(model.index(row, 0), model.index(row, 1))
+    widget.view().selectionModel().select(
+        selection, QtCore.QItemSelectionModel.SelectionFlag.ClearAndSelect
+    )
+    with qtbot.waitSignal(widget.fieldEdited):
+        widget._removeButton.click()
+    assert removed == [(7, 8), (1, 3)]
+    assert emitted == [{str(i): i for i in (0, 4, 5, 6, 9)}]
+    assert model.rowOfKey("9") == 4
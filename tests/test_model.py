@@ -0,0 +1,79 @@
+from dawiq import (
+    DataclassTableModel,
+    DataclassDelegate,
+    DataclassMapper,
+    dataclass2Widget,
+)
+from dawiq.qt_compat import QtCore
+import dataclasses
+from typing import Optional
+
+
+@dataclasses.dataclass
+class DataClass:
+    a: int
+    b: Optional[float] = None
+    c: bool = False
+    d: str = "d"
+
+
+def test_DataclassTableModel(qtbot):
+    model = DataclassTableModel(DataClass)
+    assert model.columnCount() == 4
+    assert model.headerData(2, QtCore.Qt.Orientation.Horizontal) == "c"
+    assert model.columnOfField("d") == 3
+
+    model.appendRecords([dict(a=1, b=None, c=True), dict(d="x", e=0)])
+    assert model.rowCount() == 2
+    assert model.record(0) == dict(a=1, b=None, c=True)
+    assert model.record(1) == dict(d="x")
+
+    index = model.index(0, 2)
+    assert model.data(index, DataclassTableModel.TypeRole) is DataClass
+    assert model.data(index, DataclassTableModel.DataRole) == dict(a=1, b=None, c=True)
+    assert model.data(index) is True
+    assert model.data(model.index(1, 0)) is None
+
+    assert model.setData(model.index(1, 0), 3)
+    assert model.record(1) == dict(a=3, d="x")
+    assert model.setData(index, dict(b=2.0), DataclassTableModel.DataRole)
+    assert model.record(0) == dict(b=2.0)
+    assert not model.setData(index, int, DataclassTableModel.TypeRole)
+
+
+def test_DataclassTableModel_rows(qtbot):
+    model = DataclassTableModel(DataClass)
+    model.appendRecords([dict(a=i) for i in range(5)])
+    assert model.insertRows(1, 2)
+    assert [model.record(i) for i in range(4)] == [dict(a=0), {}, {}, dict(a=1)]
+    assert model.removeRows(0, 3)
+    assert model.rowCount() == 4
+    assert model.record(0) == dict(a=1)
+    assert not model.removeRows(3, 2)
+    assert not model.insertRows(0, 0)
+
+
+def test_DataclassTableModel_typedColumn(qtbot):
+    model = DataclassTableModel(DataClass)
+    model.appendRecords([dict(a=1, b=1.5), dict(a=2)])
+    assert model.setData(model.index(1, 0), 2**70)
+    assert model.setData(model.index(1, 1), "x")
+    assert model.record(0) == dict(a=1, b=1.5)
+    assert model.record(1) == dict(a=2**70, b="x")
+
+
+def test_DataclassTableModel_mapper(qtbot):
+    model = DataclassTableModel(DataClass)
+    model.appendRecords([dict(a=1), dict(a=2, c=True)])
+    widget = dataclass2Widget(DataClass)
+    mapper = DataclassMapper()
+    mapper.setItemDelegate(DataclassDelegate())
+    mapper.setModel(model)
+    mapper.addMapping(widget, 0)
+
+    mapper.setCurrentIndex(1)
+    assert widget.dataValue() == dict(a=2, b=None, c=True, d="")
+    widget.widget(2).click()
+    assert model.record(1) == dict(a=2, c=False, d="")
+    mapper.setCurrentIndex(0)
+    assert widget.dataValue() == dict(a=1, b=None, c=False, d="")
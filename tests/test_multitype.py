@@ -1,4 +1,9 @@
-from dawiq import DataclassStackedWidget, DataclassTabWidget, dataclass2Widget
+from dawiq import (
+    DataWidget,
+    DataclassStackedWidget,
+    DataclassTabWidget,
+    dataclass2Widget,
+)
 from dawiq.qt_compat import QtWidgets
 import dataclasses
 import pytest
@@ -23,6 +28,11 @@ class DataClass3:
     x: bool
 
 
+@dataclasses.dataclass
+class SubDataClass2(DataClass2):
+    f: bool
+
+
 @pytest.fixture
 def dataclassStackedWidget(qtbot):
     widget = DataclassStackedWidget()
@@ -47,6 +57,24 @@ def test_DataclassStackedWidget_indexOfDataclass(qtbot, dataclassStackedWidget):
     assert dataclassStackedWidget.indexOfDataclass(DataClass3) == -1
 
 
+def test_DataclassStackedWidget_indexOfDataclass_subclass(
+    qtbot, dataclassStackedWidget
+):
+    assert dataclassStackedWidget.indexOfDataclass(SubDataClass2) == 1
+    dataclassStackedWidget.addDataWidget(dataclass2Widget(SubDataClass2), SubDataClass2)
+    assert dataclassStackedWidget.indexOfDataclass(SubDataClass2) == 3
+    assert dataclassStackedWidget.indexOfDataclass(DataClass2) == 1
+
+    dataclassStackedWidget.insertDataWidget(0, dataclass2Widget(DataClass2), DataClass2)
+    assert dataclassStackedWidget.indexOfDataclass(DataClass2) == 2
+    dataclassStackedWidget.removeWidget(dataclassStackedWidget.widget(2))
+    assert dataclassStackedWidget.indexOfDataclass(DataClass2) == 0
+    dataclassStackedWidget.removeWidget(dataclassStackedWidget.widget(3))
+    assert dataclassStackedWidget.indexOfDataclass(SubDataClass2) == 0
+    dataclassStackedWidget.removeWidget(dataclassStackedWidget.widget(0))
+    assert dataclassStackedWidget.indexOfDataclass(SubDataClass2) == -1
+
+
 def test_DataclassStackedWidget_currentDataValueChanged(qtbot, dataclassStackedWidget):
     dataclassStackedWidget.setCurrentIndex(0)
     with qtbot.assertNotEmitted(dataclassStackedWidget.currentDataValueChanged):
@@ -155,6 +183,44 @@ def test_DataclassStackedWidget_removeWidget(qtbot, dataclassStackedWidget):
     assert dataclassStackedWidget.currentIndex() == -1
 
 
+def test_DataclassStackedWidget_addDataclass(qtbot):
+    built = []
+
+    def factory(dcls):
+        built.append(dcls)
+        return dataclass2Widget(dcls)
+
+    widget = DataclassStackedWidget()
+    assert widget.addDataclass(DataClass1, factory) == 0
+    assert widget.addDataclass(DataClass2, factory) == 1
+    assert widget.insertDataclass(1, DataClass3, factory) == 1
+    assert built == [DataClass1]
+    assert widget.indexOfDataclass(DataClass2) == 2
+    assert not widget.isDataWidgetLoaded(2)
+
+    widget.setCurrentIndex(2)
+    assert built == [DataClass1, DataClass2]
+    assert widget.currentDataclass() == DataClass2
+    assert widget.currentIndex() == 2
+    with qtbot.waitSignal(widget.currentDataValueChanged):
+        widget.currentWidget().widget(0).click()
+
+    widget.setMaximumLoadedCount(1)
+    assert not widget.isDataWidgetLoaded(0)
+    assert widget.isDataWidgetLoaded(2)
+    assert widget.indexOfDataclass(DataClass1) == 0
+
+    widget.setCurrentIndex(1)
+    assert widget.isDataWidgetLoaded(1)
+    assert not widget.isDataWidgetLoaded(2)
+    assert widget.currentDataclass() == DataClass3
+    with qtbot.waitSignal(widget.currentDataValueChanged):
+        widget.currentWidget().widget(0).click()
+
+    widget.removeWidget(widget.widget(2))
+    assert widget.indexOfDataclass(DataClass2) == -1
+
+
 @pytest.fixture
 def dataclassTabWidget(qtbot):
     widget = DataclassTabWidget()
@@ -180,6 +246,18 @@ def test_DataclassTabWidget_indexOfDataclass(qtbot, dataclassTabWidget):
     assert dataclassTabWidget.indexOfDataclass(DataClass2) == 1
     assert dataclassTabWidget.indexOfDataclass(DataClass3) == -1
 
+    # cached index follows the moved tab
+    dataclassTabWidget.tabBar().moveTab(2, 1)
+    assert dataclassTabWidget.indexOfDataclass(DataClass1) == 1
+    assert dataclassTabWidget.indexOfDataclass(DataClass2) == 2
+
+
+def test_DataclassTabWidget_indexOfDataclass_subclass(qtbot, dataclassTabWidget):
+    assert dataclassTabWidget.indexOfDataclass(SubDataClass2) == 1
+    dataclassTabWidget.removeTab(1)
+    assert dataclassTabWidget.indexOfDataclass(SubDataClass2) == -1
+    assert dataclassTabWidget.indexOfDataclass(DataClass1) == 1
+
 
 def test_DataclassTabWidget_currentDataValueChanged(qtbot, dataclassTabWidget):
     dataclassTabWidget.setCurrentIndex(0)
@@ -285,3 +363,30 @@ def test_DataclassTabWidget_removeTab(qtbot, dataclassTabWidget):
     oldTab = dataclassTabWidget.currentWidget()
     dataclassTabWidget.removeTab(dataclassTabWidget.indexOf(oldTab))
     assert dataclassTabWidget.currentIndex() == -1
+
+
+def test_DataclassTabWidget_addDataclass(qtbot):
+    widget = DataclassTabWidget()
+    widget.addDataclass(DataClass1)
+    widget.addDataclass(DataClass2, label="Tab2")
+    widget.setTabToolTip(1, "tooltip")
+    assert widget.isDataWidgetLoaded(0)
+    assert not widget.isDataWidgetLoaded(1)
+    assert widget.tabText(0) == "DataClass1"
+
+    with qtbot.assertNotEmitted(widget.activated):
+        widget.setCurrentIndex(1)
+    assert isinstance(widget.currentWidget(), DataWidget)
+    assert widget.currentDataclass() == DataClass2
+    assert widget.tabText(1) == "Tab2"
+    assert widget.tabToolTip(1) == "tooltip"
+    with qtbot.waitSignal(widget.currentDataValueChanged):
+        widget.currentWidget().widget(0).click()
+
+    widget.setMaximumLoadedCount(1)
+    assert not widget.isDataWidgetLoaded(0)
+    with qtbot.waitSignal(widget.activated):
+        widget.tabBar().setCurrentIndex(0)
+    assert isinstance(widget.currentWidget(), DataWidget)
+    assert not widget.isDataWidgetLoaded(1)
+    assert widget.tabText(1) == "Tab2"
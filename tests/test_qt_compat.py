@@ -1,4 +1,6 @@
-from dawiq.qt_compat import QtCore, QtWidgets
+from dawiq import qt_compat
+from dawiq.qt_compat import QtAPI, QtAPIError, qt_api, QtCore, QtWidgets
+import pytest
 
 
 def test_import_QtCore():
@@ -9,3 +11,27 @@ def test_import_QtCore():
 
 def test_import_QtWidgets():
     assert hasattr(QtWidgets, "QWidget")
+
+
+def test_QtAPI_lazy():
+    api = QtAPI()
+    assert "QtCore" not in vars(api)
+    assert api.qt_binding == qt_api.qt_binding
+    assert api.QtCore is QtCore
+    assert "QtCore" in vars(api)
+    with pytest.raises(AttributeError):
+        api.NotQtModule
+
+
+def test_QtAPI_unsupported():
+    with pytest.raises(QtAPIError):
+        QtAPI("NotSupportedAPI")
+
+
+def test_QtAPI_not_installed(monkeypatch):
+    monkeypatch.setattr(qt_compat, "_QT_APIS", {"noqt": "NoSuchQt"})
+    monkeypatch.setattr(qt_compat, "_detected_bindings", {})
+    with pytest.raises(QtAPIError, match="NoSuchQt: No module named 'NoSuchQt"):
+        QtAPI(None).qt_binding
+    with pytest.raises(QtAPIError, match="No module named 'NoSuchQt"):
+        QtAPI("NoQt").qt_binding